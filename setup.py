@@ -74,7 +74,7 @@ setup(name=umbra.globals.constants.Constants.application_name,
       author_email=umbra.globals.constants.__email__,
       include_package_data=True,
       packages=find_packages(),
-      scripts=["bin/Umbra"],
+      scripts=["bin/Umbra", "bin/Umbra_Batch"],
       url="https://github.com/KelSolaar/Umbra",
       license="GPLv3",
       description="Umbra is the main package of sIBL_GUI and sIBL_Reporter.",
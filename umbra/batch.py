@@ -0,0 +1,371 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**batch.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Runs the **Umbra** package search and replace in files workers without the Application user interface.
+
+**Others:**
+    Search and replace results are written as JSON lines, one record per file followed by a summary record.
+"""
+
+from __future__ import unicode_literals
+
+import functools
+import json
+import logging
+import multiprocessing
+import optparse
+import os
+import sys
+
+
+def _set_package_directory():
+    """
+    Sets the Application package directory in the path.
+    """
+
+    package_directory = os.path.normpath(os.path.join(os.path.dirname(__file__), "../"))
+    package_directory not in sys.path and sys.path.append(package_directory)
+
+
+_set_package_directory()
+
+from PyQt4.QtCore import QCoreApplication
+from PyQt4.QtCore import QObject
+
+import foundations.exceptions
+import foundations.verbose
+import umbra.ui.common
+from umbra.components.factory.script_editor.caches import FilesCache
+from umbra.components.factory.script_editor.workers import Replace_worker
+from umbra.components.factory.script_editor.workers import Search_worker
+from umbra.globals.constants import Constants
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER",
+           "Batch_container",
+           "get_command_line_parameters_parser",
+           "write_record",
+           "main"]
+
+LOGGER = foundations.verbose.install_logger()
+
+
+class Batch_container(QObject):
+    """
+    Defines the container providing the search and replace workers
+    with the services the **script_editor** Component provides them in the Application.
+    """
+
+    def __init__(self, parent=None):
+        """
+        Initializes the class.
+
+        :param parent: Object parent.
+        :type parent: QObject
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        QObject.__init__(self, parent)
+
+        # --- Setting class attributes. ---
+        self.__files_cache = FilesCache()
+        self.__default_target = None
+
+    @property
+    def files_cache(self):
+        """
+        Property for **self.__files_cache** attribute.
+
+        :return: self.__files_cache.
+        :rtype: FilesCache
+        """
+
+        return self.__files_cache
+
+    @files_cache.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def files_cache(self, value):
+        """
+        Setter for **self.__files_cache** attribute.
+
+        :param value: Attribute value.
+        :type value: FilesCache
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "files_cache"))
+
+    @files_cache.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def files_cache(self):
+        """
+        Deleter for **self.__files_cache** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "files_cache"))
+
+    @property
+    def default_target(self):
+        """
+        Property for **self.__default_target** attribute.
+
+        :return: self.__default_target.
+        :rtype: unicode
+        """
+
+        return self.__default_target
+
+    @default_target.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def default_target(self, value):
+        """
+        Setter for **self.__default_target** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "default_target"))
+
+    @default_target.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def default_target(self):
+        """
+        Deleter for **self.__default_target** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "default_target"))
+
+    def get_search_index(self, directory):
+        """
+        Returns the search index of given directory, no search indexes are built without the Application.
+
+        :param directory: Directory.
+        :type directory: unicode
+        :return: Search index.
+        :rtype: None
+        """
+
+        return None
+
+
+def get_command_line_parameters_parser():
+    """
+    Returns the command line parameters parser.
+
+    :return: Parser.
+    :rtype: Parser
+    """
+
+    parser = optparse.OptionParser(formatter=optparse.IndentedHelpFormatter(indent_increment=2,
+                                                                            max_help_position=8,
+                                                                            width=128,
+                                                                            short_first=1),
+                                   add_help_option=None)
+
+    parser.add_option("-h",
+                      "--help",
+                      action="help",
+                      help="'Display this help message and exit.'")
+    parser.add_option("-v",
+                      "--verbose",
+                      action="store",
+                      type="int",
+                      default=2,
+                      dest="verbosity_level",
+                      help="'Verbosity levels: 0 = Critical | 1 = Error | 2 = Warning | 3 = Info | 4 = Debug.'")
+    parser.add_option("-l",
+                      "--location",
+                      action="store",
+                      type="string",
+                      dest="location",
+                      help="'Location to search into: directories, files and filters, comma separated.'")
+    parser.add_option("-p",
+                      "--pattern",
+                      action="store",
+                      type="string",
+                      dest="pattern",
+                      help="'Pattern to search for.'")
+    parser.add_option("-r",
+                      "--replacement",
+                      action="store",
+                      type="string",
+                      dest="replacement",
+                      help="'Replacement pattern, the matched occurrences are replaced when given.'")
+    parser.add_option("-c",
+                      "--case_sensitive",
+                      action="store_true",
+                      default=False,
+                      dest="case_sensitive",
+                      help="'Case sensitive search.'")
+    parser.add_option("-w",
+                      "--whole_word",
+                      action="store_true",
+                      default=False,
+                      dest="whole_word",
+                      help="'Whole word search.'")
+    parser.add_option("-e",
+                      "--regular_expressions",
+                      action="store_true",
+                      default=False,
+                      dest="regular_expressions",
+                      help="'Regular expressions search.'")
+    parser.add_option("-j",
+                      "--processes",
+                      action="store",
+                      type="int",
+                      default=multiprocessing.cpu_count(),
+                      dest="processes",
+                      help="'Search processes count.'")
+    parser.add_option("-o",
+                      "--output",
+                      action="store",
+                      type="string",
+                      dest="output",
+                      help="'Output JSON lines file, the standard output is used by default.'")
+
+    return parser
+
+
+def write_record(stream, record):
+    """
+    Writes given record to given stream as a JSON line.
+
+    :param stream: Stream.
+    :type stream: file
+    :param record: Record.
+    :type record: dict
+    """
+
+    stream.write("{0}\n".format(json.dumps(record, sort_keys=True)))
+
+
+def _write_search_results(stream, search_results):
+    """
+    Writes given search results batch to given stream.
+
+    :param stream: Stream.
+    :type stream: file
+    :param search_results: Search results batch.
+    :type search_results: list
+    """
+
+    for search_result in search_results:
+        write_record(stream, {"type": "search_result",
+                              "file": search_result.file,
+                              "pattern": search_result.pattern,
+                              "skipped": search_result.get("skipped"),
+                              "occurrences": [{"line": occurence.line,
+                                               "column": occurence.column,
+                                               "length": occurence.length,
+                                               "position": occurence.position,
+                                               "text": occurence.text}
+                                              for occurence in search_result.occurrences]})
+    stream.flush()
+
+
+def _write_replace_result(stream, file, count):
+    """
+    Writes given file replace result to given stream.
+
+    :param stream: Stream.
+    :type stream: file
+    :param file: File.
+    :type file: unicode
+    :param count: Replaced occurrences count.
+    :type count: int
+    """
+
+    write_record(stream, {"type": "replace_result", "file": file, "replaced": count})
+    stream.flush()
+
+
+def main():
+    """
+    Starts the search and replace in files.
+
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    parser = get_command_line_parameters_parser()
+    parameters, arguments = parser.parse_args(
+        [unicode(argument, Constants.default_codec, Constants.codec_error) for argument in sys.argv])
+    if not parameters.location or not parameters.pattern:
+        parser.error("'location' and 'pattern' parameters are required!")
+
+    logging_handler = logging.StreamHandler(sys.stderr)
+    logging_handler.setFormatter(foundations.verbose.LOGGING_DEFAULT_FORMATTER)
+    LOGGER.addHandler(logging_handler)
+    foundations.verbose.set_verbosity_level(parameters.verbosity_level)
+
+    application = QCoreApplication.instance() or QCoreApplication(sys.argv)
+
+    stream = open(parameters.output, "w") if parameters.output else sys.stdout
+    try:
+        container = Batch_container()
+        settings = {"case_sensitive": parameters.case_sensitive,
+                    "whole_word": parameters.whole_word,
+                    "regular_expressions": parameters.regular_expressions}
+
+        search_worker = Search_worker(container,
+                                      parameters.pattern,
+                                      umbra.ui.common.parse_location(parameters.location),
+                                      settings,
+                                      max(1, parameters.processes))
+        search_worker.resultsAvailable.connect(functools.partial(_write_search_results, stream))
+        search_results = []
+        search_worker.searchFinished.connect(search_results.extend)
+        # The worker is run synchronously, there is no event loop to deliver its signals to.
+        search_worker.run()
+
+        summary = {"type": "summary",
+                   "files": len(search_results),
+                   "occurrences": sum(len(search_result.occurrences) for search_result in search_results)}
+
+        if parameters.replacement is not None:
+            files = dict((search_result.file, [(occurence.position, occurence.length)
+                                               for occurence in search_result.occurrences])
+                         for search_result in search_results
+                         if search_result.occurrences and not search_result.get("skipped"))
+
+            replace_worker = Replace_worker(container,
+                                            files,
+                                            parameters.pattern,
+                                            settings,
+                                            parameters.replacement)
+            replace_worker.fileReplaced.connect(functools.partial(_write_replace_result, stream))
+            replace_results = {}
+            replace_worker.replaceFinished.connect(replace_results.update)
+            replace_worker.run()
+
+            summary.update({"replaced_files": len(replace_results),
+                            "replaced_occurrences": sum(replace_results.itervalues())})
+
+        write_record(stream, summary)
+    finally:
+        stream is not sys.stdout and stream.close()
+
+    LOGGER.removeHandler(logging_handler)
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
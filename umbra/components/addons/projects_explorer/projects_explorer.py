@@ -477,6 +477,7 @@ class ProjectsExplorer(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
 
         # Signals / Slots.
         self.__view.expanded.connect(self.__view__expanded)
+        self.__view.collapsed.connect(self.__view__collapsed)
         self.__view.doubleClicked.connect(self.__view__doubleClicked)
         self.__view.selectionModel().selectionChanged.connect(self.__view_selectionModel__selectionChanged)
         self.__script_editor.Script_Editor_tabWidget.currentChanged.connect(
@@ -500,6 +501,7 @@ class ProjectsExplorer(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
 
         # Signals / Slots.
         self.__view.expanded.disconnect(self.__view__expanded)
+        self.__view.collapsed.disconnect(self.__view__collapsed)
         self.__view.doubleClicked.disconnect(self.__view__doubleClicked)
         self.__view.selectionModel().selectionChanged.disconnect(self.__view_selectionModel__selectionChanged)
         self.__script_editor.Script_Editor_tabWidget.currentChanged.disconnect(
@@ -669,10 +671,50 @@ class ProjectsExplorer(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
         """
 
         node = self.__model.get_node(index)
-        if node.family != "Directory":
+        if node.family == "Directory":
+            self.__script_editor.model.set_project_nodes(node)
+
+        self.__set_node_path_priority(node, "normal")
+
+    def __view__collapsed(self, index):
+        """
+        Defines the slot triggered by a View when an item is collapsed.
+
+        :param index: Collapsed item.
+        :type index: QModelIndex
+        """
+
+        self.__set_node_path_priority(self.__model.get_node(index), "low")
+
+    def __set_node_path_priority(self, node, priority):
+        """
+        Sets given directory or project Node and its files children paths priority in the
+        **file_system_events_manager**, files loaded in editors keep their priority.
+
+        :param node: Node.
+        :type node: DirectoryNode or ProjectNode
+        :param priority: Path priority.
+        :type priority: unicode
+        """
+
+        if not node.family in ("Directory", "Project"):
             return
 
-        self.__script_editor.model.set_project_nodes(node)
+        file_system_events_manager = self.__engine.file_system_events_manager
+        path = foundations.strings.to_string(node.path)
+        file_system_events_manager.is_path_registered(path) and \
+        file_system_events_manager.set_path_priority(path, priority)
+
+        for child in node.children:
+            if child.family != "File":
+                continue
+
+            path = foundations.strings.to_string(child.path)
+            if not file_system_events_manager.is_path_registered(path) or \
+                    file_system_events_manager.get_path_priority(path) == "high":
+                continue
+
+            file_system_events_manager.set_path_priority(path, priority)
 
     def __view__doubleClicked(self, index):
         """
@@ -941,9 +983,12 @@ class ProjectsExplorer(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
 
         parent_directory = os.path.dirname(source)
         is_path_registered = self.__engine.file_system_events_manager.is_path_registered(parent_directory)
+        priority = is_path_registered and \
+                   self.__engine.file_system_events_manager.get_path_priority(parent_directory)
         is_path_registered and self.__engine.file_system_events_manager.unregister_path(parent_directory)
         os.rename(source, target)
-        is_path_registered and self.__engine.file_system_events_manager.register_path(parent_directory)
+        is_path_registered and self.__engine.file_system_events_manager.register_path(parent_directory,
+                                                                                      priority=priority)
 
     def __delete_path(self, path):
         """
@@ -958,9 +1003,12 @@ class ProjectsExplorer(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
 
         parent_directory = os.path.dirname(path)
         is_path_registered = self.__engine.file_system_events_manager.is_path_registered(parent_directory)
+        priority = is_path_registered and \
+                   self.__engine.file_system_events_manager.get_path_priority(parent_directory)
         is_path_registered and self.__engine.file_system_events_manager.unregister_path(parent_directory)
         foundations.io.remove(path)
-        is_path_registered and self.__engine.file_system_events_manager.register_path(parent_directory)
+        is_path_registered and self.__engine.file_system_events_manager.register_path(parent_directory,
+                                                                                      priority=priority)
 
     def __rename_file(self, source, target):
         """
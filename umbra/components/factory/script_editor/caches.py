@@ -0,0 +1,727 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**caches.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines the :class:`umbra.components.factory.script_editor.search_in_files.SearchInFiles` class
+    files and search results caches.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import itertools
+import sys
+if sys.version_info[:2] <= (2, 6):
+    from ordereddict import OrderedDict
+else:
+    from collections import OrderedDict
+import threading
+
+import foundations.cache
+import foundations.data_structures
+import foundations.exceptions
+import foundations.strings
+import foundations.verbose
+from umbra.components.factory.script_editor.matchers import get_file_signature
+from umbra.components.factory.script_editor.walkers import Filters
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "FilesCache", "SearchResultsCache"]
+
+LOGGER = foundations.verbose.install_logger()
+
+
+class FilesCache(foundations.cache.Cache):
+    """
+    Defines a least recently used files cache bounded by a bytes budget.
+    """
+
+    def __init__(self, maximum_size=256 * 1024 * 1024, **kwargs):
+        """
+        Initializes the class.
+
+        :param maximum_size: Cache bytes budget.
+        :type maximum_size: int
+        :param \*\*kwargs: Key / Value pairs.
+        :type \*\*kwargs: dict
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        foundations.cache.Cache.__init__(self)
+
+        # --- Setting class attributes. ---
+        self.__maximum_size = None
+        self.maximum_size = maximum_size
+        self.__size = 0
+        self.__sizes = OrderedDict()
+
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+        self.__lock = threading.RLock()
+
+        self.add_content(**kwargs)
+
+    @property
+    def maximum_size(self):
+        """
+        Property for **self.__maximum_size** attribute.
+
+        :return: self.__maximum_size.
+        :rtype: int
+        """
+
+        return self.__maximum_size
+
+    @maximum_size.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def maximum_size(self, value):
+        """
+        Setter for **self.__maximum_size** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        if value is not None:
+            assert type(value) is int, "'{0}' attribute: '{1}' type is not 'int'!".format("maximum_size", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format(
+                "maximum_size", value)
+        self.__maximum_size = value
+
+    @maximum_size.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def maximum_size(self):
+        """
+        Deleter for **self.__maximum_size** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "maximum_size"))
+
+    @property
+    def size(self):
+        """
+        Property for **self.__size** attribute.
+
+        :return: self.__size.
+        :rtype: int
+        """
+
+        return self.__size
+
+    @size.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def size(self, value):
+        """
+        Setter for **self.__size** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "size"))
+
+    @size.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def size(self):
+        """
+        Deleter for **self.__size** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "size"))
+
+    @property
+    def hits(self):
+        """
+        Property for **self.__hits** attribute.
+
+        :return: self.__hits.
+        :rtype: int
+        """
+
+        return self.__hits
+
+    @hits.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def hits(self, value):
+        """
+        Setter for **self.__hits** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "hits"))
+
+    @hits.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def hits(self):
+        """
+        Deleter for **self.__hits** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "hits"))
+
+    @property
+    def misses(self):
+        """
+        Property for **self.__misses** attribute.
+
+        :return: self.__misses.
+        :rtype: int
+        """
+
+        return self.__misses
+
+    @misses.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def misses(self, value):
+        """
+        Setter for **self.__misses** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "misses"))
+
+    @misses.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def misses(self):
+        """
+        Deleter for **self.__misses** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "misses"))
+
+    @property
+    def evictions(self):
+        """
+        Property for **self.__evictions** attribute.
+
+        :return: self.__evictions.
+        :rtype: int
+        """
+
+        return self.__evictions
+
+    @evictions.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def evictions(self, value):
+        """
+        Setter for **self.__evictions** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "evictions"))
+
+    @evictions.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def evictions(self):
+        """
+        Deleter for **self.__evictions** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "evictions"))
+
+    @staticmethod
+    def get_size(value):
+        """
+        Returns given value approximate memory size in bytes.
+
+        :param value: Value.
+        :type value: object
+        :return: Size.
+        :rtype: int
+        """
+
+        content = getattr(value, "content", value)
+        return sys.getsizeof(content) if content is not None else 0
+
+    def add_content(self, **content):
+        """
+        Adds given content to the cache, evicting the least recently used content if the budget is exceeded.
+
+        :param \*\*content: Content to add.
+        :type \*\*content: \*\*
+        :return: Method success.
+        :rtype: bool
+        """
+
+        with self.__lock:
+            for key, value in content.iteritems():
+                self.__discard(key)
+                size = self.get_size(value)
+                dict.__setitem__(self, key, value)
+                self.__sizes[key] = size
+                self.__size += size
+            self.__evict()
+        return True
+
+    def remove_content(self, *keys):
+        """
+        Removes given content from the cache.
+
+        :param \*keys: Content to remove.
+        :type \*keys: \*
+        :return: Method success.
+        :rtype: bool
+        """
+
+        with self.__lock:
+            for key in keys:
+                if not key in self:
+                    raise KeyError("{0} | '{1}' key doesn't exists in cache content!".format(
+                        self.__class__.__name__, key))
+                self.__discard(key)
+        return True
+
+    def get_content(self, key):
+        """
+        Gets given content from the cache and marks it as the most recently used.
+
+        :param key: Content to retrieve.
+        :type key: object
+        :return: Content.
+        :rtype: object
+        """
+
+        with self.__lock:
+            if not key in self:
+                self.__misses += 1
+                return None
+
+            self.__hits += 1
+            self.__sizes[key] = self.__sizes.pop(key)
+            return dict.__getitem__(self, key)
+
+    def flush_content(self):
+        """
+        Flushes the cache content.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        with self.__lock:
+            self.clear()
+            self.__sizes.clear()
+            self.__size = 0
+        return True
+
+    def get_metrics(self):
+        """
+        Returns the cache metrics.
+
+        :return: Cache metrics.
+        :rtype: dict
+        """
+
+        with self.__lock:
+            return {"Entries": len(self),
+                    "Size": self.__size,
+                    "Maximum Size": self.__maximum_size,
+                    "Hits": self.__hits,
+                    "Misses": self.__misses,
+                    "Evictions": self.__evictions}
+
+    def __discard(self, key):
+        """
+        Discards given content from the cache.
+
+        :param key: Content to discard.
+        :type key: object
+        """
+
+        if not key in self:
+            return
+
+        dict.__delitem__(self, key)
+        self.__size -= self.__sizes.pop(key)
+
+    def __evict(self):
+        """
+        Evicts the least recently used content until the cache fits its budget.
+        """
+
+        if self.__size <= self.__maximum_size:
+            return
+
+        for key in list(self.__sizes):
+            if self.__size <= self.__maximum_size:
+                break
+
+            LOGGER.debug("> Evicting '{0}' content from the cache.".format(key))
+
+            self.__discard(key)
+            self.__evictions += 1
+
+
+class SearchResultsCache(object):
+    """
+    Defines a least recently used search results cache keyed by search pattern, settings and location.
+
+    Files reported as changed under a cached location are recorded so that only them need to be searched again,
+    a directory change drops the cached locations containing it as files may have been added or removed.
+    The search results files signatures are also checked when an entry is retrieved so that files changed
+    without a file system event are searched again.
+
+    Changes are only reported for watched paths: when a path watcher is given, search results are only
+    cached and served while every directory the search walked and every location file is watched.
+    """
+
+    def __init__(self, maximum_entries=16, path_watcher=None):
+        """
+        Initializes the class.
+
+        :param maximum_entries: Maximum cached search results entries.
+        :type maximum_entries: int
+        :param path_watcher: Callable returning if given path changes are reported to the cache.
+        :type path_watcher: object
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        # --- Setting class attributes. ---
+        self.__maximum_entries = None
+        self.maximum_entries = maximum_entries
+        self.__path_watcher = None
+        self.path_watcher = path_watcher
+        self.__entries = OrderedDict()
+
+    @property
+    def maximum_entries(self):
+        """
+        Property for **self.__maximum_entries** attribute.
+
+        :return: self.__maximum_entries.
+        :rtype: int
+        """
+
+        return self.__maximum_entries
+
+    @maximum_entries.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def maximum_entries(self, value):
+        """
+        Setter for **self.__maximum_entries** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        if value is not None:
+            assert type(value) is int, "'{0}' attribute: '{1}' type is not 'int'!".format("maximum_entries", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format(
+                "maximum_entries", value)
+        self.__maximum_entries = value
+
+    @maximum_entries.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def maximum_entries(self):
+        """
+        Deleter for **self.__maximum_entries** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "maximum_entries"))
+
+    @property
+    def path_watcher(self):
+        """
+        Property for **self.__path_watcher** attribute.
+
+        :return: self.__path_watcher.
+        :rtype: object
+        """
+
+        return self.__path_watcher
+
+    @path_watcher.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def path_watcher(self, value):
+        """
+        Setter for **self.__path_watcher** attribute.
+
+        :param value: Attribute value.
+        :type value: object
+        """
+
+        if value is not None:
+            assert hasattr(value, "__call__"), "'{0}' attribute: '{1}' is not callable!".format(
+                "path_watcher", value)
+        self.__path_watcher = value
+
+    @path_watcher.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def path_watcher(self):
+        """
+        Deleter for **self.__path_watcher** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "path_watcher"))
+
+    @property
+    def entries(self):
+        """
+        Property for **self.__entries** attribute.
+
+        :return: self.__entries.
+        :rtype: OrderedDict
+        """
+
+        return self.__entries
+
+    @entries.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def entries(self, value):
+        """
+        Setter for **self.__entries** attribute.
+
+        :param value: Attribute value.
+        :type value: OrderedDict
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "entries"))
+
+    @entries.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def entries(self):
+        """
+        Deleter for **self.__entries** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "entries"))
+
+    @staticmethod
+    def get_key(pattern, settings, location):
+        """
+        Returns the cache key of given search pattern, settings and location.
+
+        :param pattern: Pattern or literal patterns list.
+        :type pattern: unicode or list
+        :param settings: Search settings.
+        :type settings: dict
+        :param location: Location.
+        :type location: Location
+        :return: Key.
+        :rtype: tuple
+        """
+
+        return (tuple(pattern) if type(pattern) is list else pattern,
+                bool(settings.get("case_sensitive")),
+                bool(settings.get("whole_word")),
+                bool(settings.get("regular_expressions")),
+                tuple(tuple(location[attribute]) for attribute in
+                      ("directories", "files", "filters_in", "filters_out", "targets")))
+
+    @staticmethod
+    def __get_location_paths(location):
+        """
+        Returns given location directories and files as forward slashes paths.
+
+        :param location: Location.
+        :type location: Location
+        :return: Directories, files.
+        :rtype: tuple
+        """
+
+        return ([foundations.strings.to_forward_slashes(directory).rstrip("/") for directory in location.directories],
+                [foundations.strings.to_forward_slashes(file) for file in location.files])
+
+    @staticmethod
+    def get_signatures(search_results):
+        """
+        Returns given search results files signatures.
+
+        :param search_results: Search results.
+        :type search_results: list
+        :return: Files signatures.
+        :rtype: dict
+        """
+
+        signatures = {}
+        for search_result in search_results:
+            if not search_result.file in signatures:
+                signatures[search_result.file] = get_file_signature(search_result.file)
+        return signatures
+
+    @staticmethod
+    def get_changed_files(signatures):
+        """
+        Returns the files whose signature differs from given signatures.
+
+        :param signatures: Files signatures.
+        :type signatures: dict
+        :return: Changed files.
+        :rtype: list
+        """
+
+        return [file for file, signature in signatures.iteritems() if get_file_signature(file) != signature]
+
+    def is_watched(self, paths):
+        """
+        Returns if given paths are all watched.
+
+        :param paths: Paths.
+        :type paths: list
+        :return: Paths watched.
+        :rtype: bool
+        """
+
+        if self.__path_watcher is None:
+            return True
+
+        for path in paths:
+            if not self.__path_watcher(path):
+                LOGGER.debug("> '{0}' path is not watched, its changes would not be reported!".format(path))
+                return False
+        return True
+
+    def add_search_results(self, key, location, search_results, walked_directories=None):
+        """
+        Adds given search results to the cache, evicting the least recently used entry if needed.
+        The search results are not cached if a location path is not watched.
+
+        :param key: Key.
+        :type key: tuple
+        :param location: Location.
+        :type location: Location
+        :param search_results: Search results.
+        :type search_results: list
+        :param walked_directories: Directories walked by the search.
+        :type walked_directories: list
+        :return: Method success.
+        :rtype: bool
+        """
+
+        self.__entries.pop(key, None)
+        watched_paths = sorted(set(itertools.chain(location.directories, walked_directories or (), location.files)))
+        if not self.is_watched(watched_paths):
+            return False
+
+        directories, files = self.__get_location_paths(location)
+        self.__entries[key] = foundations.data_structures.Structure(location=location,
+                                                                    directories=directories,
+                                                                    files=files,
+                                                                    filters=Filters(location.filters_in,
+                                                                                    location.filters_out),
+                                                                    search_results=search_results,
+                                                                    signatures=self.get_signatures(search_results),
+                                                                    watched_paths=watched_paths,
+                                                                    changed_files=set())
+        while len(self.__entries) > self.__maximum_entries:
+            self.__entries.popitem(last=False)
+        return True
+
+    def get_search_results(self, key):
+        """
+        Returns given key cache entry and marks it as the most recently used.
+
+        The entry search_results attribute holds the cached search results and its changed_files attribute
+        the files changed since they have been cached, search results files are stated again to detect
+        the changes no file system event reported. An entry with a path no longer watched is dropped.
+
+        :param key: Key.
+        :type key: tuple
+        :return: Cache entry.
+        :rtype: Structure
+        """
+
+        if not key in self.__entries:
+            return None
+
+        entry = self.__entries.pop(key)
+        if not self.is_watched(entry.watched_paths):
+            LOGGER.debug("> Dropping '{0}' search results cache entry.".format(key))
+            return None
+
+        self.__entries[key] = entry
+        for file in self.get_changed_files(entry.signatures):
+            LOGGER.debug("> '{0}' file changed since it has been cached.".format(file))
+            entry.changed_files.add(foundations.strings.to_forward_slashes(file))
+        return entry
+
+    def file_changed(self, file):
+        """
+        Records given changed file in the cache entries locations containing it.
+
+        :param file: File.
+        :type file: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        file = foundations.strings.to_forward_slashes(file)
+        for entry in self.__entries.itervalues():
+            if file in entry.files:
+                entry.changed_files.add(file)
+                continue
+
+            for directory in entry.directories:
+                if file.startswith("{0}/".format(directory)) and entry.filters.filter_file(file):
+                    entry.changed_files.add(file)
+                    break
+        return True
+
+    def directory_changed(self, directory):
+        """
+        Drops the cache entries locations containing given changed directory.
+
+        :param directory: Directory.
+        :type directory: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        directory = foundations.strings.to_forward_slashes(directory).rstrip("/")
+        for key, entry in self.__entries.items():
+            for location_directory in entry.directories:
+                if directory == location_directory or \
+                        directory.startswith("{0}/".format(location_directory)) or \
+                        location_directory.startswith("{0}/".format(directory)):
+                    LOGGER.debug("> Dropping '{0}' search results cache entry.".format(key))
+                    del self.__entries[key]
+                    break
+        return True
+
+    def flush(self):
+        """
+        Flushes the cache entries.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        self.__entries.clear()
+        return True
@@ -16,6 +16,7 @@
 
 from __future__ import unicode_literals
 
+import hashlib
 import os
 import platform
 from PyQt4.QtCore import Qt
@@ -131,8 +132,14 @@ class Editor(CodeEditor_QPlainTextEdit):
         self.__default_file_name = "Untitled"
         self.__default_file_extension = "py"
 
+        self.__content_hash = None
+        self.__reload_is_modified = None
+
         Editor.__initialize_ui(self)
 
+        # Signals / Slots.
+        self.content_updated.connect(self.__editor__content_updated)
+
         file and self.load_file(file)
 
     @property
@@ -374,6 +381,40 @@ class Editor(CodeEditor_QPlainTextEdit):
         raise foundations.exceptions.ProgrammingError(
             "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "default_file_extension"))
 
+    @property
+    def content_hash(self):
+        """
+        Property for **self.__content_hash** attribute.
+
+        :return: self.__content_hash.
+        :rtype: unicode
+        """
+
+        return self.__content_hash
+
+    @content_hash.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def content_hash(self, value):
+        """
+        Setter for **self.__content_hash** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "content_hash"))
+
+    @content_hash.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def content_hash(self):
+        """
+        Deleter for **self.__content_hash** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "content_hash"))
+
     def __initialize_ui(self):
         """
         Initializes the Widget ui.
@@ -411,6 +452,25 @@ class Editor(CodeEditor_QPlainTextEdit):
 
         self.set_title()
 
+    def __editor__content_updated(self, applied):
+        """
+        Defines the slot triggered by the editor when a reloaded content has been processed.
+
+        :param applied: Content applied.
+        :type applied: bool
+        """
+
+        if not applied:
+            LOGGER.warning(
+                "!> {0} | '{1}' document changed while its file was reloaded, the reload is dropped!".format(
+                    self.__class__.__name__, self.__file))
+            self.__content_hash = None
+            self.set_modified(True)
+            return
+
+        self.set_file(self.__file, is_modified=self.__reload_is_modified)
+        self.file_reloaded.emit()
+
     def __set_document_signals(self):
         """
         Connects the editor document signals.
@@ -509,6 +569,7 @@ class Editor(CodeEditor_QPlainTextEdit):
 
         document.setDocumentLayout(QPlainTextDocumentLayout(document))
         self.setDocument(document)
+        self.__content_hash = None
         self.set_file(file)
         self.set_language(language)
         self.__set_document_signals()
@@ -526,6 +587,7 @@ class Editor(CodeEditor_QPlainTextEdit):
 
         file = self.get_untitled_file_name()
         LOGGER.debug("> Creating '{0}' file.".format(file))
+        self.__content_hash = None
         self.set_file(file, is_modified=False, is_untitled=True)
         self.__set_document_signals()
         return file
@@ -547,6 +609,7 @@ class Editor(CodeEditor_QPlainTextEdit):
                                                           file))
 
         LOGGER.debug("> Loading '{0}' file.".format(file))
+        self.__content_hash = self.get_file_content_hash(file)
         reader = foundations.io.File(file)
         self.setPlainText(reader.read())
         self.set_file(file)
@@ -555,12 +618,15 @@ class Editor(CodeEditor_QPlainTextEdit):
         return True
 
     @foundations.exceptions.handle_exceptions(foundations.exceptions.FileExistsError)
-    def reload_file(self, is_modified=True):
+    def reload_file(self, is_modified=True, force=False):
         """
-        Reloads the current editor file.
+        Reloads the current editor file, the reload is skipped if the file content hash is unchanged
+        unless it is forced.
 
         :param is_modified: File modified state.
         :type is_modified: bool
+        :param force: Reload the file even if its content hash is unchanged.
+        :type force: bool
         :return: Method success.
         :rtype: bool
         """
@@ -569,14 +635,17 @@ class Editor(CodeEditor_QPlainTextEdit):
             raise foundations.exceptions.FileExistsError("{0} | '{1}' file doesn't exists!".format(
                 self.__class__.__name__, self.__file))
 
+        content_hash = self.get_file_content_hash(self.__file)
+        if not force and content_hash is not None and content_hash == self.__content_hash:
+            LOGGER.debug("> '{0}' file content is unchanged, skipping reload!".format(self.__file))
+            return True
+
         LOGGER.debug("> Reloading '{0}' file.".format(self.__file))
         reader = foundations.io.File(self.__file)
         if reader.cache():
-            self.set_content(reader.content)
-            self.set_file(self.__file, is_modified=is_modified)
-
-            self.file_reloaded.emit()
-            return True
+            self.__content_hash = content_hash
+            self.__reload_is_modified = is_modified
+            return self.update_content(reader.content)
 
     def save_file(self):
         """
@@ -622,11 +691,30 @@ class Editor(CodeEditor_QPlainTextEdit):
         writer = foundations.io.File(file)
         writer.content = [self.toPlainText().toUtf8()]
         if writer.write():
+            self.__content_hash = self.get_file_content_hash(file)
             self.set_file(file)
 
             self.file_saved.emit()
             return True
 
+    @staticmethod
+    def get_file_content_hash(file):
+        """
+        Returns given file content hash.
+
+        :param file: File.
+        :type file: unicode
+        :return: File content hash.
+        :rtype: unicode
+        """
+
+        try:
+            with open(file, "rb") as file_handle:
+                return hashlib.sha1(file_handle.read()).hexdigest()
+        except IOError as error:
+            LOGGER.debug("> '{0}' file content hash cannot be computed: '{1}'.".format(file, error))
+            return None
+
     def close_file(self):
         """
         Closes the editor file.
@@ -0,0 +1,715 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**indexes.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines the :class:`umbra.components.factory.script_editor.search_in_files.SearchInFiles` class
+    search indexes.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import cPickle as pickle
+import os
+import threading
+import uuid
+from array import array
+
+import foundations.common
+import foundations.exceptions
+import foundations.io
+import foundations.strings
+import foundations.verbose
+from umbra.components.factory.script_editor.matchers import get_file_signature
+from umbra.components.factory.script_editor.walkers import Filters
+from umbra.components.factory.script_editor.walkers import files_walker
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "get_trigrams", "TrigramIndex"]
+
+LOGGER = foundations.verbose.install_logger()
+
+
+def get_trigrams(content):
+    """
+    Returns given content case insensitive trigrams.
+
+    :param content: Content.
+    :type content: unicode
+    :return: Trigrams.
+    :rtype: set
+    """
+
+    content = content.lower()
+    return set(content[i:i + 3] for i in xrange(len(content) - 2))
+
+
+class TrigramIndex(object):
+    """
+    Defines a persistent trigram index of a directory files used to narrow the files to search into.
+
+    Each trigram maps to a sorted array of files ids. The index is saved into its storage file and the
+    following changes are appended to a journal file until the journal grows large enough for the storage
+    file to be written again.
+    """
+
+    __version = 2
+    """
+    :param __version: Index storage format version.
+    :type __version: int
+    """
+
+    def __init__(self, directory=None, file=None, filters_out=None):
+        """
+        Initializes the class.
+
+        :param directory: Indexed directory.
+        :type directory: unicode
+        :param file: Index storage file.
+        :type file: unicode
+        :param filters_out: Regex filters out list.
+        :type filters_out: tuple or list
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        # --- Setting class attributes. ---
+        self.__directory = None
+        self.directory = directory and foundations.strings.to_forward_slashes(directory)
+        self.__file = None
+        self.file = file
+        self.__filters_out = tuple(filters_out or ())
+
+        self.__built = False
+
+        self.__paths = []
+        self.__ids = {}
+        self.__signatures = {}
+        self.__trigrams = {}
+        self.__dead_ids_count = 0
+
+        self.__generation = None
+        self.__journal = []
+        self.__rewrite = True
+        self.__lock = threading.RLock()
+
+    @property
+    def directory(self):
+        """
+        Property for **self.__directory** attribute.
+
+        :return: self.__directory.
+        :rtype: unicode
+        """
+
+        return self.__directory
+
+    @directory.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def directory(self, value):
+        """
+        Setter for **self.__directory** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        if value is not None:
+            assert type(value) is unicode, "'{0}' attribute: '{1}' type is not 'unicode'!".format("directory", value)
+        self.__directory = value
+
+    @directory.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def directory(self):
+        """
+        Deleter for **self.__directory** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "directory"))
+
+    @property
+    def file(self):
+        """
+        Property for **self.__file** attribute.
+
+        :return: self.__file.
+        :rtype: unicode
+        """
+
+        return self.__file
+
+    @file.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def file(self, value):
+        """
+        Setter for **self.__file** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        if value is not None:
+            assert type(value) is unicode, "'{0}' attribute: '{1}' type is not 'unicode'!".format("file", value)
+        self.__file = value
+
+    @file.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def file(self):
+        """
+        Deleter for **self.__file** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "file"))
+
+    @property
+    def filters_out(self):
+        """
+        Property for **self.__filters_out** attribute.
+
+        :return: self.__filters_out.
+        :rtype: tuple or list
+        """
+
+        return self.__filters_out
+
+    @filters_out.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def filters_out(self, value):
+        """
+        Setter for **self.__filters_out** attribute.
+
+        :param value: Attribute value.
+        :type value: tuple or list
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "filters_out"))
+
+    @filters_out.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def filters_out(self):
+        """
+        Deleter for **self.__filters_out** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "filters_out"))
+
+    @property
+    def built(self):
+        """
+        Property for **self.__built** attribute.
+
+        :return: self.__built.
+        :rtype: bool
+        """
+
+        return self.__built
+
+    @built.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def built(self, value):
+        """
+        Setter for **self.__built** attribute.
+
+        :param value: Attribute value.
+        :type value: bool
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "built"))
+
+    @built.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def built(self):
+        """
+        Deleter for **self.__built** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "built"))
+
+    def __len__(self):
+        """
+        Reimplements the :meth:`object.__len__` method.
+
+        :return: Indexed files count.
+        :rtype: int
+        """
+
+        return len(self.__ids)
+
+    def __contains__(self, path):
+        """
+        Reimplements the :meth:`object.__contains__` method.
+
+        :param path: Path.
+        :type path: unicode
+        :return: Path is covered by the index.
+        :rtype: bool
+        """
+
+        return path == self.__directory or path.startswith(self.__directory.rstrip("/") + "/")
+
+    def __get_journal_file(self):
+        """
+        Returns the index journal file.
+
+        :return: Journal file.
+        :rtype: unicode
+        """
+
+        return "{0}.journal".format(self.__file)
+
+    def __add_file(self, path, signature, trigrams):
+        """
+        Adds given file trigrams to the index.
+
+        :param path: File path.
+        :type path: unicode
+        :param signature: File signature.
+        :type signature: tuple
+        :param trigrams: File trigrams.
+        :type trigrams: set
+        """
+
+        self.__remove_file(path)
+
+        # Ids are increasing so that the trigrams arrays stay sorted when appended to.
+        id = len(self.__paths)
+        self.__paths.append(path)
+        self.__ids[path] = id
+        self.__signatures[path] = signature
+        for trigram in trigrams:
+            ids = self.__trigrams.get(trigram)
+            if ids is None:
+                self.__trigrams[trigram] = ids = array(b"I")
+            ids.append(id)
+
+    def __remove_file(self, path):
+        """
+        Removes given file from the index.
+
+        :param path: File path.
+        :type path: unicode
+        :return: File was indexed.
+        :rtype: bool
+        """
+
+        id = self.__ids.pop(path, None)
+        if id is None:
+            return False
+
+        # Trigrams arrays are cleaned lazily by :meth:`TrigramIndex.__compact`.
+        self.__paths[id] = None
+        self.__signatures.pop(path, None)
+        self.__dead_ids_count += 1
+        return True
+
+    def __add_journal_record(self, *record):
+        """
+        Adds given change record to the journal, the journal is dropped in favor of writing the whole index
+        once it grows too large.
+
+        :param \*record: Record.
+        :type \*record: \*
+        """
+
+        if self.__rewrite:
+            return
+
+        self.__journal.append(record)
+        if len(self.__journal) > max(1024, len(self.__ids) // 4):
+            self.__journal = []
+            self.__rewrite = True
+
+    def __compact(self):
+        """
+        Compacts the index by purging removed files ids.
+        """
+
+        if self.__dead_ids_count < max(1024, len(self.__ids)):
+            return
+
+        LOGGER.debug("> Compacting '{0}' index.".format(self.__directory))
+
+        paths, ids, mapping = [], {}, {}
+        for id, path in enumerate(self.__paths):
+            if path is None:
+                continue
+
+            mapping[id] = ids[path] = len(paths)
+            paths.append(path)
+
+        trigrams = {}
+        for trigram, trigram_ids in self.__trigrams.iteritems():
+            trigram_ids = array(b"I", (mapping[id] for id in trigram_ids if id in mapping))
+            if trigram_ids:
+                trigrams[trigram] = trigram_ids
+
+        self.__paths, self.__ids, self.__trigrams = paths, ids, trigrams
+        self.__dead_ids_count = 0
+
+    def index_file(self, path, signature=None):
+        """
+        Indexes given file, removing it from the index if it doesn't exist anymore or is binary.
+
+        :param path: File path.
+        :type path: unicode
+        :param signature: File signature, retrieved if not given.
+        :type signature: tuple
+        :return: Method success.
+        :rtype: bool
+        """
+
+        signature = signature or get_file_signature(path)
+        if signature is None or not os.path.isfile(path):
+            return self.unindex_file(path)
+
+        with self.__lock:
+            if self.__signatures.get(path) == signature:
+                return True
+
+        if not foundations.io.is_readable(path) or foundations.io.is_binary_file(path):
+            return self.unindex_file(path)
+
+        content = foundations.io.File(path).read()
+        if content is None:
+            return self.unindex_file(path)
+
+        LOGGER.debug("> Indexing '{0}' file.".format(path))
+
+        trigrams = get_trigrams(content)
+        with self.__lock:
+            self.__add_file(path, signature, trigrams)
+            self.__add_journal_record("add", path, signature, tuple(trigrams))
+        return True
+
+    def unindex_file(self, path):
+        """
+        Removes given file from the index.
+
+        :param path: File path.
+        :type path: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        with self.__lock:
+            self.__remove_file(path) and self.__add_journal_record("remove", path)
+        return True
+
+    def update_path(self, path, interrupt=None):
+        """
+        Updates the index for given file or directory path.
+
+        :param path: File or directory path.
+        :type path: unicode
+        :param interrupt: Callable returning if the update should be interrupted.
+        :type interrupt: object
+        :return: Method success.
+        :rtype: bool
+        """
+
+        path = foundations.strings.to_forward_slashes(path)
+        if not path in self:
+            return False
+
+        if foundations.strings.filter_words((path,), filters_out=self.__filters_out) != [path]:
+            return False
+
+        if os.path.isfile(path):
+            return self.index_file(path)
+
+        with self.__lock:
+            prefix = path.rstrip("/") + "/"
+            indexed_files = [file for file in self.__ids if file.startswith(prefix)]
+
+        existing_files = set()
+        if foundations.common.path_exists(path):
+            for file, signature in files_walker(path, Filters(filters_out=self.__filters_out), signatures=True):
+                if interrupt is not None and interrupt():
+                    return False
+
+                file = foundations.strings.to_forward_slashes(file)
+                existing_files.add(file)
+                self.index_file(file, signature)
+
+        for file in indexed_files:
+            file not in existing_files and self.unindex_file(file)
+
+        with self.__lock:
+            self.__compact()
+        return True
+
+    def update(self, interrupt=None):
+        """
+        Updates the whole index, reconciling it with the files signatures, the index is built once done.
+
+        :param interrupt: Callable returning if the update should be interrupted.
+        :type interrupt: object
+        :return: Method success.
+        :rtype: bool
+        """
+
+        LOGGER.debug("> Updating '{0}' index.".format(self.__directory))
+
+        if not self.update_path(self.__directory, interrupt):
+            return False
+
+        self.__built = True
+        return True
+
+    def is_up_to_date(self, path, signature=None):
+        """
+        Returns if given file is indexed with its current signature.
+
+        :param path: File path.
+        :type path: unicode
+        :param signature: File current signature, retrieved if not given.
+        :type signature: tuple
+        :return: Is file up to date.
+        :rtype: bool
+        """
+
+        path = foundations.strings.to_forward_slashes(path)
+        signature = signature or get_file_signature(path)
+        if signature is None:
+            return False
+
+        with self.__lock:
+            return self.__signatures.get(path) == signature
+
+    def get_candidates(self, pattern, settings):
+        """
+        Returns the indexed files that could contain given pattern using given settings.
+
+        :param pattern: Pattern.
+        :type pattern: unicode
+        :param settings: Search settings.
+        :type settings: dict
+        :return: Candidate files, None if the index cannot narrow the search.
+        :rtype: list
+        """
+
+        if not self.__built or settings.get("regular_expressions"):
+            return None
+
+        trigrams = get_trigrams(pattern)
+        if not trigrams:
+            return None
+
+        with self.__lock:
+            trigrams_ids = []
+            for trigram in trigrams:
+                ids = self.__trigrams.get(trigram)
+                if not ids:
+                    return []
+                trigrams_ids.append(ids)
+
+            trigrams_ids = sorted(trigrams_ids, key=len)
+            ids = set(foundations.common.get_first_item(trigrams_ids))
+            for trigram_ids in trigrams_ids[1:]:
+                ids.intersection_update(trigram_ids)
+                if not ids:
+                    break
+            return sorted(filter(bool, (self.__paths[id] for id in ids)))
+
+    def list_files(self):
+        """
+        Returns the indexed files.
+
+        :return: Indexed files.
+        :rtype: list
+        """
+
+        with self.__lock:
+            return sorted(self.__ids)
+
+    def __load_journal(self):
+        """
+        Replays the journal file changes onto the index, a truncated journal is replayed up to its last
+        complete record and the whole index is written again on next save.
+        """
+
+        journal_file = self.__get_journal_file()
+        if not foundations.common.path_exists(journal_file):
+            return
+
+        try:
+            with open(journal_file, "rb") as file:
+                if pickle.load(file) != (self.__version, self.__generation):
+                    LOGGER.debug("> '{0}' index journal file is outdated.".format(journal_file))
+                    self.__rewrite = True
+                    return
+
+                while True:
+                    try:
+                        record = pickle.load(file)
+                    except EOFError:
+                        break
+
+                    if record[0] == "add":
+                        self.__add_file(*record[1:])
+                    else:
+                        self.__remove_file(*record[1:])
+        except (IOError, EOFError, ValueError, TypeError, IndexError, KeyError, AttributeError,
+                ImportError, pickle.UnpicklingError) as error:
+            LOGGER.warning("!> {0} | '{1}' index journal file is not readable: '{2}'!".format(
+                self.__class__.__name__, journal_file, error))
+            self.__rewrite = True
+
+    def load(self):
+        """
+        Loads the index from its storage and journal files.
+
+        :note: The loaded index is not built until :meth:`TrigramIndex.update` reconciles it with the disk.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if not foundations.common.path_exists(self.__file):
+            return False
+
+        LOGGER.debug("> Loading '{0}' index from '{1}' file.".format(self.__directory, self.__file))
+
+        try:
+            with open(self.__file, "rb") as file:
+                version, generation, directory, filters_out, paths, signatures, trigrams = pickle.load(file)
+        except (IOError, EOFError, ValueError, TypeError, pickle.UnpicklingError) as error:
+            LOGGER.warning("!> {0} | '{1}' index file is not readable: '{2}'!".format(
+                self.__class__.__name__, self.__file, error))
+            return False
+
+        if version != self.__version or directory != self.__directory or tuple(filters_out) != self.__filters_out:
+            LOGGER.debug("> '{0}' index file is outdated.".format(self.__file))
+            return False
+
+        with self.__lock:
+            self.__paths = paths
+            self.__ids = dict((path, id) for id, path in enumerate(paths) if path is not None)
+            self.__signatures = signatures
+            self.__trigrams = {}
+            for trigram, ids in trigrams.iteritems():
+                self.__trigrams[trigram] = trigram_ids = array(b"I")
+                trigram_ids.fromstring(ids)
+            self.__dead_ids_count = len(paths) - len(self.__ids)
+            self.__generation = generation
+            self.__journal = []
+            self.__rewrite = False
+            self.__load_journal()
+        return True
+
+    def __write_index(self):
+        """
+        Writes the whole index into its storage file and removes the journal file.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        LOGGER.debug("> Saving '{0}' index into '{1}' file.".format(self.__directory, self.__file))
+
+        with self.__lock:
+            self.__generation = uuid.uuid4().hex
+            data = pickle.dumps((self.__version,
+                                 self.__generation,
+                                 self.__directory,
+                                 self.__filters_out,
+                                 self.__paths,
+                                 self.__signatures,
+                                 dict((trigram, ids.tostring()) for trigram, ids in self.__trigrams.iteritems())),
+                                pickle.HIGHEST_PROTOCOL)
+            self.__journal = []
+            self.__rewrite = False
+
+        temporary_file = "{0}.tmp".format(self.__file)
+        try:
+            with open(temporary_file, "wb") as file:
+                file.write(data)
+            if os.path.exists(self.__file):
+                os.remove(self.__file)
+            os.rename(temporary_file, self.__file)
+            journal_file = self.__get_journal_file()
+            os.path.exists(journal_file) and os.remove(journal_file)
+        except (IOError, OSError) as error:
+            LOGGER.warning("!> {0} | '{1}' index file is not writable: '{2}'!".format(
+                self.__class__.__name__, self.__file, error))
+            self.__rewrite = True
+            return False
+        return True
+
+    def __write_journal(self):
+        """
+        Appends the pending changes records to the journal file.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        with self.__lock:
+            journal, self.__journal = self.__journal, []
+            generation = self.__generation
+
+        if not journal:
+            return True
+
+        journal_file = self.__get_journal_file()
+        LOGGER.debug("> Appending '{0}' changes to '{1}' index journal file.".format(len(journal), journal_file))
+
+        try:
+            is_new = not os.path.exists(journal_file)
+            with open(journal_file, "ab") as file:
+                is_new and pickle.dump((self.__version, generation), file, pickle.HIGHEST_PROTOCOL)
+                for record in journal:
+                    pickle.dump(record, file, pickle.HIGHEST_PROTOCOL)
+        except (IOError, OSError) as error:
+            LOGGER.warning("!> {0} | '{1}' index journal file is not writable: '{2}'!".format(
+                self.__class__.__name__, journal_file, error))
+            self.__rewrite = True
+            return False
+        return True
+
+    def save(self):
+        """
+        Saves the index changes into its journal file, the whole index is written into its storage file
+        if it has never been written or if the journal grew too large.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        with self.__lock:
+            rewrite = self.__rewrite or not foundations.common.path_exists(self.__file)
+
+        return self.__write_index() if rewrite else self.__write_journal()
+
+    def remove(self):
+        """
+        Removes the index storage and journal files.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        for file in (self.__file, self.__get_journal_file()):
+            if foundations.common.path_exists(file):
+                os.remove(file)
+        return True
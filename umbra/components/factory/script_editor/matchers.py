@@ -0,0 +1,699 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**matchers.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines the :class:`umbra.components.factory.script_editor.workers.Search_worker` class
+    text matching definitions.
+
+**Others:**
+    Those definitions don't rely on **Qt** objects so that they can be executed in child processes.
+"""
+
+from __future__ import unicode_literals
+
+import bisect
+import collections
+import logging
+import mmap
+import os
+import re
+import sre_constants
+import sre_parse
+import sys
+import time
+
+import foundations.io
+import foundations.verbose
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER",
+           "CHUNK_SIZE",
+           "WORD_CHARACTER",
+           "CONTINUATION_BYTES",
+           "ASTRAL_CHARACTER",
+           "get_stat_signature",
+           "get_file_signature",
+           "get_search_expression",
+           "get_bytes_search_expression",
+           "get_lines_offsets",
+           "get_utf16_positions",
+           "search_content",
+           "is_backtracking_expression",
+           "get_patterns_automaton",
+           "search_content_patterns",
+           "is_refining_pattern",
+           "refine_occurrences",
+           "count_mapping",
+           "is_mapping_whole_word",
+           "search_mapping",
+           "search_file_mapping",
+           "initialize_search_process",
+           "search_files",
+           "search_files_with_metrics"]
+
+LOGGER = foundations.verbose.install_logger()
+
+CHUNK_SIZE = 1024 * 1024
+"""
+:param CHUNK_SIZE: Chunk size used when scanning memory mapped files.
+:type CHUNK_SIZE: int
+"""
+
+WORD_CHARACTER = re.compile(r"\w", re.UNICODE)
+"""
+:param WORD_CHARACTER: Regular expression matching a word character.
+:type WORD_CHARACTER: RegexObject
+"""
+
+CONTINUATION_BYTES = bytes(bytearray(range(0x80, 0xc0)))
+"""
+:param CONTINUATION_BYTES: **UTF-8** continuation bytes, they don't start a new character.
+:type CONTINUATION_BYTES: str
+"""
+
+ASTRAL_CHARACTER = re.compile("[\U00010000-\U0010ffff]") if sys.maxunicode > 0xffff else None
+"""
+:param ASTRAL_CHARACTER: Regular expression matching a character outside the Basic Multilingual Plane,
+    None on narrow Python builds where such a character is already stored as two **UTF-16** code units.
+:type ASTRAL_CHARACTER: RegexObject
+"""
+
+
+def get_stat_signature(stat):
+    """
+    Returns given stat result signature.
+
+    :param stat: Stat result.
+    :type stat: stat_result
+    :return: Modification time, size and inode.
+    :rtype: tuple
+    """
+
+    return stat.st_mtime, stat.st_size, stat.st_ino
+
+
+def get_file_signature(file):
+    """
+    Returns given file signature used to validate its cached content, retrieved with a single stat call.
+
+    :param file: File.
+    :type file: unicode
+    :return: Modification time, size and inode or None if the file doesn't exist.
+    :rtype: tuple
+    """
+
+    try:
+        return get_stat_signature(os.stat(file))
+    except OSError:
+        return None
+
+
+def get_search_expression(pattern, settings):
+    """
+    Returns the compiled regular expression matching given pattern using given settings.
+
+    :param pattern: Pattern.
+    :type pattern: unicode
+    :param settings: Search settings.
+    :type settings: dict
+    :return: Regular expression.
+    :rtype: RegexObject
+    """
+
+    flags = re.UNICODE | re.MULTILINE
+    if not settings.get("case_sensitive"):
+        flags = flags | re.IGNORECASE
+
+    expression = pattern if settings.get("regular_expressions") else re.escape(pattern)
+    if settings.get("whole_word"):
+        expression = r"(?<!\w)(?:{0})(?!\w)".format(expression)
+    return re.compile(expression, flags)
+
+
+def get_bytes_search_expression(pattern, settings):
+    """
+    Returns the compiled regular expression matching given pattern **UTF-8** encoded bytes using given settings.
+
+    Only **ASCII** case folding is available and whole word matches only check the **ASCII** word characters
+    around the occurrences, :func:`is_mapping_whole_word` definition checks the non **ASCII** ones.
+    None is returned for regular expressions, which would match bytes instead of characters,
+    and for case insensitive non **ASCII** patterns.
+
+    :param pattern: Pattern.
+    :type pattern: unicode
+    :param settings: Search settings.
+    :type settings: dict
+    :return: Regular expression.
+    :rtype: RegexObject
+    """
+
+    if settings.get("regular_expressions"):
+        return None
+
+    try:
+        pattern.encode("ascii")
+    except UnicodeEncodeError:
+        if not settings.get("case_sensitive"):
+            return None
+
+    flags = re.MULTILINE
+    if not settings.get("case_sensitive"):
+        flags = flags | re.IGNORECASE
+
+    expression = re.escape(pattern.encode("utf-8"))
+    if settings.get("whole_word"):
+        expression = br"(?<!\w)(?:" + expression + br")(?!\w)"
+    return re.compile(expression, flags)
+
+
+def get_lines_offsets(content):
+    """
+    Returns given content lines start offsets.
+
+    :param content: Content.
+    :type content: unicode
+    :return: Lines offsets.
+    :rtype: list
+    """
+
+    offsets = [0]
+    position = content.find("\n")
+    while position != -1:
+        offsets.append(position + 1)
+        position = content.find("\n", position + 1)
+    return offsets
+
+
+def get_utf16_positions(content, positions):
+    """
+    Returns given content characters positions as **UTF-16** code units positions,
+    as used by `QTextDocument <http://doc.qt.nokia.com/qtextdocument.html>`_ class.
+
+    :param content: Content.
+    :type content: unicode
+    :param positions: Characters positions.
+    :type positions: list
+    :return: **UTF-16** code units positions.
+    :rtype: list
+    """
+
+    if ASTRAL_CHARACTER is None:
+        return list(positions)
+
+    astral_positions = [match.start() for match in ASTRAL_CHARACTER.finditer(content)]
+    return [position + bisect.bisect_left(astral_positions, position) for position in positions]
+
+
+def search_content(content, expression, deadline=None):
+    """
+    Searches for given regular expression occurrences in given content.
+
+    The deadline is checked between the matches: a single match attempt cannot be interrupted.
+
+    :param content: Content.
+    :type content: unicode
+    :param expression: Regular expression.
+    :type expression: RegexObject
+    :param deadline: Time after which the search is abandoned.
+    :type deadline: float
+    :return: Matched occurrences as (line, column, length, position, text) tuples,
+        None if the deadline has been exceeded.
+    :rtype: list
+    """
+
+    occurrences = []
+    offsets = None
+    for match in expression.finditer(content):
+        if deadline is not None and time.time() > deadline:
+            return None
+
+        position, end = match.span()
+        length = end - position
+        if not length:
+            continue
+
+        if offsets is None:
+            offsets = get_lines_offsets(content)
+
+        line = bisect.bisect_right(offsets, position) - 1
+        line_start = offsets[line]
+        line_end = offsets[line + 1] - 1 if line + 1 < len(offsets) else len(content)
+        occurrences.append((line,
+                            position - line_start,
+                            length,
+                            position,
+                            content[line_start:line_end].rstrip("\r")))
+    return occurrences
+
+
+def is_backtracking_expression(expression):
+    """
+    Returns if given regular expression can backtrack catastrophically: it nests repeats, repeats alternations
+    or uses backreferences. Such an expression matching cannot be bounded in time within the current process.
+
+    :param expression: Regular expression.
+    :type expression: RegexObject
+    :return: Is expression backtracking.
+    :rtype: bool
+    """
+
+    def is_backtracking(subpattern, repeated=False):
+        for operator, value in subpattern:
+            if operator in (sre_constants.GROUPREF, sre_constants.GROUPREF_EXISTS):
+                return True
+            elif operator in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+                minimum, maximum, item = value
+                if maximum > 1 and repeated:
+                    return True
+                if is_backtracking(item, repeated or maximum > 1):
+                    return True
+            elif operator == sre_constants.BRANCH and repeated:
+                return True
+            else:
+                for item in value if type(value) in (tuple, list) else (value,):
+                    for item in item if type(item) in (tuple, list) else (item,):
+                        if isinstance(item, sre_parse.SubPattern) and is_backtracking(item, repeated):
+                            return True
+        return False
+
+    try:
+        return is_backtracking(sre_parse.parse(expression.pattern, expression.flags))
+    except (re.error, RuntimeError):
+        return True
+
+
+def get_patterns_automaton(patterns, settings):
+    """
+    Returns the Aho-Corasick automaton matching given literal patterns using given settings.
+
+    The automaton is returned as a (transitions, failures, outputs, first_characters) tuple: transitions and failures
+    are indexed by states, outputs are the (pattern index, pattern length) tuples recognized by each state and
+    first_characters is the regular expression used to skip the content that cannot start an occurence.
+
+    :param patterns: Literal patterns.
+    :type patterns: list
+    :param settings: Search settings.
+    :type settings: dict
+    :return: Automaton.
+    :rtype: tuple
+    """
+
+    transitions = [{}]
+    outputs = [[]]
+    for index, pattern in enumerate(patterns):
+        if not pattern:
+            continue
+
+        if not settings.get("case_sensitive"):
+            pattern = pattern.lower()
+
+        state = 0
+        for character in pattern:
+            next_state = transitions[state].get(character)
+            if next_state is None:
+                next_state = len(transitions)
+                transitions[state][character] = next_state
+                transitions.append({})
+                outputs.append([])
+            state = next_state
+        outputs[state].append((index, len(pattern)))
+
+    failures = [0] * len(transitions)
+    states = collections.deque(transitions[0].itervalues())
+    while states:
+        state = states.popleft()
+        for character, next_state in transitions[state].iteritems():
+            states.append(next_state)
+            failure = failures[state]
+            while failure and character not in transitions[failure]:
+                failure = failures[failure]
+            failures[next_state] = transitions[failure].get(character, 0)
+            outputs[next_state].extend(outputs[failures[next_state]])
+
+    first_characters = re.compile("[{0}]".format("".join(re.escape(character) for character in transitions[0])),
+                                  re.UNICODE) if transitions[0] else None
+    return transitions, failures, outputs, first_characters
+
+
+def search_content_patterns(content, automaton, patterns_count, settings):
+    """
+    Searches for given automaton patterns occurrences in given content in a single pass.
+
+    :param content: Content.
+    :type content: unicode
+    :param automaton: Automaton built by :func:`get_patterns_automaton` definition.
+    :type automaton: tuple
+    :param patterns_count: Automaton patterns count.
+    :type patterns_count: int
+    :param settings: Search settings.
+    :type settings: dict
+    :return: Matched occurrences as (line, column, length, position, text) tuples lists, one per pattern.
+    :rtype: list
+    """
+
+    transitions, failures, outputs, first_characters = automaton
+
+    occurrences = [[] for i in range(patterns_count)]
+    if first_characters is None:
+        return occurrences
+
+    text = content if settings.get("case_sensitive") else content.lower()
+    whole_word = settings.get("whole_word")
+
+    matches = []
+    ends = [0] * patterns_count
+    state = position = 0
+    size = len(text)
+    while position < size:
+        if not state:
+            match = first_characters.search(text, position)
+            if match is None:
+                break
+            position = match.start()
+
+        character = text[position]
+        while state and character not in transitions[state]:
+            state = failures[state]
+        state = transitions[state].get(character, 0)
+        position += 1
+
+        for index, length in outputs[state]:
+            start = position - length
+            if start < ends[index]:
+                continue
+
+            if whole_word and (start > 0 and WORD_CHARACTER.match(content[start - 1]) or
+                               position < size and WORD_CHARACTER.match(content[position])):
+                continue
+
+            ends[index] = position
+            matches.append((index, start, length))
+
+    offsets = matches and get_lines_offsets(content)
+    for index, start, length in matches:
+        line = bisect.bisect_right(offsets, start) - 1
+        line_start = offsets[line]
+        line_end = offsets[line + 1] - 1 if line + 1 < len(offsets) else len(content)
+        occurrences[index].append((line,
+                                   start - line_start,
+                                   length,
+                                   start,
+                                   content[line_start:line_end].rstrip("\r")))
+    return occurrences
+
+
+def is_refining_pattern(pattern, previous_pattern, settings):
+    """
+    Returns if given pattern occurrences are all found within given previous pattern occurrences lines
+    using given settings, in which case a search can be refined instead of being performed again.
+
+    :param pattern: Pattern.
+    :type pattern: unicode
+    :param previous_pattern: Previous pattern.
+    :type previous_pattern: unicode
+    :param settings: Search settings.
+    :type settings: dict
+    :return: Is pattern refining previous pattern.
+    :rtype: bool
+    """
+
+    if not pattern or not previous_pattern or settings.get("regular_expressions"):
+        return False
+
+    if "\n" in pattern or "\r" in pattern:
+        return False
+
+    if settings.get("whole_word") and not (re.match(r"\w", pattern[0], re.UNICODE) and
+                                               re.match(r"\w", pattern[-1], re.UNICODE)):
+        return False
+
+    return get_search_expression(previous_pattern, settings).search(pattern) is not None
+
+
+def refine_occurrences(occurrences, expression):
+    """
+    Searches for given regular expression occurrences in given occurrences lines.
+
+    :param occurrences: Occurrences as (line, column, length, position, text) tuples.
+    :type occurrences: list
+    :param expression: Regular expression.
+    :type expression: RegexObject
+    :return: Matched occurrences as (line, column, length, position, text) tuples.
+    :rtype: list
+    """
+
+    refined_occurrences = []
+    lines = set()
+    for line, column, length, position, text in occurrences:
+        if line in lines:
+            continue
+        lines.add(line)
+
+        line_start = position - column
+        for match in expression.finditer(text):
+            start, end = match.span()
+            if start == end:
+                continue
+
+            refined_occurrences.append((line, start, end - start, line_start + start, text))
+    return refined_occurrences
+
+
+def count_mapping(mapping, start, end):
+    """
+    Counts given memory mapped file bytes range lines and characters, scanning it by chunks.
+
+    :param mapping: Memory mapped file.
+    :type mapping: mmap
+    :param start: Range start.
+    :type start: int
+    :param end: Range end.
+    :type end: int
+    :return: Lines and characters count.
+    :rtype: tuple
+    """
+
+    lines = characters = 0
+    for i in xrange(start, end, CHUNK_SIZE):
+        chunk = mapping[i:min(i + CHUNK_SIZE, end)]
+        lines += chunk.count(b"\n")
+        characters += len(chunk.translate(None, CONTINUATION_BYTES))
+    return lines, characters
+
+
+def is_mapping_whole_word(mapping, start, end):
+    """
+    Returns if given memory mapped file bytes range is not surrounded by **Unicode** word characters.
+
+    :param mapping: Memory mapped file.
+    :type mapping: mmap
+    :param start: Range start.
+    :type start: int
+    :param end: Range end.
+    :type end: int
+    :return: Is range a whole word.
+    :rtype: bool
+    """
+
+    # A **UTF-8** character is at most 4 bytes long, truncated characters are ignored while decoding.
+    previous = mapping[max(0, start - 4):start].decode("utf-8", "ignore")
+    following = mapping[end:end + 4].decode("utf-8", "ignore")
+    return not (previous and WORD_CHARACTER.match(previous[-1]) or
+                following and WORD_CHARACTER.match(following[0]))
+
+
+def search_mapping(mapping, expression, whole_word=False):
+    """
+    Searches for given bytes regular expression occurrences in given memory mapped file.
+
+    Only the matched lines are decoded.
+
+    :param mapping: Memory mapped file.
+    :type mapping: mmap
+    :param expression: Bytes regular expression.
+    :type expression: RegexObject
+    :param whole_word: Occurrences surrounded by **Unicode** word characters are rejected.
+    :type whole_word: bool
+    :return: Matched occurrences as (line, column, length, position, text) tuples.
+    :rtype: list
+    """
+
+    occurrences = []
+    line = offset = position = 0
+    search_position = 0
+    while True:
+        match = expression.search(mapping, search_position)
+        if match is None:
+            break
+
+        start, end = match.span()
+        if start == end:
+            search_position = end + 1
+            continue
+
+        # A rejected occurrence can overlap the next one, the search resumes right after its start.
+        if whole_word and not is_mapping_whole_word(mapping, start, end):
+            search_position = start + 1
+            continue
+        search_position = end
+
+        line_start = mapping.rfind(b"\n", 0, start) + 1
+        line_end = mapping.find(b"\n", start)
+        if line_end == -1:
+            line_end = len(mapping)
+
+        lines, characters = count_mapping(mapping, offset, start)
+        line += lines
+        position += characters
+        offset = start
+
+        column = len(mapping[line_start:start].decode("utf-8", "ignore"))
+        occurrences.append((line,
+                            column,
+                            len(mapping[start:end].decode("utf-8", "ignore")),
+                            position,
+                            mapping[line_start:line_end].decode("utf-8", "ignore").rstrip("\r")))
+    return occurrences
+
+
+def search_file_mapping(file, expression, whole_word=False):
+    """
+    Searches for given bytes regular expression occurrences in given file using a memory mapping.
+
+    :param file: File.
+    :type file: unicode
+    :param expression: Bytes regular expression.
+    :type expression: RegexObject
+    :param whole_word: Occurrences surrounded by **Unicode** word characters are rejected.
+    :type whole_word: bool
+    :return: Matched occurrences as (line, column, length, position, text) tuples, None if binary or unmappable.
+    :rtype: list
+    """
+
+    try:
+        with open(file, "rb") as file_handle:
+            if not os.fstat(file_handle.fileno()).st_size:
+                return []
+
+            mapping = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except EnvironmentError as error:
+        LOGGER.warning("!> Error occured while mapping '{0}' file: '{1}'!".format(file, error))
+        return None
+
+    try:
+        if mapping.find(b"\0") != -1:
+            return None
+
+        return search_mapping(mapping, expression, whole_word)
+    finally:
+        mapping.close()
+
+
+def initialize_search_process():
+    """
+    Initializes a search processes pool child process: logging is disabled and the inherited handlers are dropped
+    without locking, a handler lock held by another thread of the parent process when it was forked would
+    otherwise deadlock the child process.
+    """
+
+    logging.disable(logging.CRITICAL)
+    for logger in [logging.root] + logging.Logger.manager.loggerDict.values():
+        if isinstance(logger, logging.Logger):
+            logger.handlers = []
+
+
+def search_files(files, pattern, settings, mapping_threshold=None, metrics=None):
+    """
+    Searches for given pattern occurrences in given files using given settings.
+
+    Files larger than given mapping threshold are searched using a memory mapping and their content is not returned.
+    Given a literal patterns list, all the patterns are matched in a single pass and
+    the occurrences are returned as one list per pattern.
+
+    :param files: Files.
+    :type files: list
+    :param pattern: Pattern or literal patterns.
+    :type pattern: unicode or list
+    :param settings: Search settings.
+    :type settings: dict
+    :param mapping_threshold: Size in bytes from which files are searched using a memory mapping.
+    :type mapping_threshold: int
+    :param metrics: Metrics updated with the searched files and bytes counts.
+    :type metrics: dict
+    :return: Matched files as (file, signature, content, occurrences) tuples.
+    :rtype: list
+    """
+
+    if type(pattern) is list:
+        automaton = get_patterns_automaton(pattern, settings)
+        expression = bytes_expression = None
+    else:
+        automaton = None
+        expression = get_search_expression(pattern, settings)
+        bytes_expression = mapping_threshold and get_bytes_search_expression(pattern, settings)
+
+    metrics = metrics if metrics is not None else {}
+    metrics.setdefault("files", 0)
+    metrics.setdefault("bytes", 0)
+
+    search_results = []
+    for file in files:
+        metrics["files"] += 1
+        signature = get_file_signature(file)
+        if signature is None:
+            continue
+
+        metrics["bytes"] += signature[1]
+        if bytes_expression and signature[1] >= mapping_threshold:
+            occurrences = search_file_mapping(file, bytes_expression, settings.get("whole_word"))
+            occurrences and search_results.append((file, signature, None, occurrences))
+            continue
+
+        if foundations.io.is_readable(file):
+            if foundations.io.is_binary_file(file):
+                continue
+
+        content = foundations.io.File(file).read()
+        if content is None:
+            LOGGER.warning("!> Error occured while reading '{0}' file proceeding to next one!".format(file))
+            continue
+
+        if automaton is None:
+            occurrences = search_content(content, expression)
+        else:
+            occurrences = search_content_patterns(content, automaton, len(pattern), settings)
+        any(occurrences) and search_results.append((file, signature, content, occurrences))
+    return search_results
+
+
+def search_files_with_metrics(files, pattern, settings, mapping_threshold=None):
+    """
+    Searches for given pattern occurrences in given files using given settings and returns the search metrics.
+
+    :param files: Files.
+    :type files: list
+    :param pattern: Pattern or literal patterns.
+    :type pattern: unicode or list
+    :param settings: Search settings.
+    :type settings: dict
+    :param mapping_threshold: Size in bytes from which files are searched using a memory mapping.
+    :type mapping_threshold: int
+    :return: Matched files as (file, signature, content, occurrences) tuples, searched files and bytes counts.
+    :rtype: tuple
+    """
+
+    metrics = {}
+    search_results = search_files(files, pattern, settings, mapping_threshold, metrics)
+    return search_results, metrics
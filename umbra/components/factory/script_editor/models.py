@@ -17,6 +17,7 @@
 
 from __future__ import unicode_literals
 
+import itertools
 import os
 import re
 from PyQt4.QtCore import QAbstractListModel
@@ -36,6 +37,7 @@ from umbra.components.factory.script_editor.nodes import DirectoryNode
 from umbra.components.factory.script_editor.nodes import EditorNode
 from umbra.components.factory.script_editor.nodes import FileNode
 from umbra.components.factory.script_editor.nodes import PatternNode
+from umbra.components.factory.script_editor.nodes import SearchOccurenceNode
 from umbra.ui.languages import Language
 
 __author__ = "Thomas Mansencal"
@@ -159,6 +161,10 @@ class ProjectsModel(umbra.ui.models.GraphModel):
 
         self.__default_project_node = None
 
+        self.__paths_nodes = {}
+        self.__nodes_paths = {}
+        self.__editors_nodes = {}
+
         ProjectsModel.__initialize_model(self)
 
     @property
@@ -247,6 +253,84 @@ class ProjectsModel(umbra.ui.models.GraphModel):
         self.enable_model_triggers(True)
         self.endResetModel()
 
+    def __index_node(self, node):
+        """
+        Indexes given Node by its editor or path.
+
+        :param node: Node.
+        :type node: EditorNode or FileNode or DirectoryNode or ProjectNode
+        """
+
+        if node.family == "Editor":
+            self.__editors_nodes.setdefault(node.editor, []).append(node)
+        else:
+            self.__paths_nodes.setdefault(node.path, []).append(node)
+            self.__nodes_paths[node] = node.path
+
+    def __unindex_node(self, node):
+        """
+        Removes given Node and its children from the indexes.
+
+        :param node: Node.
+        :type node: EditorNode or FileNode or DirectoryNode or ProjectNode
+        """
+
+        for indexed_node in itertools.chain((node,), foundations.walkers.nodes_walker(node)):
+            if indexed_node.family == "Editor":
+                key, index = indexed_node.editor, self.__editors_nodes
+            elif indexed_node in self.__nodes_paths:
+                key, index = self.__nodes_paths.pop(indexed_node), self.__paths_nodes
+            else:
+                continue
+
+            # Nodes equality is not based on identity, thus they are compared explicitly.
+            nodes = [candidate for candidate in index.get(key, ()) if candidate is not indexed_node]
+            if nodes:
+                index[key] = nodes
+            else:
+                index.pop(key, None)
+
+    def __get_indexed_nodes(self, index, key, family, node=None):
+        """
+        Returns the indexed Nodes with given key and family, optionally filtered to given Node descendants.
+
+        :param index: Index.
+        :type index: dict
+        :param key: Index key.
+        :type key: object
+        :param family: Nodes family.
+        :type family: unicode
+        :param node: Node the Nodes must descend from.
+        :type node: AbstractNode or AbstractCompositeNode or Object
+        :return: Nodes.
+        :rtype: list
+        """
+
+        nodes = [indexed_node for indexed_node in index.get(key, ()) if indexed_node.family == family]
+        if node is None or node is self.root_node:
+            return nodes
+
+        return [indexed_node for indexed_node in nodes
+                if any(parent_node is node
+                       for parent_node in foundations.walkers.nodes_walker(indexed_node, ascendants=True))]
+
+    def node_changed(self, node):
+        """
+        Reimplements the :meth:`umbra.ui.models.GraphModel.node_changed` method.
+
+        :param node: Node.
+        :type node: AbstractCompositeNode or GraphModelNode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if node in self.__nodes_paths and self.__nodes_paths[node] != node.path:
+            self.__unindex_node(node)
+            for indexed_node in itertools.chain((node,), foundations.walkers.nodes_walker(node)):
+                self.__index_node(indexed_node)
+
+        return umbra.ui.models.GraphModel.node_changed(self, node)
+
     def list_editor_nodes(self, node=None):
         """
         Returns the Model :class:`umbra.components.factory.script_editor.nodes.EditorNode` class nodes.
@@ -354,7 +438,7 @@ class ProjectsModel(umbra.ui.models.GraphModel):
         :rtype: list
         """
 
-        return [editor_node for editor_node in self.list_editor_nodes(node) if editor_node.editor == editor]
+        return self.__get_indexed_nodes(self.__editors_nodes, editor, "Editor", node or self.__default_project_node)
 
     def get_file_nodes(self, path, node=None):
         """
@@ -368,7 +452,7 @@ class ProjectsModel(umbra.ui.models.GraphModel):
         :rtype: list
         """
 
-        return [file_node for file_node in self.list_file_nodes(node) if file_node.path == path]
+        return self.__get_indexed_nodes(self.__paths_nodes, path, "File", node or self.__default_project_node)
 
     def get_directory_nodes(self, path):
         """
@@ -380,7 +464,7 @@ class ProjectsModel(umbra.ui.models.GraphModel):
         :rtype: list
         """
 
-        return [directory_node for directory_node in self.list_directory_nodes() if directory_node.path == path]
+        return self.__get_indexed_nodes(self.__paths_nodes, path, "Directory")
 
     def get_project_nodes(self, path):
         """
@@ -392,7 +476,7 @@ class ProjectsModel(umbra.ui.models.GraphModel):
         :rtype: list
         """
 
-        return [project_node for project_node in self.list_project_nodes() if project_node.path == path]
+        return self.__get_indexed_nodes(self.__paths_nodes, path, "Project")
 
     def move_node(self, parent, from_index, to_index):
         """
@@ -466,6 +550,7 @@ class ProjectsModel(umbra.ui.models.GraphModel):
                              path=file,
                              parent=parent)
         self.endInsertRows()
+        self.__index_node(file_node)
 
         self.file_registered.emit(file_node)
 
@@ -496,6 +581,7 @@ class ProjectsModel(umbra.ui.models.GraphModel):
         self.beginRemoveRows(self.get_node_index(parent), row, row)
         parent.remove_child(row)
         self.endRemoveRows()
+        self.__unindex_node(file_node)
 
         self.file_unregistered.emit(file_node)
 
@@ -529,6 +615,7 @@ class ProjectsModel(umbra.ui.models.GraphModel):
                                        path=directory,
                                        parent=parent)
         self.endInsertRows()
+        self.__index_node(directory_node)
 
         self.directory_registered.emit(directory_node)
 
@@ -560,6 +647,7 @@ class ProjectsModel(umbra.ui.models.GraphModel):
         self.beginRemoveRows(self.get_node_index(parent), row, row)
         parent.remove_child(row)
         self.endRemoveRows()
+        self.__unindex_node(directory_node)
 
         self.directory_unregistered.emit(directory_node)
 
@@ -592,6 +680,7 @@ class ProjectsModel(umbra.ui.models.GraphModel):
         editor_node = EditorNode(editor=editor,
                                  parent=parent)
         self.endInsertRows()
+        self.__index_node(editor_node)
 
         self.editor_registered.emit(editor_node)
 
@@ -623,6 +712,7 @@ class ProjectsModel(umbra.ui.models.GraphModel):
         self.beginRemoveRows(self.get_node_index(parent), row, row)
         parent.remove_child(row)
         self.endRemoveRows()
+        self.__unindex_node(editor_node)
 
         self.editor_unregistered.emit(editor_node)
 
@@ -654,6 +744,7 @@ class ProjectsModel(umbra.ui.models.GraphModel):
                                    path=path,
                                    parent=self.root_node)
         self.endInsertRows()
+        self.__index_node(project_node)
 
         self.project_registered.emit(project_node)
 
@@ -685,6 +776,7 @@ class ProjectsModel(umbra.ui.models.GraphModel):
         self.beginRemoveRows(self.get_node_index(parent), row, row)
         parent.remove_child(row)
         self.endRemoveRows()
+        self.__unindex_node(project_node)
 
         self.project_unregistered.emit(project_node)
 
@@ -838,6 +930,64 @@ class ProjectsModel(umbra.ui.models.GraphModel):
         self.unregister_project_nodes(node)
         self.set_project_nodes(node)
 
+    def register_project_entries(self, node, entries):
+        """
+        Registers given directory entries as given Node children, added directories children are registered too.
+
+        :param node: Node.
+        :type node: ProjectNode or DirectoryNode
+        :param entries: Entries paths.
+        :type entries: list
+        """
+
+        paths = set(child.path for child in node.children)
+        for path in sorted(entries):
+            if os.path.basename(path).startswith(".") or path in paths:
+                continue
+
+            if os.path.isdir(path):
+                directory_node = self.register_directory(path, node)
+                self.set_project_nodes(directory_node, 0)
+            elif os.path.isfile(path):
+                if foundations.io.is_readable(path):
+                    if foundations.io.is_binary_file(path):
+                        continue
+
+                self.register_file(path, node)
+
+    def unregister_project_entries(self, node, entries):
+        """
+        Unregisters given directory entries Nodes from given Node children.
+
+        :param node: Node.
+        :type node: ProjectNode or DirectoryNode
+        :param entries: Entries paths.
+        :type entries: list
+        """
+
+        entries = set(entries)
+        for child in [child for child in node.children if child.path in entries]:
+            if child.family == "Directory":
+                self.unregister_project_nodes(child)
+                self.unregister_directory(child)
+            elif child.family == "File":
+                self.unregister_file(child)
+
+    def update_project_entries(self, node, entries):
+        """
+        Updates given directory entries Nodes of given Node children.
+
+        :param node: Node.
+        :type node: ProjectNode or DirectoryNode
+        :param entries: Entries paths.
+        :type entries: list
+        """
+
+        entries = set(entries)
+        for child in node.children:
+            if child.path in entries:
+                self.node_changed(child)
+
 
 class LanguagesModel(QAbstractListModel):
     """
@@ -1158,6 +1308,159 @@ class SearchResultsModel(umbra.ui.models.GraphModel):
         umbra.ui.models.GraphModel.__init__(
             self, parent, root_node, horizontal_headers, vertical_headers, default_node)
 
+        # --- Setting class attributes. ---
+        self.__fetch_size = 256
+        self.__occurence_formatter = None
+
+    @property
+    def fetch_size(self):
+        """
+        Property for **self.__fetch_size** attribute.
+
+        :return: self.__fetch_size.
+        :rtype: int
+        """
+
+        return self.__fetch_size
+
+    @fetch_size.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def fetch_size(self, value):
+        """
+        Setter for **self.__fetch_size** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        if value is not None:
+            assert type(value) is int, "'{0}' attribute: '{1}' type is not 'int'!".format("fetch_size", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format(
+                "fetch_size", value)
+        self.__fetch_size = value
+
+    @fetch_size.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def fetch_size(self):
+        """
+        Deleter for **self.__fetch_size** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "fetch_size"))
+
+    @property
+    def occurence_formatter(self):
+        """
+        Property for **self.__occurence_formatter** attribute.
+
+        :return: self.__occurence_formatter.
+        :rtype: object
+        """
+
+        return self.__occurence_formatter
+
+    @occurence_formatter.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def occurence_formatter(self, value):
+        """
+        Setter for **self.__occurence_formatter** attribute.
+
+        :param value: Attribute value.
+        :type value: object
+        """
+
+        if value is not None:
+            assert hasattr(value, "__call__"), "'{0}' attribute: '{1}' is not callable!".format(
+                "occurence_formatter", value)
+        self.__occurence_formatter = value
+
+    @occurence_formatter.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def occurence_formatter(self):
+        """
+        Deleter for **self.__occurence_formatter** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "occurence_formatter"))
+
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Reimplements the :meth:`umbra.ui.models.GraphModel.data` method.
+
+        :class:`umbra.components.factory.script_editor.nodes.SearchOccurenceNode` class nodes display text
+        is formatted using the :attr:`SearchResultsModel.occurence_formatter` attribute when first requested.
+
+        :param index: Index.
+        :type index: QModelIndex
+        :param role: Role.
+        :type role: int
+        :return: Data.
+        :rtype: QVariant
+        """
+
+        if role in (Qt.DisplayRole, Qt.EditRole) and index.isValid() and self.__occurence_formatter is not None:
+            node = self.get_node(index)
+            if node.family == "SearchOccurence" and node.roles.get(role) is None:
+                text = self.__occurence_formatter(node)
+                node.roles.update({Qt.DisplayRole: text, Qt.EditRole: text})
+
+        return umbra.ui.models.GraphModel.data(self, index, role)
+
+    def hasChildren(self, parent=QModelIndex()):
+        """
+        Reimplements the :meth:`QAbstractItemModel.hasChildren` method.
+
+        :param parent: Parent.
+        :type parent: QModelIndex
+        :return: Has children.
+        :rtype: bool
+        """
+
+        return self.canFetchMore(parent) or self.rowCount(parent) > 0
+
+    def canFetchMore(self, parent):
+        """
+        Reimplements the :meth:`QAbstractItemModel.canFetchMore` method.
+
+        :param parent: Parent.
+        :type parent: QModelIndex
+        :return: Can fetch more.
+        :rtype: bool
+        """
+
+        node = self.get_node(parent)
+        return node.family == "SearchFile" and node.children_count() < len(node.occurrences)
+
+    def fetchMore(self, parent):
+        """
+        Reimplements the :meth:`QAbstractItemModel.fetchMore` method.
+
+        Creates the next batch of given :class:`umbra.components.factory.script_editor.nodes.SearchFileNode` class
+        node :class:`umbra.components.factory.script_editor.nodes.SearchOccurenceNode` class children nodes.
+
+        :param parent: Parent.
+        :type parent: QModelIndex
+        """
+
+        if not self.canFetchMore(parent):
+            return
+
+        node = self.get_node(parent)
+        start = node.children_count()
+        end = min(start + self.__fetch_size, len(node.occurrences))
+
+        LOGGER.debug("> Fetching '{0}' to '{1}' occurrences of '{2}' file.".format(start, end, node.file))
+
+        self.beginInsertRows(parent, start, end - 1)
+        for occurence in node.occurrences[start:end]:
+            search_occurence_node = SearchOccurenceNode(name="{0}".format(occurence.line + 1),
+                                                        parent=node,
+                                                        roles={Qt.DisplayRole: None})
+            search_occurence_node.update(occurence)
+        self.endInsertRows()
+
     def initialize_model(self, root_node):
         """
         Initializes the Model using given root node.
@@ -1176,6 +1479,32 @@ class SearchResultsModel(umbra.ui.models.GraphModel):
         self.endResetModel()
         return True
 
+    def append_nodes(self, nodes, parent=None):
+        """
+        Appends given nodes to given parent node in a single rows insertion.
+
+        :param nodes: Nodes to append.
+        :type nodes: list
+        :param parent: Parent node, the Model root node if not provided.
+        :type parent: AbstractCompositeNode or GraphModelNode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if not nodes:
+            return False
+
+        parent = parent or self.root_node
+
+        LOGGER.debug("> Appending '{0}' nodes.".format(len(nodes)))
+
+        row = parent.children_count()
+        self.beginInsertRows(self.get_node_index(parent), row, row + len(nodes) - 1)
+        for node in nodes:
+            parent.add_child(node)
+        self.endInsertRows()
+        return True
+
     def get_metrics(self):
         """
         Returns the Model metrics.
@@ -1184,12 +1513,23 @@ class SearchResultsModel(umbra.ui.models.GraphModel):
         :rtype: dict
         """
 
-        search_file_nodes_count = search_occurence_nodesCount = 0
+        search_pattern_nodes_count = search_file_nodes_count = search_occurence_nodesCount = skipped_nodes_count = 0
+
+        nodes = list(self.root_node.children)
+        while nodes:
+            node = nodes.pop()
+            if node.family == "SearchPattern":
+                search_pattern_nodes_count += 1
+                nodes.extend(node.children)
+            elif node.family == "SearchFile":
+                if node.get("skipped"):
+                    skipped_nodes_count += 1
+                    continue
 
-        for node in foundations.walkers.nodes_walker(self.root_node):
-            if node.family == "SearchFile":
                 search_file_nodes_count += 1
-            elif node.family == "SearchOccurence":
-                search_occurence_nodesCount += 1
+                search_occurence_nodesCount += len(node.occurrences)
 
-        return {"SearchFile": search_file_nodes_count, "SearchOccurence": search_occurence_nodesCount}
+        return {"SearchPattern": search_pattern_nodes_count,
+                "SearchFile": search_file_nodes_count,
+                "SearchOccurence": search_occurence_nodesCount,
+                "Skipped": skipped_nodes_count}
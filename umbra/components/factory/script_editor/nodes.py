@@ -38,6 +38,7 @@ __all__ = ["LOGGER",
            "DirectoryNode",
            "ProjectNode",
            "PatternNode",
+           "SearchPatternNode",
            "SearchFileNode",
            "SearchOccurenceNode",
            "ReplaceResultNode"]
@@ -474,6 +475,62 @@ class PatternNode(umbra.ui.nodes.GraphModelNode):
         pass
 
 
+class SearchPatternNode(umbra.ui.nodes.GraphModelNode):
+    """
+    Defines :class:`umbra.patterns.factory.script_editor.search_in_files.SearchInFiles` class
+    search pattern node.
+    """
+
+    __family = "SearchPattern"
+    """
+    :param __family: Node family.
+    :type __family: unicode
+    """
+
+    def __init__(self,
+                 name=None,
+                 parent=None,
+                 children=None,
+                 roles=None,
+                 node_flags=int(Qt.ItemIsSelectable | Qt.ItemIsEnabled),
+                 attributes_flags=int(Qt.ItemIsSelectable | Qt.ItemIsEnabled),
+                 **kwargs):
+        """
+        Initializes the class.
+
+        :param name: Node name.
+        :type name: unicode
+        :param parent: Node parent.
+        :type parent: GraphModelNode
+        :param children: Children.
+        :type children: list
+        :param roles: Roles.
+        :type roles: dict
+        :param node_flags: Node flags.
+        :type node_flags: int
+        :param attributes_flags: Attributes flags.
+        :type attributes_flags: int
+        :param \*\*kwargs: Keywords arguments.
+        :type \*\*kwargs: \*\*
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        umbra.ui.nodes.GraphModelNode.__init__(self, name, parent, children, roles, node_flags, **kwargs)
+
+        SearchPatternNode.__initialize_node(self, attributes_flags)
+
+    def __initialize_node(self, attributes_flags=int(Qt.ItemIsSelectable | Qt.ItemIsEnabled)):
+        """
+        Initializes the node.
+
+        :param attributes_flags: Attributes flags.
+        :type attributes_flags: int
+        """
+
+        pass
+
+
 class SearchFileNode(umbra.ui.nodes.GraphModelNode):
     """
     Defines :class:`umbra.patterns.factory.script_editor.search_in_files.SearchInFiles` class
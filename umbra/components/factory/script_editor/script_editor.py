@@ -1506,14 +1506,14 @@ class ScriptEditor(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
         self.__engine.timer.timeout.connect(self.__Script_Editor_Output_plainTextEdit_refresh_ui)
         self.__engine.content_dropped.connect(self.__engine__content_dropped)
         self.__engine.layouts_manager.layout_restored.connect(self.__engine_layouts_manager__layout_restored)
-        self.__engine.file_system_events_manager.file_changed.connect(
-            self.__engine_file_system_events_manager__file_changed)
-        self.__engine.file_system_events_manager.file_invalidated.connect(
-            self.__engine_file_system_events_manager__file_invalidated)
-        self.__engine.file_system_events_manager.directory_changed.connect(
-            self.__engine_file_system_events_manager__directory_changed)
-        self.__engine.file_system_events_manager.directory_invalidated.connect(
-            self.__engine_file_system_events_manager__directory_invalidated)
+        self.__engine.file_system_events_manager.paths_changed.connect(
+            self.__engine_file_system_events_manager__paths_changed)
+        self.__engine.file_system_events_manager.entries_added.connect(
+            self.__engine_file_system_events_manager__entries_added)
+        self.__engine.file_system_events_manager.entries_removed.connect(
+            self.__engine_file_system_events_manager__entries_removed)
+        self.__engine.file_system_events_manager.entries_modified.connect(
+            self.__engine_file_system_events_manager__entries_modified)
         self.Script_Editor_tabWidget.tabCloseRequested.connect(self.__Script_Editor_tabWidget__tabCloseRequested)
         self.Script_Editor_tabWidget.currentChanged.connect(self.__Script_Editor_tabWidget__currentChanged)
         self.Script_Editor_tabWidget.content_dropped.connect(self.__Script_Editor_tabWidget__content_dropped)
@@ -1957,60 +1957,86 @@ class ScriptEditor(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
 
         self.Editor_Status_editorStatus.setVisible(not self.isHidden())
 
-    def __engine_file_system_events_manager__file_changed(self, file):
+    def __engine_file_system_events_manager__paths_changed(self, paths):
         """
-        Defines the slot triggered by the **file_system_events_manager** when a file is changed.
+        Defines the slot triggered by the **file_system_events_manager** when a batch of paths
+        has been changed or invalidated.
 
-        :param file: File changed.
-        :type file: unicode
+        :param paths: Changed paths as (path, event) tuples.
+        :type paths: list
         """
 
-        file = foundations.strings.to_string(file)
-        self.search_in_files._SearchInFiles__uncache(file)
-        self.reload_file(file)
+        paths = [(foundations.strings.to_string(path), event) for path, event in paths]
+        self.search_in_files._SearchInFiles__uncache(
+            *[path for path, event in paths if event in ("file_changed", "file_invalidated")])
+
+        editors = dict((editor.file, editor) for editor in self.__model.list_editors())
+        invalidated_directories = set()
+        for path, event in paths:
+            if event == "directory_invalidated":
+                invalidated_directories.add(path)
+                continue
+
+            editor = editors.get(path)
+            if not editor:
+                continue
+
+            if event == "file_invalidated" or not foundations.common.path_exists(path):
+                editor.set_modified(True)
+            elif self.__has_editor_lock(editor):
+                self.__unlock_editor(editor)
+            else:
+                LOGGER.info("{0} | Reloading '{1}' file!".format(self.__class__.__name__, path))
+                editor.reload_file(True)
+
+        if not invalidated_directories:
+            return
+
+        for project_node in self.__model.list_project_nodes():
+            if project_node.path in invalidated_directories:
+                self.__model.unregister_project(project_node)
 
-    def __engine_file_system_events_manager__file_invalidated(self, file):
+    def __engine_file_system_events_manager__entries_added(self, directory, entries):
         """
-        Defines the slot triggered by the **file_system_events_manager** when a file is invalidated.
+        Defines the slot triggered by the **file_system_events_manager** when entries are added to a directory.
 
-        :param file: File changed.
-        :type file: unicode
+        :param directory: Directory changed.
+        :type directory: unicode
+        :param entries: Added entries.
+        :type entries: list
         """
 
-        file = foundations.strings.to_string(file)
-        self.search_in_files._SearchInFiles__uncache(file)
-        editor = self.get_editor(file)
-        editor and editor.set_modified(True)
+        entries = [foundations.strings.to_string(entry) for entry in entries]
+        for node in self.__get_directory_nodes(foundations.strings.to_string(directory)):
+            self.__model.register_project_entries(node, entries)
 
-    def __engine_file_system_events_manager__directory_changed(self, directory):
+    def __engine_file_system_events_manager__entries_removed(self, directory, entries):
         """
-        Defines the slot triggered by the **file_system_events_manager** when a directory is changed.
+        Defines the slot triggered by the **file_system_events_manager** when entries are removed from a directory.
 
         :param directory: Directory changed.
         :type directory: unicode
+        :param entries: Removed entries.
+        :type entries: list
         """
 
-        for project_node in self.__model.list_project_nodes():
-            if project_node.path == directory:
-                self.__model.update_project_nodes(project_node)
-            else:
-                for node in foundations.walkers.nodes_walker(project_node):
-                    if node.path == directory:
-                        self.__model.update_project_nodes(node)
-                        break
+        entries = [foundations.strings.to_string(entry) for entry in entries]
+        for node in self.__get_directory_nodes(foundations.strings.to_string(directory)):
+            self.__model.unregister_project_entries(node, entries)
 
-    def __engine_file_system_events_manager__directory_invalidated(self, directory):
+    def __engine_file_system_events_manager__entries_modified(self, directory, entries):
         """
-        Defines the slot triggered by the **file_system_events_manager** when a directory is invalidated.
+        Defines the slot triggered by the **file_system_events_manager** when a directory entries are modified.
 
-        :param directory: Directory invalidated.
+        :param directory: Directory changed.
         :type directory: unicode
+        :param entries: Modified entries.
+        :type entries: list
         """
 
-        for project_node in self.__model.list_project_nodes():
-            if project_node.path == directory:
-                self.__model.unregister_project(project_node)
-                break
+        entries = [foundations.strings.to_string(entry) for entry in entries]
+        for node in self.__get_directory_nodes(foundations.strings.to_string(directory)):
+            self.__model.update_project_entries(node, entries)
 
     def __script_editor__visibilityChanged(self, visibility):
         """
@@ -2042,7 +2068,12 @@ class ScriptEditor(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
         :type file_node: FileNode
         """
 
-        self.register_node_path(file_node)
+        # Projects files are polled with low priority until their directory is expanded or an editor loads them.
+        if self.__engine.file_system_events_manager.is_path_registered(
+                foundations.strings.to_string(file_node.path)):
+            return
+
+        self.register_node_path(file_node, "low")
 
     def __model__file_unregistered(self, file_node):
         """
@@ -2062,7 +2093,7 @@ class ScriptEditor(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
         :type directory_node: DirectoryNode
         """
 
-        self.register_node_path(directory_node)
+        self.register_node_path(directory_node, "low")
 
     def __model__directory_unregistered(self, directory_node):
         """
@@ -2082,7 +2113,7 @@ class ScriptEditor(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
         :type project_node: ProjectNode
         """
 
-        self.register_node_path(project_node)
+        self.register_node_path(project_node, "low")
 
     def __model__project_unregistered(self, project_node):
         """
@@ -2712,14 +2743,14 @@ class ScriptEditor(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
         Defines the slot triggered by an editor when file is loaded.
         """
 
-        self.register_node_path(self.sender())
+        self.register_node_path(self.sender(), "high")
 
     def __editor__file_saved(self):
         """
         Defines the slot triggered by an editor when file is saved.
         """
 
-        self.register_node_path(self.sender())
+        self.register_node_path(self.sender(), "high")
 
     def __editor__language_changed(self):
         """
@@ -2912,6 +2943,18 @@ class ScriptEditor(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
 
         delattr(editor, "__lock")
 
+    def __get_directory_nodes(self, directory):
+        """
+        Returns the Model project and directory Nodes with given path.
+
+        :param directory: Directory.
+        :type directory: unicode
+        :return: ProjectNode or DirectoryNode nodes.
+        :rtype: list
+        """
+
+        return self.__model.get_project_nodes(directory) + self.__model.get_directory_nodes(directory)
+
     def __get_untitled_file_name(self):
         """
         Returns an untitled file name.
@@ -2936,18 +2979,22 @@ class ScriptEditor(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
         LOGGER.debug("> Next untitled file name: '{0}'.".format(name))
         return name
 
-    def register_file(self, file):
+    def register_file(self, file, priority=None):
         """
         Registers given file in the **file_system_events_manager**.
 
         :param file: File.
         :type file: unicode
+        :param priority: File priority, an already registered file priority is only changed if given.
+        :type priority: unicode
         :return: Method success.
         :rtype: bool
         """
 
-        not self.__engine.file_system_events_manager.is_path_registered(file) and \
-        self.__engine.file_system_events_manager.register_path(file)
+        if self.__engine.file_system_events_manager.is_path_registered(file):
+            priority and self.__engine.file_system_events_manager.set_path_priority(file, priority)
+        else:
+            self.__engine.file_system_events_manager.register_path(file, priority=priority)
         return True
 
     def unregister_file(self, file):
@@ -2964,12 +3011,14 @@ class ScriptEditor(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
         self.__engine.file_system_events_manager.unregister_path(file)
         return True
 
-    def register_node_path(self, node):
+    def register_node_path(self, node, priority=None):
         """
         Registers given Node path in the **file_system_events_manager**.
 
         :param node: Node.
         :type node: FileNode or DirectoryNode or ProjectNode
+        :param priority: Node path priority.
+        :type priority: unicode
         :return: Method success.
         :rtype: bool
         """
@@ -2979,7 +3028,7 @@ class ScriptEditor(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
         if not foundations.common.path_exists(path):
             return False
 
-        return self.register_file(path)
+        return self.register_file(path, priority)
 
     def unregister_node_path(self, node):
         """
@@ -3372,7 +3421,7 @@ class ScriptEditor(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
             return True
 
     @foundations.exceptions.handle_exceptions(foundations.exceptions.FileExistsError)
-    def reload_file(self, file, is_modified=True):
+    def reload_file(self, file, is_modified=True, force=False):
         """
         Reloads given file **Script_Editor_tabWidget** Widget tab Model editor content.
 
@@ -3380,6 +3429,8 @@ class ScriptEditor(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
         :type file: unicode
         :param is_modified: File modified state.
         :type is_modified: bool
+        :param force: Reload the file even if its content is unchanged.
+        :type force: bool
         :return: Method success.
         :rtype: bool
         """
@@ -3397,7 +3448,7 @@ class ScriptEditor(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
             return True
 
         LOGGER.info("{0} | Reloading '{1}' file!".format(self.__class__.__name__, file))
-        return editor.reload_file(is_modified)
+        return editor.reload_file(is_modified, force)
 
     def save_file(self, file=None):
         """
@@ -3491,7 +3542,7 @@ class ScriptEditor(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
 
         file = editor.file
         LOGGER.info("{0} | Reverting '{1}' file!".format(self.__class__.__name__, file))
-        if self.reload_file(file, is_modified=False):
+        if self.reload_file(file, is_modified=False, force=True):
             return True
 
     def close_file(self, file=None, leave_first_editor=True):
@@ -3604,9 +3655,10 @@ class ScriptEditor(QWidgetComponentFactory(ui_file=COMPONENT_UI_FILE)):
         :rtype: Editor
         """
 
-        for editor in self.__model.list_editors():
-            if editor.file == file:
-                return editor
+        for file_node in self.__model.get_file_nodes(file):
+            for editor_node in file_node.children:
+                if editor_node.family == "Editor" and editor_node.editor and editor_node.editor.file == file:
+                    return editor_node.editor
 
     def set_language(self, editor, language):
         """
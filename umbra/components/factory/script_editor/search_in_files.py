@@ -17,14 +17,19 @@
 from __future__ import unicode_literals
 
 import functools
+import hashlib
+import itertools
+import multiprocessing
 import os
 import sys
+import time
 
 if sys.version_info[:2] <= (2, 6):
     from ordereddict import OrderedDict
 else:
     from collections import OrderedDict
 from PyQt4.QtCore import QString
+from PyQt4.QtCore import QTimer
 from PyQt4.QtCore import Qt
 from PyQt4.QtGui import QAction
 from PyQt4.QtGui import QColor
@@ -34,22 +39,28 @@ from PyQt4.QtGui import QMenu
 from PyQt4.QtGui import QTextCursor
 from PyQt4.QtGui import QTextDocument
 
-import foundations.cache
+import foundations.data_structures
 import foundations.exceptions
 import foundations.strings
 import foundations.ui.common
 import foundations.verbose
 import umbra.ui.common
 import umbra.ui.nodes
-from foundations.io import File
+from umbra.components.factory.script_editor.caches import FilesCache
+from umbra.components.factory.script_editor.caches import SearchResultsCache
+from umbra.components.factory.script_editor.indexes import TrigramIndex
+from umbra.components.factory.script_editor.matchers import get_utf16_positions
+from umbra.components.factory.script_editor.matchers import is_refining_pattern
 from umbra.components.factory.script_editor.models import SearchResultsModel
 from umbra.components.factory.script_editor.nodes import ReplaceResultNode
 from umbra.components.factory.script_editor.nodes import SearchFileNode
-from umbra.components.factory.script_editor.nodes import SearchOccurenceNode
+from umbra.components.factory.script_editor.nodes import SearchPatternNode
 from umbra.components.factory.script_editor.search_and_replace import SearchAndReplace
 from umbra.components.factory.script_editor.search_and_replace import ValidationFilter
 from umbra.components.factory.script_editor.views import SearchResults_QTreeView
-from umbra.components.factory.script_editor.workers import CacheData
+from umbra.components.factory.script_editor.workers import EditorSnapshot
+from umbra.components.factory.script_editor.workers import Indexing_worker
+from umbra.components.factory.script_editor.workers import Replace_worker
 from umbra.components.factory.script_editor.workers import Search_worker
 from umbra.globals.runtime_globals import RuntimeGlobals
 from umbra.ui.delegates import RichText_QStyledItemDelegate
@@ -93,7 +104,8 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
         # --- Setting class attributes. ---
         self.__container = self.__script_editor = parent
 
-        self.__files_cache = foundations.cache.Cache()
+        self.__files_cache = FilesCache()
+        self.__search_results_cache = SearchResultsCache(path_watcher=self.__is_path_watched)
 
         self.__search_patterns_model = None
         self.__replace_with_patterns_model = None
@@ -122,6 +134,19 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
         self.__ignore_hidden_files = True
 
         self.__search_worker_thread = None
+        self.__search_processes = multiprocessing.cpu_count()
+        self.__search_request = None
+        self.__last_search = None
+
+        self.__live_search_timer = None
+        self.__live_search_delay = 250
+
+        self.__replace_worker_thread = None
+        self.__replace_results = None
+
+        self.__search_indexes = {}
+        self.__search_indexes_directory = os.path.join(self.__container.default_script_editor_directory, "indexes")
+        self.__indexing_worker_thread = None
 
         SearchInFiles.__initialize_ui(self)
 
@@ -199,7 +224,7 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
         Property for **self.__files_cache** attribute.
 
         :return: self.__files_cache.
-        :rtype: Cache
+        :rtype: FilesCache
         """
 
         return self.__files_cache
@@ -211,7 +236,7 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
         Setter for **self.__files_cache** attribute.
 
         :param value: Attribute value.
-        :type value: Cache
+        :type value: FilesCache
         """
 
         raise foundations.exceptions.ProgrammingError(
@@ -227,6 +252,40 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
         raise foundations.exceptions.ProgrammingError(
             "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "files_cache"))
 
+    @property
+    def search_results_cache(self):
+        """
+        Property for **self.__search_results_cache** attribute.
+
+        :return: self.__search_results_cache.
+        :rtype: SearchResultsCache
+        """
+
+        return self.__search_results_cache
+
+    @search_results_cache.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def search_results_cache(self, value):
+        """
+        Setter for **self.__search_results_cache** attribute.
+
+        :param value: Attribute value.
+        :type value: SearchResultsCache
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "search_results_cache"))
+
+    @search_results_cache.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def search_results_cache(self):
+        """
+        Deleter for **self.__search_results_cache** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "search_results_cache"))
+
     @property
     def search_patterns_model(self):
         """
@@ -833,6 +892,251 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
         raise foundations.exceptions.ProgrammingError(
             "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "search_worker_thread"))
 
+    @property
+    def search_processes(self):
+        """
+        Property for **self.__search_processes** attribute.
+
+        :return: self.__search_processes.
+        :rtype: int
+        """
+
+        return self.__search_processes
+
+    @search_processes.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def search_processes(self, value):
+        """
+        Setter for **self.__search_processes** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        if value is not None:
+            assert type(value) is int, "'{0}' attribute: '{1}' type is not 'int'!".format(
+                "search_processes", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format(
+                "search_processes", value)
+        self.__search_processes = value
+
+    @search_processes.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def search_processes(self):
+        """
+        Deleter for **self.__search_processes** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "search_processes"))
+
+    @property
+    def live_search_timer(self):
+        """
+        Property for **self.__live_search_timer** attribute.
+
+        :return: self.__live_search_timer.
+        :rtype: QTimer
+        """
+
+        return self.__live_search_timer
+
+    @live_search_timer.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def live_search_timer(self, value):
+        """
+        Setter for **self.__live_search_timer** attribute.
+
+        :param value: Attribute value.
+        :type value: QTimer
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "live_search_timer"))
+
+    @live_search_timer.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def live_search_timer(self):
+        """
+        Deleter for **self.__live_search_timer** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "live_search_timer"))
+
+    @property
+    def live_search_delay(self):
+        """
+        Property for **self.__live_search_delay** attribute.
+
+        :return: self.__live_search_delay.
+        :rtype: int
+        """
+
+        return self.__live_search_delay
+
+    @live_search_delay.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def live_search_delay(self, value):
+        """
+        Setter for **self.__live_search_delay** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        if value is not None:
+            assert type(value) is int, "'{0}' attribute: '{1}' type is not 'int'!".format("live_search_delay", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format(
+                "live_search_delay", value)
+        self.__live_search_delay = value
+
+    @live_search_delay.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def live_search_delay(self):
+        """
+        Deleter for **self.__live_search_delay** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "live_search_delay"))
+
+    @property
+    def replace_worker_thread(self):
+        """
+        Property for **self.__replace_worker_thread** attribute.
+
+        :return: self.__replace_worker_thread.
+        :rtype: QThread
+        """
+
+        return self.__replace_worker_thread
+
+    @replace_worker_thread.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def replace_worker_thread(self, value):
+        """
+        Setter for **self.__replace_worker_thread** attribute.
+
+        :param value: Attribute value.
+        :type value: QThread
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "replace_worker_thread"))
+
+    @replace_worker_thread.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def replace_worker_thread(self):
+        """
+        Deleter for **self.__replace_worker_thread** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "replace_worker_thread"))
+
+    @property
+    def search_indexes(self):
+        """
+        Property for **self.__search_indexes** attribute.
+
+        :return: self.__search_indexes.
+        :rtype: dict
+        """
+
+        return self.__search_indexes
+
+    @search_indexes.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def search_indexes(self, value):
+        """
+        Setter for **self.__search_indexes** attribute.
+
+        :param value: Attribute value.
+        :type value: dict
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "search_indexes"))
+
+    @search_indexes.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def search_indexes(self):
+        """
+        Deleter for **self.__search_indexes** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "search_indexes"))
+
+    @property
+    def search_indexes_directory(self):
+        """
+        Property for **self.__search_indexes_directory** attribute.
+
+        :return: self.__search_indexes_directory.
+        :rtype: unicode
+        """
+
+        return self.__search_indexes_directory
+
+    @search_indexes_directory.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def search_indexes_directory(self, value):
+        """
+        Setter for **self.__search_indexes_directory** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "search_indexes_directory"))
+
+    @search_indexes_directory.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def search_indexes_directory(self):
+        """
+        Deleter for **self.__search_indexes_directory** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "search_indexes_directory"))
+
+    @property
+    def indexing_worker_thread(self):
+        """
+        Property for **self.__indexing_worker_thread** attribute.
+
+        :return: self.__indexing_worker_thread.
+        :rtype: QThread
+        """
+
+        return self.__indexing_worker_thread
+
+    @indexing_worker_thread.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def indexing_worker_thread(self, value):
+        """
+        Setter for **self.__indexing_worker_thread** attribute.
+
+        :param value: Attribute value.
+        :type value: QThread
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "indexing_worker_thread"))
+
+    @indexing_worker_thread.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def indexing_worker_thread(self):
+        """
+        Deleter for **self.__indexing_worker_thread** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "indexing_worker_thread"))
+
     def show(self):
         """
         Reimplements the :meth:`QWidget.show` method.
@@ -865,6 +1169,7 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
         umbra.ui.common.set_window_default_icon(self)
 
         self.__model = SearchResultsModel(self)
+        self.__model.occurence_formatter = self.__format_search_occurence_node
         self.__delegate = RichText_QStyledItemDelegate(self)
 
         self.Search_Results_treeView.setParent(None)
@@ -903,7 +1208,20 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
 
         self.installEventFilter(ValidationFilter(self))
 
+        not foundations.common.path_exists(self.__search_indexes_directory) and \
+        os.makedirs(self.__search_indexes_directory)
+        self.__indexing_worker_thread = Indexing_worker(self)
+        self.__container.engine.worker_threads.append(self.__indexing_worker_thread)
+
+        self.__live_search_timer = QTimer(self)
+        self.__live_search_timer.setSingleShot(True)
+        self.__live_search_timer.setInterval(self.__live_search_delay)
+
         # Signals / Slots.
+        self.__container.model.project_registered.connect(self.__container_model__project_registered)
+        self.__container.model.project_unregistered.connect(self.__container_model__project_unregistered)
+        self.__container.engine.file_system_events_manager.paths_changed.connect(
+            self.__engine_file_system_events_manager__paths_changed)
         self.__view.selectionModel().selectionChanged.connect(self.__view_selectionModel__selectionChanged)
         self.__view.doubleClicked.connect(self.__view__doubleClicked)
         self.__search_patterns_model.pattern_inserted.connect(functools.partial(
@@ -912,6 +1230,9 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
             self.__patterns_model__pattern_inserted, self.Replace_With_comboBox))
         self.Search_pushButton.clicked.connect(self.__Search_pushButton__clicked)
         self.Close_pushButton.clicked.connect(self.__Close_pushButton__clicked)
+        self.Search_comboBox.editTextChanged.connect(self.__Search_comboBox__editTextChanged)
+        self.Live_Search_checkBox.stateChanged.connect(self.__Live_Search_checkBox__stateChanged)
+        self.__live_search_timer.timeout.connect(self.__live_search_timer__timeout)
 
     def __view_add_actions(self):
         """
@@ -944,7 +1265,8 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
         :rtype: bool
         """
 
-        all_nodes = filter(lambda x: x.family in ("SearchFile", "SearchOccurence"), self.__model.root_node.children)
+        all_nodes = filter(lambda x: x.family in ("SearchPattern", "SearchFile", "SearchOccurence"),
+                           self.__model.root_node.children)
         if all_nodes:
             return self.replace(all_nodes)
 
@@ -959,7 +1281,7 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
         """
 
         selected_nodes = filter(
-            lambda x: x.family in ("SearchFile", "SearchOccurence"), self.__view.get_selected_nodes())
+            lambda x: x.family in ("SearchPattern", "SearchFile", "SearchOccurence"), self.__view.get_selected_nodes())
         if selected_nodes:
             return self.replace(filter(lambda x: x.parent not in selected_nodes, selected_nodes))
 
@@ -1011,7 +1333,48 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
         :type checked: bool
         """
 
-        self.search()
+        if self.__search_worker_thread and self.__search_worker_thread.isRunning():
+            self.__interrupt_search()
+        else:
+            self.search()
+
+    def __Search_comboBox__editTextChanged(self, text):
+        """
+        Defines the slot triggered by **Search_comboBox** Widget when its text is edited.
+
+        :param text: Current text.
+        :type text: QString
+        """
+
+        if self.Live_Search_checkBox.isChecked():
+            self.__live_search_timer.setInterval(self.__live_search_delay)
+            self.__live_search_timer.start()
+
+    def __Live_Search_checkBox__stateChanged(self, state):
+        """
+        Defines the slot triggered by **Live_Search_checkBox** Widget when its state changed.
+
+        :param state: Checkbox state.
+        :type state: int
+        """
+
+        if not self.Live_Search_checkBox.isChecked():
+            self.__live_search_timer.stop()
+
+    def __live_search_timer__timeout(self):
+        """
+        Defines the slot triggered by :attr:`SearchInFiles.live_search_timer` attribute timer
+        once typing in **Search_comboBox** Widget paused.
+        """
+
+        self.__interrupt_search()
+
+        search_pattern = self.Search_comboBox.currentText()
+        if not search_pattern:
+            self.set_search_results([])
+            return
+
+        self.__search(search_pattern)
 
     def __Close_pushButton__clicked(self, checked):
         """
@@ -1039,6 +1402,8 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
         elif node.family in ("SearchFile", "ReplaceResult"):
             file = node.file
             occurence = None
+        else:
+            return
 
         self.__highlight_occurence(file, occurence)
 
@@ -1064,10 +1429,69 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
         elif node.family in ("SearchFile", "ReplaceResult"):
             file = node.file
             occurence = None
+        else:
+            return
 
         if self.__container.get_editor(file):
             self.__highlight_occurence(file, occurence)
 
+    def __search_worker_thread__resultsAvailable(self, search_results):
+        """
+        Defines the slot triggered by :attr:`SearchInFiles.grepWorkerThread` attribute worker thread
+        when a new batch of search results is available.
+
+        :param search_results: Search results batch.
+        :type search_results: list
+        """
+
+        if self.sender() is not self.__search_worker_thread:
+            return
+
+        self.add_search_results(search_results)
+
+    def __search_worker_thread__progressChanged(self, searched_files, files_count, searched_bytes, files_counted):
+        """
+        Defines the slot triggered by :attr:`SearchInFiles.grepWorkerThread` attribute worker thread
+        when the search progress changes.
+
+        :param searched_files: Searched files count.
+        :type searched_files: int
+        :param files_count: Files to search count, growing while the search location is walked.
+        :type files_count: int
+        :param searched_bytes: Searched bytes count.
+        :type searched_bytes: float
+        :param files_counted: Files to search count is final.
+        :type files_counted: bool
+        """
+
+        if self.sender() is not self.__search_worker_thread:
+            return
+
+        elapsed_time = time.time() - self.__search_request["start_time"]
+        throughput = searched_bytes / elapsed_time if elapsed_time > 0 else 0
+        if not files_counted:
+            self.__container.engine.set_processing_message(
+                "{0} {1}/{2}+ files, {3:.2f} MiB/s".format(self.__search_request["message"],
+                                                          searched_files,
+                                                          files_count,
+                                                          throughput / 1024 / 1024), warning=False)
+            return
+
+        if not files_count:
+            return
+
+        self.__container.engine.set_processing_progress(min(100, searched_files * 100 // files_count), 100,
+                                                        warning=False)
+
+        files_rate = searched_files / elapsed_time if elapsed_time > 0 else 0
+        message = "{0} {1}/{2} files, {3:.2f} MiB/s".format(self.__search_request["message"],
+                                                            searched_files,
+                                                            files_count,
+                                                            throughput / 1024 / 1024)
+        if files_rate:
+            message = "{0}, ETA {1}s".format(message, int((files_count - searched_files) / files_rate))
+        self.__container.engine.set_processing_message(message, warning=False)
+
     def __search_worker_thread__searchFinished(self, search_results):
         """
         Defines the slot triggered by :attr:`SearchInFiles.grepWorkerThread` attribute worker thread
@@ -1077,14 +1501,106 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
         :type search_results: list
         """
 
-        self.set_search_results(search_results)
+        if self.sender() is not self.__search_worker_thread:
+            return
 
+        self.Search_pushButton.setText("Search")
         self.__container.engine.stop_processing()
+        search_results = self.__search_request["cached_search_results"] + search_results
+        walked_directories = self.__search_request["walked_directories"]
+        if walked_directories is None:
+            walked_directories = sorted(self.__search_worker_thread.walked_directories)
+        if self.__search_worker_thread.budget_exceeded:
+            self.__container.engine.notifications_manager.warnify(
+                "{0} | Search time budget exceeded, search results are incomplete!".format(self.__class__.__name__))
+        else:
+            self.__search_results_cache.add_search_results(self.__search_request["key"],
+                                                           self.__search_request["parsed_location"],
+                                                           search_results,
+                                                           walked_directories)
+        self.__last_search = foundations.data_structures.Structure(search_results=search_results,
+                                                                   walked_directories=walked_directories,
+                                                                   signatures=SearchResultsCache.get_signatures(
+                                                                       search_results),
+                                                                   pattern=self.__search_request["pattern"],
+                                                                   settings=self.__search_request["settings"],
+                                                                   location=self.__search_request["location"])
+        LOGGER.debug("> Files cache metrics: '{0}'.".format(self.__files_cache.get_metrics()))
         metrics = self.__model.get_metrics()
         self.__container.engine.notifications_manager.notify(
             "{0} | '{1}' pattern occurence(s) found in '{2}' files!".format(self.__class__.__name__,
                                                                             metrics["SearchOccurence"],
                                                                             metrics["SearchFile"]))
+        metrics["Skipped"] and self.__container.engine.notifications_manager.warnify(
+            "{0} | '{1}' file(s) skipped!".format(self.__class__.__name__, metrics["Skipped"]))
+
+    def __replace_worker_thread__fileReplaced(self, file, count):
+        """
+        Defines the slot triggered by :attr:`SearchInFiles.replace_worker_thread` attribute worker thread
+        when a file has been processed.
+
+        :param file: Processed file.
+        :type file: unicode
+        :param count: Replaced occurrences count.
+        :type count: int
+        """
+
+        if count:
+            self.__uncache(file)
+            self.__search_results_cache.file_changed(file)
+            self.update_search_indexes(file)
+        self.__container.engine.step_processing()
+
+    def __replace_worker_thread__replaceFinished(self, replace_results):
+        """
+        Defines the slot triggered by :attr:`SearchInFiles.replace_worker_thread` attribute worker thread
+        when the replace is finished.
+
+        :param replace_results: Replace results.
+        :type replace_results: dict
+        """
+
+        self.__container.engine.stop_processing()
+        replace_results.update(self.__replace_results)
+        self.__set_replace_results(replace_results)
+
+    def __container_model__project_registered(self, project_node):
+        """
+        Defines the slot triggered by the **script_editor** Model when a project is registered.
+
+        :param project_node: Registered project ProjectNode.
+        :type project_node: ProjectNode
+        """
+
+        project_node.path and self.register_search_index(project_node.path)
+
+    def __container_model__project_unregistered(self, project_node):
+        """
+        Defines the slot triggered by the **script_editor** Model when a project is unregistered.
+
+        :param project_node: Unregistered project ProjectNode.
+        :type project_node: ProjectNode
+        """
+
+        project_node.path and self.unregister_search_index(project_node.path)
+
+    def __engine_file_system_events_manager__paths_changed(self, paths):
+        """
+        Defines the slot triggered by the **file_system_events_manager** when a batch of paths
+        has been changed or invalidated.
+
+        :param paths: Changed paths as (path, event) tuples.
+        :type paths: list
+        """
+
+        self.__last_search = None
+        for path, event in paths:
+            path = foundations.strings.to_string(path)
+            if event in ("file_changed", "file_invalidated"):
+                self.__search_results_cache.file_changed(path)
+            else:
+                self.__search_results_cache.directory_changed(path)
+            self.update_search_indexes(path)
 
     def __add_location(self, type, *args):
         """
@@ -1161,6 +1677,72 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
                         foundations.strings.to_string(metrics),
                         span_format.format("' occurence(s) replaced!")))
 
+    def __is_multiple_patterns_search(self):
+        """
+        Returns if the current search is performed for a literal patterns list.
+
+        :return: Is multiple patterns search.
+        :rtype: bool
+        """
+
+        return bool(self.__search_request) and type(self.__search_request["pattern"]) is list
+
+    def __get_search_pattern_node(self, pattern):
+        """
+        Returns the Model :class:`umbra.components.factory.script_editor.nodes.SearchPatternNode` class Node
+        grouping given pattern search results, the node is created if needed.
+
+        :param pattern: Pattern.
+        :type pattern: unicode
+        :return: SearchPatternNode.
+        :rtype: SearchPatternNode
+        """
+
+        for node in self.__model.root_node.children:
+            if node.family == "SearchPattern" and node.pattern == pattern:
+                return node
+
+        search_pattern_node = SearchPatternNode(name=pattern, pattern=pattern)
+        self.__model.append_nodes([search_pattern_node])
+        return search_pattern_node
+
+    def __get_search_file_node(self, search_result):
+        """
+        Returns the :class:`umbra.components.factory.script_editor.nodes.SearchFileNode` class Node
+        built from given search result.
+
+        :param search_result: Search result.
+        :type search_result: SearchResult
+        :return: SearchFileNode.
+        :rtype: SearchFileNode
+        """
+
+        if search_result.get("skipped"):
+            search_file_node = SearchFileNode(name="{0} (skipped: {1})".format(search_result.file,
+                                                                               search_result.skipped))
+        else:
+            search_file_node = SearchFileNode(name=search_result.file)
+        search_file_node.update(search_result)
+        search_file_node.line_number_width = \
+            max([self.__default_line_number_width] +
+                [len(foundations.strings.to_string(occurence.line)) for occurence in search_result.occurrences])
+        return search_file_node
+
+    def __format_search_occurence_node(self, node):
+        """
+        Formats given :class:`umbra.components.factory.script_editor.nodes.SearchOccurenceNode` class node
+        and returns the matching rich html text.
+
+        :param node: Node to format.
+        :type node: SearchOccurenceNode
+        :return: Rich text.
+        :rtype: unicode
+        """
+
+        formatter = "{{0:>{0}}}".format(node.parent.line_number_width)
+        return "{0}:{1}".format(formatter.format(node.line + 1).replace(" ", "&nbsp;"),
+                                self.__format_occurence(node))
+
     def __highlight_occurence(self, file, occurence):
         """
         Highlights given file occurence.
@@ -1208,26 +1790,50 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
         """
         Replaces given pattern occurrences in given document using given settings.
 
+        The occurrences characters positions are converted to the document **UTF-16** positions.
+
         :param document: Document.
         :type document: QTextDocument
+        :param occurrences: Occurrences.
+        :type occurrences: list
         :param replacement_pattern: Replacement pattern.
         :type replacement_pattern: unicode
         :return: Replaced occurrences count.
         :rtype: int
         """
 
+        occurrences = sorted(occurrences, key=lambda x: x.position)
+        content = foundations.strings.to_string(document.toPlainText())
+        starts = get_utf16_positions(content, [occurence.position for occurence in occurrences])
+        ends = get_utf16_positions(content, [occurence.position + occurence.length for occurence in occurrences])
+        replacement_length = len(replacement_pattern.encode("utf-16-le")) // 2
+
         cursor = QTextCursor(document)
         cursor.beginEditBlock()
         offset = count = 0
-        for occurence in sorted(occurrences, key=lambda x: x.position):
-            cursor.setPosition(offset + occurence.position, QTextCursor.MoveAnchor)
-            cursor.setPosition(offset + occurence.position + occurence.length, QTextCursor.KeepAnchor)
+        for start, end in zip(starts, ends):
+            cursor.setPosition(offset + start, QTextCursor.MoveAnchor)
+            cursor.setPosition(offset + end, QTextCursor.KeepAnchor)
             cursor.insertText(replacement_pattern)
-            offset += len(replacement_pattern) - occurence.length
+            offset += replacement_length - (end - start)
             count += 1
         cursor.endEditBlock()
         return count
 
+    def __set_replace_results(self, replace_results):
+        """
+        Sets the Model Nodes using given replace results and notifies the user.
+
+        :param replace_results: Replace results.
+        :type replace_results: dict
+        """
+
+        self.set_replace_results(replace_results)
+        self.__container.engine.notifications_manager.notify(
+            "{0} | '{1}' pattern occurence(s) replaced in '{2}' files!".format(self.__class__.__name__,
+                                                                               sum(replace_results.values()),
+                                                                               len(replace_results.keys())))
+
     def __get_settings(self):
         """
         Returns the current search and replace settings.
@@ -1240,6 +1846,59 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
                 "whole_word": self.Whole_Word_checkBox.isChecked(),
                 "regular_expressions": self.Regular_Expressions_checkBox.isChecked()}
 
+    def __get_editors_snapshots(self):
+        """
+        Returns the editors documents snapshots searched by the search worker thread
+        instead of the editors documents.
+
+        :return: Editors documents snapshots.
+        :rtype: dict
+        """
+
+        editors_snapshots = {}
+        for editor in self.__container.script_editor.list_editors():
+            document = editor.document()
+            editors_snapshots[editor.file] = EditorSnapshot(file=editor.file,
+                                                            content=foundations.strings.to_string(
+                                                                document.toPlainText()),
+                                                            revision=document.revision())
+        return editors_snapshots
+
+    def __get_refinable_search_results(self, pattern, settings, location):
+        """
+        Returns the last search results if a search for given pattern using given settings and location
+        can be performed by refining them, they are not refined if any of their files changed since
+        or if files could have been added to an unwatched directory.
+
+        :param pattern: Pattern.
+        :type pattern: unicode
+        :param settings: Search settings.
+        :type settings: dict
+        :param location: Location.
+        :type location: unicode
+        :return: Last search results.
+        :rtype: list
+        """
+
+        if not self.__last_search or type(pattern) is list:
+            return
+
+        if self.__last_search.settings != settings or self.__last_search.location != location:
+            return
+
+        if not is_refining_pattern(pattern, self.__last_search.pattern, settings):
+            return
+
+        if SearchResultsCache.get_changed_files(self.__last_search.signatures):
+            LOGGER.debug("> Last search results files changed, they cannot be refined!")
+            return
+
+        if not self.__search_results_cache.is_watched(self.__last_search.walked_directories):
+            LOGGER.debug("> Last search results location is not watched, they cannot be refined!")
+            return
+
+        return self.__last_search.search_results
+
     def __interrupt_search(self):
         """
         Interrupt the current search.
@@ -1249,31 +1908,102 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
             self.__search_worker_thread.quit()
             self.__search_worker_thread.wait()
             self.__container.engine.stop_processing(warning=False)
+        self.Search_pushButton.setText("Search")
 
-    def __cache(self, file, content, document):
+    def __is_path_watched(self, path):
         """
-        Caches given file.
+        Returns if given path is watched by the **file_system_events_manager**.
 
-        :param file: File to cache.
-        :type file: unicode
-        :param content: File content.
-        :type content: list
-        :param document: File document.
-        :type document: QTextDocument
+        :param path: Path.
+        :type path: unicode
+        :return: Is path watched.
+        :rtype: bool
         """
 
-        self.__files_cache.add_content(**{file: CacheData(content=content, document=document)})
+        return self.__container.engine.file_system_events_manager.is_path_registered(path)
 
-    def __uncache(self, file):
+    def __uncache(self, *files):
         """
-        Uncaches given file.
+        Uncaches given files.
 
-        :param file: File to uncache.
-        :type file: unicode
+        :param \*files: Files to uncache.
+        :type \*files: \*
+        """
+
+        files = [file for file in files if file in self.__files_cache]
+        files and self.__files_cache.remove_content(*files)
+
+    def register_search_index(self, directory):
+        """
+        Registers a search index for given directory and builds it in the background.
+
+        :param directory: Directory to index.
+        :type directory: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        directory = os.path.normpath(directory)
+        if directory in self.__search_indexes:
+            return False
+
+        LOGGER.debug("> Registering '{0}' directory search index.".format(directory))
+
+        file = os.path.join(self.__search_indexes_directory, "{0}.idx".format(
+            hashlib.md5(directory.encode("utf-8")).hexdigest()))
+        index = self.__search_indexes[directory] = TrigramIndex(directory,
+                                                                 file,
+                                                                 ("\\\.|/\.",) if self.__ignore_hidden_files else ())
+        return self.__indexing_worker_thread.add_request(index)
+
+    def unregister_search_index(self, directory):
+        """
+        Unregisters given directory search index.
+
+        :param directory: Indexed directory.
+        :type directory: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        directory = os.path.normpath(directory)
+        if not directory in self.__search_indexes:
+            return False
+
+        LOGGER.debug("> Unregistering '{0}' directory search index.".format(directory))
+
+        del self.__search_indexes[directory]
+        return True
+
+    def get_search_index(self, path):
+        """
+        Returns the built search index covering given path.
+
+        :param path: Path.
+        :type path: unicode
+        :return: Search index.
+        :rtype: TrigramIndex
+        """
+
+        path = foundations.strings.to_forward_slashes(path)
+        for index in self.__search_indexes.values():
+            if index.built and path in index:
+                return index
+
+    def update_search_indexes(self, path):
+        """
+        Updates the search indexes covering given path.
+
+        :param path: Changed path.
+        :type path: unicode
+        :return: Method success.
+        :rtype: bool
         """
 
-        if file in self.__files_cache:
-            self.__files_cache.remove_content(file)
+        path = foundations.strings.to_forward_slashes(path)
+        for index in self.__search_indexes.values():
+            path in index and self.__indexing_worker_thread.add_request(index, path)
+        return True
 
     def set_search_results(self, search_results):
         """
@@ -1286,24 +2016,39 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
         """
 
         root_node = umbra.ui.nodes.DefaultNode(name="InvisibleRootNode")
+        if self.__is_multiple_patterns_search():
+            self.__model.initialize_model(root_node)
+            self.add_search_results(search_results)
+            return True
+
         for search_result in search_results:
-            search_file_node = SearchFileNode(name=search_result.file,
-                                              parent=root_node)
-            search_file_node.update(search_result)
-            width = \
-                max(self.__default_line_number_width,
-                    max([len(foundations.strings.to_string(occurence.line)) for occurence in
-                         search_result.occurrences]))
-            for occurence in search_result.occurrences:
-                formatter = "{{0:>{0}}}".format(width)
-                name = "{0}:{1}".format(formatter.format(occurence.line + 1).replace(" ", "&nbsp;"),
-                                        self.__format_occurence(occurence))
-                search_occurence_node = SearchOccurenceNode(name=name,
-                                                            parent=search_file_node)
-                search_occurence_node.update(occurence)
+            root_node.add_child(self.__get_search_file_node(search_result))
         self.__model.initialize_model(root_node)
         return True
 
+    def add_search_results(self, search_results):
+        """
+        Appends given search results to the Model Nodes.
+
+        :param search_results: Search results.
+        :type search_results: list
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if not self.__is_multiple_patterns_search():
+            return self.__model.append_nodes([self.__get_search_file_node(search_result)
+                                              for search_result in search_results])
+
+        search_file_nodes = OrderedDict()
+        for search_result in search_results:
+            search_file_nodes.setdefault(search_result.pattern, []).append(
+                self.__get_search_file_node(search_result))
+
+        for pattern, nodes in search_file_nodes.iteritems():
+            self.__model.append_nodes(nodes, self.__get_search_pattern_node(pattern))
+        return True
+
     def set_replace_results(self, replace_results):
         """
         Sets the Model Nodes using given replace results.
@@ -1340,19 +2085,93 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
         SearchAndReplace.insert_pattern(search_pattern, self.__search_patterns_model)
         SearchAndReplace.insert_pattern(replacement_pattern, self.__replace_with_patterns_model)
 
-        location = umbra.ui.common.parse_location(
-            foundations.strings.to_string(self.Where_lineEdit.text()) or
-            self.__targets_format.format(self.__default_target))
-        self.__ignore_hidden_files and location.filters_out.append("\\\.|/\.")
+        return self.__search(search_pattern)
+
+    def __search(self, search_pattern):
+        """
+        Searchs user defined locations for given search pattern.
+
+        Cached search results are displayed at once and only their changed files are searched again,
+        otherwise the last search results are refined when the search pattern narrows the last search pattern.
+
+        :param search_pattern: Search pattern.
+        :type search_pattern: unicode
+        :return: Method success.
+        :rtype: bool
+        """
 
+        search_pattern = foundations.strings.to_string(search_pattern)
         settings = self.__get_settings()
+        if self.Multiple_Patterns_checkBox.isChecked() and not settings["regular_expressions"]:
+            search_pattern = list(OrderedDict.fromkeys(pattern for pattern in search_pattern.split("|") if pattern))
+            if not search_pattern:
+                return False
+
+        where = foundations.strings.to_string(self.Where_lineEdit.text()) or \
+                self.__targets_format.format(self.__default_target)
+        location = umbra.ui.common.parse_location(where)
+        self.__ignore_hidden_files and location.filters_out.append("\\\.|/\.")
 
-        self.__search_worker_thread = Search_worker(self, search_pattern, location, settings)
+        key = SearchResultsCache.get_key(search_pattern, settings, location)
+        self.__search_request = {"pattern": search_pattern,
+                                 "settings": settings,
+                                 "location": where,
+                                 "key": key,
+                                 "parsed_location": location,
+                                 "cached_search_results": [],
+                                 "walked_directories": None,
+                                 "message": None,
+                                 "start_time": time.time()}
+
+        editors_snapshots = self.__get_editors_snapshots() if self.__default_target in location.targets else {}
+
+        search_location = location
+        previous_search_results = None
+        cache_entry = self.__search_results_cache.get_search_results(key)
+        if cache_entry is not None:
+            editors_files = set(foundations.strings.to_forward_slashes(file) for file in editors_snapshots) \
+                if self.__default_target in location.targets else set()
+            changed_files = set(cache_entry.changed_files).difference(editors_files)
+            rescanned_files = changed_files.union(editors_files)
+            self.__search_request["cached_search_results"] = [search_result
+                                                              for search_result in cache_entry.search_results
+                                                              if foundations.strings.to_forward_slashes(
+                                                                  search_result.file) not in rescanned_files]
+            search_location = umbra.ui.common.Location(directories=[],
+                                                       files=sorted(changed_files),
+                                                       filters_in=location.filters_in,
+                                                       filters_out=location.filters_out,
+                                                       targets=location.targets)
+            self.__search_request["walked_directories"] = cache_entry.watched_paths
+            LOGGER.debug("> Using cached search results, searching '{0}' changed files.".format(len(changed_files)))
+        else:
+            previous_search_results = self.__get_refinable_search_results(search_pattern, settings, where)
+            if previous_search_results is not None:
+                self.__search_request["walked_directories"] = self.__last_search.walked_directories
+
+        self.__search_worker_thread = Search_worker(self,
+                                                    search_pattern,
+                                                    search_location,
+                                                    settings,
+                                                    self.__search_processes,
+                                                    previous_search_results,
+                                                    editors_snapshots)
         # Signals / Slots.
+        self.__search_worker_thread.resultsAvailable.connect(self.__search_worker_thread__resultsAvailable)
+        self.__search_worker_thread.progressChanged.connect(self.__search_worker_thread__progressChanged)
         self.__search_worker_thread.searchFinished.connect(self.__search_worker_thread__searchFinished)
 
+        self.set_search_results(self.__search_request["cached_search_results"])
+        self.Search_pushButton.setText("Stop")
+
         self.__container.engine.worker_threads.append(self.__search_worker_thread)
-        self.__container.engine.start_processing("Searching In Files ...")
+        if cache_entry is not None:
+            self.__search_request["message"] = "Updating Cached Search Results ..."
+        elif previous_search_results is not None:
+            self.__search_request["message"] = "Refining Search Results ..."
+        else:
+            self.__search_request["message"] = "Searching In Files ..."
+        self.__container.engine.start_processing(self.__search_request["message"])
         self.__search_worker_thread.start()
         return True
 
@@ -1360,47 +2179,82 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
         """
         Replaces user defined files search pattern occurrences with replacement pattern using given nodes.
 
+        Files opened in editors are replaced within their documents, other files are rewritten
+        on disk by a :class:`umbra.components.factory.script_editor.workers.Replace_worker` class worker thread.
+
         :param nodes: Nodes.
         :type nodes: list
         :return: Method success.
         :rtype: bool
         """
 
+        if self.__replace_worker_thread and self.__replace_worker_thread.isRunning():
+            self.__container.engine.notifications_manager.warnify(
+                "{0} | A replace is already in progress!".format(self.__class__.__name__))
+            return False
+
         files = {}
-        for node in nodes:
+        for node in itertools.chain(*[node.children if node.family == "SearchPattern" else [node] for node in nodes]):
+            if node.get("skipped"):
+                continue
+
             if node.family == "SearchFile":
-                files[node.file] = node.children
+                files[node.file] = (node, node.occurrences)
             elif node.family == "SearchOccurence":
                 file = node.parent.file
                 if not file in files:
-                    files[file] = []
-                files[file].append(node)
+                    files[file] = (node.parent, [])
+                files[file][1].append(node)
+
+        if len(set(file_node.pattern for file_node, occurrences in files.itervalues())) > 1:
+            self.__container.engine.notifications_manager.warnify(
+                "{0} | Occurrences of multiple patterns cannot be replaced at once!".format(self.__class__.__name__))
+            return False
 
         replacement_pattern = self.Replace_With_comboBox.currentText()
         SearchAndReplace.insert_pattern(replacement_pattern, self.__replace_with_patterns_model)
 
+        self.__interrupt_search()
+        self.__last_search = None
+
         replace_results = {}
-        for file, occurrences in files.iteritems():
+        pattern = settings = None
+        files_occurrences = {}
+        for file, (file_node, occurrences) in files.iteritems():
             editor = self.__container.get_editor(file)
             if editor:
-                document = editor.document()
-            else:
-                cache_data = self.__files_cache.get_content(file)
-                if cache_data is None:
-                    LOGGER.warning(
-                        "!> {0} | '{1}' file doesn't exists in files cache!".format(self.__class__.__name__, file))
+                revision = file_node.get("revision")
+                if revision is not None and revision != editor.document().revision():
+                    self.__container.engine.notifications_manager.warnify(
+                        "{0} | '{1}' file document changed since it has been searched, skipping it!".format(
+                            self.__class__.__name__, file))
                     continue
 
-                content = self.__files_cache.get_content(file).content
-                document = self.__get_document(content)
-                self.__cache(file, content, document)
-            replace_results[file] = self.__replace_within_document(document, occurrences, replacement_pattern)
+                replace_results[file] = self.__replace_within_document(editor.document(),
+                                                                       occurrences,
+                                                                       replacement_pattern)
+            else:
+                pattern, settings = file_node.pattern, file_node.settings
+                files_occurrences[file] = [(occurence.position, occurence.length) for occurence in occurrences]
+
+        if not files_occurrences:
+            self.__set_replace_results(replace_results)
+            return True
+
+        self.__replace_results = replace_results
+        self.__replace_worker_thread = Replace_worker(self,
+                                                      files_occurrences,
+                                                      pattern,
+                                                      settings,
+                                                      replacement_pattern)
+        # Signals / Slots.
+        self.__replace_worker_thread.fileReplaced.connect(self.__replace_worker_thread__fileReplaced)
+        self.__replace_worker_thread.replaceFinished.connect(self.__replace_worker_thread__replaceFinished)
 
-        self.set_replace_results(replace_results)
-        self.__container.engine.notifications_manager.notify(
-            "{0} | '{1}' pattern occurence(s) replaced in '{2}' files!".format(self.__class__.__name__,
-                                                                               sum(replace_results.values()),
-                                                                               len(replace_results.keys())))
+        self.__container.engine.worker_threads.append(self.__replace_worker_thread)
+        self.__container.engine.start_processing("Replacing In Files ...", len(files_occurrences))
+        self.__replace_worker_thread.start()
+        return True
 
     def save_files(self, nodes):
         """
@@ -1412,32 +2266,16 @@ class SearchInFiles(foundations.ui.common.QWidget_factory(ui_file=UI_FILE)):
         :rtype: bool
         """
 
-        metrics = {"Opened": 0, "Cached": 0}
+        saved = 0
         for node in nodes:
             file = node.file
-            if self.__container.get_editor(file):
-                if self.__container.save_file(file):
-                    metrics["Opened"] += 1
-                    self.__uncache(file)
-            else:
-                cache_data = self.__files_cache.get_content(file)
-                if cache_data is None:
-                    LOGGER.warning(
-                        "!> {0} | '{1}' file doesn't exists in files cache!".format(self.__class__.__name__, file))
-                    continue
+            if not self.__container.get_editor(file):
+                LOGGER.debug("> '{0}' file is not opened, replacements were written to disk.".format(file))
+                continue
 
-                if cache_data.document:
-                    file_handle = File(file)
-                    file_handle.content = [cache_data.document.toPlainText().toUtf8()]
-                    if file_handle.write():
-                        metrics["Cached"] += 1
-                        self.__uncache(file)
-                else:
-                    LOGGER.warning(
-                        "!> {0} | '{1}' file document doesn't exists in files cache!".format(self.__class__.__name__,
-                                                                                             file))
+            if self.__container.save_file(file):
+                saved += 1
+                self.__uncache(file)
 
         self.__container.engine.notifications_manager.notify(
-            "{0} | '{1}' opened file(s) and '{2}' cached file(s) saved!".format(self.__class__.__name__,
-                                                                                metrics["Opened"],
-                                                                                metrics["Cached"]))
+            "{0} | '{1}' opened file(s) saved!".format(self.__class__.__name__, saved))
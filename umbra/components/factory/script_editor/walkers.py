@@ -0,0 +1,390 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**walkers.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines the :class:`umbra.components.factory.script_editor.search_in_files.SearchInFiles` class
+    search locations walkers.
+
+**Others:**
+    The `scandir <https://pypi.python.org/pypi/scandir>`_ package is used when available
+    to retrieve directories entries types without extra system calls.
+"""
+
+from __future__ import unicode_literals
+
+import os
+import re
+import stat
+try:
+    from scandir import scandir
+except ImportError:
+    scandir = None
+
+import foundations.exceptions
+import foundations.strings
+import foundations.verbose
+from umbra.components.factory.script_editor.matchers import get_stat_signature
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER",
+           "UNPRUNABLE_FILTER_TOKENS",
+           "Filters",
+           "is_prunable_filter",
+           "list_directory",
+           "files_walker"]
+
+LOGGER = foundations.verbose.install_logger()
+
+UNPRUNABLE_FILTER_TOKENS = ("$", "\\Z", "(?=", "(?!")
+"""
+:param UNPRUNABLE_FILTER_TOKENS: Regex tokens that can make a filter match a directory path
+    without matching the paths below it.
+:type UNPRUNABLE_FILTER_TOKENS: tuple
+"""
+
+
+def is_prunable_filter(filter):
+    """
+    Returns if given regex filter out matching a directory path also matches every path below it,
+    in which case the whole directory can be skipped.
+
+    :param filter: Regex filter.
+    :type filter: unicode
+    :return: Is filter prunable.
+    :rtype: bool
+    """
+
+    return not any(token in filter for token in UNPRUNABLE_FILTER_TOKENS)
+
+
+class Filters(object):
+    """
+    Defines the compiled filters used to filter the search locations files.
+    """
+
+    def __init__(self, filters_in=None, filters_out=None, excluded_files=None, flags=0):
+        """
+        Initializes the class.
+
+        :param filters_in: Regex filters in list.
+        :type filters_in: tuple or list
+        :param filters_out: Regex filters out list.
+        :type filters_out: tuple or list
+        :param excluded_files: Files to exclude.
+        :type excluded_files: tuple or list
+        :param flags: Regex flags.
+        :type flags: int
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        # --- Setting class attributes. ---
+        self.__filters_in = [re.compile(filter, flags) for filter in filters_in or ()]
+        self.__filters_out = [re.compile(filter, flags) for filter in filters_out or ()]
+        self.__directories_filters_out = [re.compile(filter, flags) for filter in filters_out or ()
+                                          if is_prunable_filter(filter)]
+        self.__excluded_files = set(foundations.strings.to_forward_slashes(file) for file in excluded_files or ())
+
+    @property
+    def filters_in(self):
+        """
+        Property for **self.__filters_in** attribute.
+
+        :return: self.__filters_in.
+        :rtype: list
+        """
+
+        return self.__filters_in
+
+    @filters_in.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def filters_in(self, value):
+        """
+        Setter for **self.__filters_in** attribute.
+
+        :param value: Attribute value.
+        :type value: list
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "filters_in"))
+
+    @filters_in.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def filters_in(self):
+        """
+        Deleter for **self.__filters_in** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "filters_in"))
+
+    @property
+    def filters_out(self):
+        """
+        Property for **self.__filters_out** attribute.
+
+        :return: self.__filters_out.
+        :rtype: list
+        """
+
+        return self.__filters_out
+
+    @filters_out.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def filters_out(self, value):
+        """
+        Setter for **self.__filters_out** attribute.
+
+        :param value: Attribute value.
+        :type value: list
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "filters_out"))
+
+    @filters_out.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def filters_out(self):
+        """
+        Deleter for **self.__filters_out** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "filters_out"))
+
+    @property
+    def directories_filters_out(self):
+        """
+        Property for **self.__directories_filters_out** attribute.
+
+        :return: self.__directories_filters_out.
+        :rtype: list
+        """
+
+        return self.__directories_filters_out
+
+    @directories_filters_out.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def directories_filters_out(self, value):
+        """
+        Setter for **self.__directories_filters_out** attribute.
+
+        :param value: Attribute value.
+        :type value: list
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "directories_filters_out"))
+
+    @directories_filters_out.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def directories_filters_out(self):
+        """
+        Deleter for **self.__directories_filters_out** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "directories_filters_out"))
+
+    @property
+    def excluded_files(self):
+        """
+        Property for **self.__excluded_files** attribute.
+
+        :return: self.__excluded_files.
+        :rtype: set
+        """
+
+        return self.__excluded_files
+
+    @excluded_files.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def excluded_files(self, value):
+        """
+        Setter for **self.__excluded_files** attribute.
+
+        :param value: Attribute value.
+        :type value: set
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "excluded_files"))
+
+    @excluded_files.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def excluded_files(self):
+        """
+        Deleter for **self.__excluded_files** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "excluded_files"))
+
+    def filter_directory(self, directory):
+        """
+        Returns if given directory and the paths below it can be filtered in.
+
+        :param directory: Directory.
+        :type directory: unicode
+        :return: Is directory filtered in.
+        :rtype: bool
+        """
+
+        directory = "{0}/".format(foundations.strings.to_forward_slashes(directory).rstrip("/"))
+        for filter in self.__directories_filters_out:
+            if filter.search(directory):
+                return False
+        return True
+
+    def filter_file(self, file):
+        """
+        Returns if given file is filtered in.
+
+        :param file: File.
+        :type file: unicode
+        :return: Is file filtered in.
+        :rtype: bool
+        """
+
+        file = foundations.strings.to_forward_slashes(file)
+        if file in self.__excluded_files:
+            return False
+
+        if self.__filters_in:
+            for filter in self.__filters_in:
+                if filter.search(file):
+                    break
+            else:
+                return False
+
+        for filter in self.__filters_out:
+            if filter.search(file):
+                return False
+        return True
+
+    def filter_files(self, files):
+        """
+        Returns given files filtered in.
+
+        :param files: Files.
+        :type files: list
+        :return: Filtered in files.
+        :rtype: list
+        """
+
+        return [file for file in files if self.filter_file(file)]
+
+
+def list_directory(directory, signatures=False):
+    """
+    Lists given directory entries as (name, is_directory, is_file, is_link, signature) tuples.
+
+    The files signature is the one returned by
+    :func:`umbra.components.factory.script_editor.matchers.get_file_signature` definition. It is only
+    retrieved if **signatures** is set or if the entries had to be stated anyway to get their kind,
+    it is None otherwise.
+
+    :param directory: Directory.
+    :type directory: unicode
+    :param signatures: Retrieve the files signatures.
+    :type signatures: bool
+    :return: Directory entries.
+    :rtype: list
+    """
+
+    entries = []
+    if scandir is not None:
+        for entry in scandir(directory):
+            try:
+                is_file = entry.is_file()
+                signature = get_stat_signature(entry.stat()) if signatures and is_file else None
+                entries.append((entry.name, entry.is_dir(), is_file, entry.is_symlink(), signature))
+            except OSError:
+                continue
+        return entries
+
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        try:
+            status = os.lstat(path)
+            is_link = stat.S_ISLNK(status.st_mode)
+            if is_link:
+                status = os.stat(path)
+        except OSError:
+            continue
+        is_file = stat.S_ISREG(status.st_mode)
+        entries.append((name, stat.S_ISDIR(status.st_mode), is_file, is_link,
+                        get_stat_signature(status) if is_file else None))
+    return entries
+
+
+def files_walker(directory, filters=None, follow_links=False, walked_directories=None, signatures=False):
+    """
+    Defines a generator used to walk given directory files using given compiled filters.
+
+    Filtered out directories are not descended into. Symbolic links to directories are only descended into
+    when **follow_links** is set, in which case symbolic links cycles are skipped.
+
+    :param directory: Directory to recursively walk.
+    :type directory: unicode
+    :param filters: Compiled filters.
+    :type filters: Filters
+    :param follow_links: Descend into symbolic links to directories.
+    :type follow_links: bool
+    :param walked_directories: Set updated with the walked directories.
+    :type walked_directories: set
+    :param signatures: Yield (file, signature) tuples, the signature is retrieved while listing the directories.
+    :type signatures: bool
+    :return: File.
+    :rtype: unicode or tuple
+    """
+
+    filters = filters or Filters()
+
+    visited_directories = set()
+    directories = [(directory, os.path.realpath(directory) if follow_links else None)]
+    while directories:
+        directory, real_directory = directories.pop()
+        if follow_links:
+            if real_directory in visited_directories:
+                LOGGER.debug("> Skipping '{0}' already walked directory.".format(directory))
+                continue
+            visited_directories.add(real_directory)
+
+        try:
+            entries = list_directory(directory, signatures)
+        except OSError as error:
+            LOGGER.warning("!> Error occured while listing '{0}' directory: '{1}'!".format(directory, error))
+            continue
+
+        walked_directories is not None and walked_directories.add(directory)
+        children = []
+        for name, is_directory, is_file, is_link, signature in entries:
+            path = os.path.join(directory, name)
+            if is_directory:
+                if is_link and not follow_links:
+                    continue
+
+                if not filters.filter_directory(path):
+                    continue
+
+                real_path = None
+                if follow_links:
+                    real_path = os.path.realpath(path) if is_link else os.path.join(real_directory, name)
+                children.append((path, real_path))
+            elif is_file and filters.filter_file(path):
+                yield (path, signature) if signatures else path
+        directories.extend(reversed(children))
@@ -17,22 +17,43 @@
 
 from __future__ import unicode_literals
 
+import collections
+import ctypes
+import functools
 import itertools
+import multiprocessing
+import os
+import platform
+import shutil
+import tempfile
+import time
+
 from PyQt4.QtCore import QMutex
-from PyQt4.QtCore import QRegExp
 from PyQt4.QtCore import QString
 from PyQt4.QtCore import QThread
 from PyQt4.QtCore import pyqtSignal
-from PyQt4.QtGui import QTextCursor
-from PyQt4.QtGui import QTextDocument
 
 import foundations.common
 import foundations.data_structures
 import foundations.exceptions
 import foundations.io
+import foundations.strings
 import foundations.verbose
-import foundations.walkers
 import umbra.ui.common
+from umbra.components.factory.script_editor.matchers import get_bytes_search_expression
+from umbra.components.factory.script_editor.matchers import get_file_signature
+from umbra.components.factory.script_editor.matchers import get_patterns_automaton
+from umbra.components.factory.script_editor.matchers import get_search_expression
+from umbra.components.factory.script_editor.matchers import initialize_search_process
+from umbra.components.factory.script_editor.matchers import is_backtracking_expression
+from umbra.components.factory.script_editor.matchers import refine_occurrences
+from umbra.components.factory.script_editor.matchers import search_content
+from umbra.components.factory.script_editor.matchers import search_content_patterns
+from umbra.components.factory.script_editor.matchers import search_file_mapping
+from umbra.components.factory.script_editor.matchers import search_files_with_metrics
+from umbra.components.factory.script_editor.walkers import Filters
+from umbra.components.factory.script_editor.walkers import files_walker
+from umbra.globals.constants import Constants
 
 __author__ = "Thomas Mansencal"
 __copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
@@ -41,10 +62,92 @@ __maintainer__ = "Thomas Mansencal"
 __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
-__all__ = ["LOGGER", "Occurence", "SearchResult", "CacheData", "Search_worker"]
+__all__ = ["LOGGER",
+           "MOVEFILE_REPLACE_EXISTING",
+           "MOVEFILE_WRITE_THROUGH",
+           "get_file_newline",
+           "replace_file",
+           "Occurence",
+           "SearchResult",
+           "CacheData",
+           "EditorSnapshot",
+           "Search_worker",
+           "Replace_worker",
+           "Indexing_worker"]
 
 LOGGER = foundations.verbose.install_logger()
 
+MOVEFILE_REPLACE_EXISTING = 0x1
+"""
+:param MOVEFILE_REPLACE_EXISTING: Windows *MoveFileEx* flag replacing an existing destination file.
+:type MOVEFILE_REPLACE_EXISTING: int
+"""
+
+MOVEFILE_WRITE_THROUGH = 0x8
+"""
+:param MOVEFILE_WRITE_THROUGH: Windows *MoveFileEx* flag returning once the move is flushed to disk.
+:type MOVEFILE_WRITE_THROUGH: int
+"""
+
+
+def get_file_newline(file, size=65536):
+    """
+    Returns given file newline sequence, detected from its first bytes.
+
+    :param file: File.
+    :type file: unicode
+    :param size: Read bytes count.
+    :type size: int
+    :return: Newline sequence.
+    :rtype: unicode
+    """
+
+    with open(file, "rb") as file_handle:
+        data = file_handle.read(size)
+
+    if b"\r\n" in data:
+        return "\r\n"
+    elif b"\r" in data:
+        return "\r"
+    return "\n"
+
+
+def replace_file(source, target):
+    """
+    Replaces given target file with given source file.
+
+    The replacement is atomic through :func:`os.rename` on POSIX systems and through *MoveFileEx* on Windows.
+    Should *MoveFileEx* not be available, the target file is moved aside and restored if the source file
+    cannot be renamed: the replacement is then not atomic but the target file is never lost.
+
+    :param source: Source file.
+    :type source: unicode
+    :param target: Target file.
+    :type target: unicode
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    if platform.system() != "Windows" and platform.system() != "Microsoft":
+        os.rename(source, target)
+        return True
+
+    kernel32 = getattr(getattr(ctypes, "windll", None), "kernel32", None)
+    if kernel32 is not None:
+        if not kernel32.MoveFileExW(source, target, MOVEFILE_REPLACE_EXISTING | MOVEFILE_WRITE_THROUGH):
+            raise ctypes.WinError()
+        return True
+
+    backup_file = "{0}.bak".format(source)
+    os.rename(target, backup_file)
+    try:
+        os.rename(source, target)
+    except EnvironmentError:
+        os.rename(backup_file, target)
+        raise
+    os.remove(backup_file)
+    return True
+
 
 class Occurence(foundations.data_structures.Structure):
     """
@@ -73,7 +176,7 @@ class SearchResult(foundations.data_structures.Structure):
         """
         Initializes the class.
 
-        :param \*\*kwargs: file, pattern, settings, occurrences.
+        :param \*\*kwargs: file, pattern, settings, occurrences, revision.
         :type \*\*kwargs: dict
         """
 
@@ -91,7 +194,25 @@ class CacheData(foundations.data_structures.Structure):
         """
         Initializes the class.
 
-        :param \*\*kwargs: content, document.
+        :param \*\*kwargs: content, document, signature.
+        :type \*\*kwargs: dict
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        foundations.data_structures.Structure.__init__(self, **kwargs)
+
+
+class EditorSnapshot(foundations.data_structures.Structure):
+    """
+    Defines a storage object for the :class:`Search_worker` class editor document snapshot.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initializes the class.
+
+        :param \*\*kwargs: file, content, revision.
         :type \*\*kwargs: dict
         """
 
@@ -107,6 +228,22 @@ class Search_worker(QThread):
     """
 
     # Custom signals definitions.
+    resultsAvailable = pyqtSignal(list)
+    """
+    This signal is emited by the :class:`Search_worker` class when a new batch of search results is available.
+
+    :return: Search results batch.
+    :rtype: list
+    """
+
+    progressChanged = pyqtSignal(int, int, float, bool)
+    """
+    This signal is emited by the :class:`Search_worker` class when the search progress changes.
+
+    :return: Searched files count, files to search count, searched bytes count, files to search count is final.
+    :rtype: tuple
+    """
+
     searchFinished = pyqtSignal(list)
     """
     This signal is emited by the :class:`Search_worker` class when the search is finished.
@@ -115,12 +252,31 @@ class Search_worker(QThread):
     :rtype: list
     """
 
-    def __init__(self, parent, pattern=None, location=None, settings=None):
+    def __init__(self,
+                 parent,
+                 pattern=None,
+                 location=None,
+                 settings=None,
+                 processes=1,
+                 previous_search_results=None,
+                 editors_snapshots=None):
         """
         Initializes the class.
 
         :param parent: Object parent.
         :type parent: QObject
+        :param pattern: Pattern or literal patterns list to search for.
+        :type pattern: unicode or list
+        :param location: Location to search into.
+        :type location: Location
+        :param settings: Search settings.
+        :type settings: dict
+        :param processes: Search processes count, a value greater than 1 enables the processes pool search mode.
+        :type processes: int
+        :param previous_search_results: Previous search results to refine instead of searching the location.
+        :type previous_search_results: list
+        :param editors_snapshots: Editors documents snapshots taken by the main thread.
+        :type editors_snapshots: dict
         """
 
         LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
@@ -136,11 +292,37 @@ class Search_worker(QThread):
         self.location = location
         self.__settings = None
         self.settings = settings
+        self.__processes = None
+        self.processes = processes
+        self.__previous_search_results = None
+        self.previous_search_results = previous_search_results
+        self.__editors_snapshots = None
+        self.editors_snapshots = editors_snapshots
+
+        self.__chunk_size = 64
+        self.__pool_timeout = 0.1
+        self.__mapping_threshold = 16 * 1024 * 1024
+
+        self.__results_interval = 0.25
+
+        self.__inline_time_budget = 0.25
+        self.__file_time_budget = 5.0
+        self.__search_time_budget = 300.0
+        self.__search_start_time = None
+        self.__budget_exceeded = False
+        self.__walked_directories = set()
 
         self.__search_results = None
+        self.__pending_search_results = None
+        self.__pending_search_results_time = None
+
+        self.__files_count = 0
+        self.__files_counted = False
+        self.__searched_files = 0
+        self.__searched_bytes = 0
+        self.__progress_time = None
 
         self.__interrupt = False
-        self.__lock = QMutex()
 
     @property
     def container(self):
@@ -182,7 +364,7 @@ class Search_worker(QThread):
         Property for **self.__pattern** attribute.
 
         :return: self.__pattern.
-        :rtype: unicode
+        :rtype: unicode or list
         """
 
         return self.__pattern
@@ -194,12 +376,12 @@ class Search_worker(QThread):
         Setter for **self.__pattern** attribute.
 
         :param value: Attribute value.
-        :type value: unicode
+        :type value: unicode or list
         """
 
         if value is not None:
-            assert type(value) in (unicode, QString), \
-                "'{0}' attribute: '{1}' type is not 'unicode' or 'QString'!".format("pattern", value)
+            assert type(value) in (unicode, QString, list), \
+                "'{0}' attribute: '{1}' type is not 'unicode', 'QString' or 'list'!".format("pattern", value)
         self.__pattern = value
 
     @pattern.deleter
@@ -287,184 +469,1733 @@ class Search_worker(QThread):
             "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "settings"))
 
     @property
-    def search_results(self):
+    def processes(self):
         """
-        Property for **self.__search_results** attribute.
+        Property for **self.__processes** attribute.
 
-        :return: self.__search_results.
-        :rtype: list
+        :return: self.__processes.
+        :rtype: int
         """
 
-        return self.__search_results
+        return self.__processes
 
-    @search_results.setter
+    @processes.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def processes(self, value):
+        """
+        Setter for **self.__processes** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        if value is not None:
+            assert type(value) is int, "'{0}' attribute: '{1}' type is not 'int'!".format("processes", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format("processes", value)
+        self.__processes = value
+
+    @processes.deleter
     @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
-    def search_results(self, value):
+    def processes(self):
         """
-        Setter for **self.__search_results** attribute.
+        Deleter for **self.__processes** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "processes"))
+
+    @property
+    def chunk_size(self):
+        """
+        Property for **self.__chunk_size** attribute.
+
+        :return: self.__chunk_size.
+        :rtype: int
+        """
+
+        return self.__chunk_size
+
+    @chunk_size.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def chunk_size(self, value):
+        """
+        Setter for **self.__chunk_size** attribute.
 
         :param value: Attribute value.
-        :type value: list
+        :type value: int
+        """
+
+        if value is not None:
+            assert type(value) is int, "'{0}' attribute: '{1}' type is not 'int'!".format("chunk_size", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format("chunk_size", value)
+        self.__chunk_size = value
+
+    @chunk_size.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def chunk_size(self):
+        """
+        Deleter for **self.__chunk_size** attribute.
         """
 
         raise foundations.exceptions.ProgrammingError(
-            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "search_results"))
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "chunk_size"))
 
-    @search_results.deleter
+    @property
+    def mapping_threshold(self):
+        """
+        Property for **self.__mapping_threshold** attribute.
+
+        :return: self.__mapping_threshold.
+        :rtype: int
+        """
+
+        return self.__mapping_threshold
+
+    @mapping_threshold.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def mapping_threshold(self, value):
+        """
+        Setter for **self.__mapping_threshold** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        if value is not None:
+            assert type(value) is int, "'{0}' attribute: '{1}' type is not 'int'!".format("mapping_threshold", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format(
+                "mapping_threshold", value)
+        self.__mapping_threshold = value
+
+    @mapping_threshold.deleter
     @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
-    def search_results(self):
+    def mapping_threshold(self):
         """
-        Deleter for **self.__search_results** attribute.
+        Deleter for **self.__mapping_threshold** attribute.
         """
 
         raise foundations.exceptions.ProgrammingError(
-            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "search_results"))
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "mapping_threshold"))
 
-    def run(self):
+    @property
+    def editors_snapshots(self):
         """
-        Reimplements the :meth:`QThread.run` method.
+        Property for **self.__editors_snapshots** attribute.
+
+        :return: self.__editors_snapshots.
+        :rtype: dict
         """
 
-        self.__search()
+        return self.__editors_snapshots
 
-    def quit(self):
+    @editors_snapshots.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def editors_snapshots(self, value):
         """
-        Reimplements the :meth:`QThread.quit` method.
+        Setter for **self.__editors_snapshots** attribute.
+
+        :param value: Attribute value.
+        :type value: dict
         """
 
-        self.__interrupt = True
+        if value is not None:
+            assert type(value) is dict, "'{0}' attribute: '{1}' type is not 'dict'!".format("editors_snapshots", value)
+        self.__editors_snapshots = value
 
-        QThread.quit(self)
+    @editors_snapshots.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def editors_snapshots(self):
+        """
+        Deleter for **self.__editors_snapshots** attribute.
+        """
 
-    def __search(self):
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "editors_snapshots"))
+
+    @property
+    def inline_time_budget(self):
         """
-        Performs the search.
+        Property for **self.__inline_time_budget** attribute.
+
+        :return: self.__inline_time_budget.
+        :rtype: float
         """
 
-        self.__search_results = []
+        return self.__inline_time_budget
 
-        editorsFiles = self.__container.default_target in self.__location.targets and \
-                       [editor.file for editor in self.__container.script_editor.list_editors()] or []
-        self.__search_editors_files(editorsFiles)
+    @inline_time_budget.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def inline_time_budget(self, value):
+        """
+        Setter for **self.__inline_time_budget** attribute.
 
-        self.__search_files(self.__location.files)
+        :param value: Attribute value.
+        :type value: float
+        """
 
-        for directory in self.__location.directories:
-            if self.__interrupt:
-                return
+        if value is not None:
+            assert type(value) is float, "'{0}' attribute: '{1}' type is not 'float'!".format(
+                "inline_time_budget", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format(
+                "inline_time_budget", value)
+        self.__inline_time_budget = value
 
-            files_walker = foundations.walkers.files_walker(directory,
-                                                            self.__location.filters_in,
-                                                            list(itertools.chain(self.__location.filters_out,
-                                                                                 self.__location.files,
-                                                                                 editorsFiles)))
-            self.__search_files(files_walker)
+    @inline_time_budget.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def inline_time_budget(self):
+        """
+        Deleter for **self.__inline_time_budget** attribute.
+        """
 
-        not self.__interrupt and self.searchFinished.emit(self.__search_results)
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "inline_time_budget"))
 
-    def __search_editors_files(self, files):
+    @property
+    def file_time_budget(self):
         """
-        Searches in :class:`umbra.components.factory.script_editor.script_editor.ScriptEditor` class editors files.
+        Property for **self.__file_time_budget** attribute.
 
-        :param files: Editor files.
-        :type files: list
+        :return: self.__file_time_budget.
+        :rtype: float
         """
 
-        for file in files:
-            if self.__interrupt:
-                return
+        return self.__file_time_budget
 
-            if foundations.io.is_readable(file):
-                if foundations.io.is_binary_file(file):
-                    continue
+    @file_time_budget.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def file_time_budget(self, value):
+        """
+        Setter for **self.__file_time_budget** attribute.
 
-            LOGGER.info("{0} | Searching '{1}' file!".format(self.__class__.__name__, file))
-            editor = self.__container.script_editor.get_editor(file)
-            if not editor:
-                continue
+        :param value: Attribute value.
+        :type value: float
+        """
 
-            self.__lock.lock()
-            occurrences = self.__search_document(editor.document(), self.__pattern, self.__settings)
-            self.__lock.unlock()
-            occurrences and self.__search_results.append(SearchResult(file=file,
-                                                                      pattern=self.__pattern,
-                                                                      settings=self.__settings,
-                                                                      occurrences=occurrences))
+        if value is not None:
+            assert type(value) is float, "'{0}' attribute: '{1}' type is not 'float'!".format("file_time_budget", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format(
+                "file_time_budget", value)
+        self.__file_time_budget = value
 
-    def __search_files(self, files):
+    @file_time_budget.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def file_time_budget(self):
+        """
+        Deleter for **self.__file_time_budget** attribute.
         """
-        Searches in given files.
 
-        :param files: Files.
-        :type files: list
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "file_time_budget"))
+
+    @property
+    def search_time_budget(self):
         """
+        Property for **self.__search_time_budget** attribute.
 
-        for file in files:
-            if self.__interrupt:
-                return
+        :return: self.__search_time_budget.
+        :rtype: float
+        """
 
-            if not foundations.common.path_exists(file):
-                continue
+        return self.__search_time_budget
 
-            if foundations.io.is_readable(file):
-                if foundations.io.is_binary_file(file):
-                    continue
+    @search_time_budget.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def search_time_budget(self, value):
+        """
+        Setter for **self.__search_time_budget** attribute.
 
-            LOGGER.info("{0} | Searching '{1}' file!".format(self.__class__.__name__, file))
-            cache_data = self.__container.files_cache.get_content(file)
-            if not cache_data:
-                reader = foundations.io.File(file)
-                content = reader.read()
-                if content is None:
-                    LOGGER.warning("!> Error occured while reading '{0}' file proceeding to next one!".format(file))
-                    continue
-                self.__container.files_cache.add_content(**{file: CacheData(content=content, document=None)})
-            else:
-                content = cache_data.content
-            occurrences = self.__search_document(QTextDocument(QString(content)), self.__pattern, self.__settings)
-            occurrences and self.__search_results.append(SearchResult(file=file,
-                                                                      pattern=self.__pattern,
-                                                                      settings=self.__settings,
-                                                                      occurrences=occurrences))
+        :param value: Attribute value.
+        :type value: float
+        """
+
+        if value is not None:
+            assert type(value) is float, "'{0}' attribute: '{1}' type is not 'float'!".format(
+                "search_time_budget", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format(
+                "search_time_budget", value)
+        self.__search_time_budget = value
 
-    def __search_document(self, document, pattern, settings):
+    @search_time_budget.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def search_time_budget(self):
+        """
+        Deleter for **self.__search_time_budget** attribute.
         """
-        Searches for given pattern occurrences in given document using given settings.
 
-        :param document: Document.
-        :type document: QTextDocument
-        :param pattern: Pattern.
-        :type pattern: unicode
-        :param settings: Search settings.
-        :type settings: Structure
-        :return: Matched occurrences.
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "search_time_budget"))
+
+    @property
+    def budget_exceeded(self):
+        """
+        Property for **self.__budget_exceeded** attribute.
+
+        :return: self.__budget_exceeded.
+        :rtype: bool
+        """
+
+        return self.__budget_exceeded
+
+    @budget_exceeded.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def budget_exceeded(self, value):
+        """
+        Setter for **self.__budget_exceeded** attribute.
+
+        :param value: Attribute value.
+        :type value: bool
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "budget_exceeded"))
+
+    @budget_exceeded.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def budget_exceeded(self):
+        """
+        Deleter for **self.__budget_exceeded** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "budget_exceeded"))
+
+    @property
+    def walked_directories(self):
+        """
+        Property for **self.__walked_directories** attribute.
+
+        :return: self.__walked_directories.
+        :rtype: set
+        """
+
+        return self.__walked_directories
+
+    @walked_directories.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def walked_directories(self, value):
+        """
+        Setter for **self.__walked_directories** attribute.
+
+        :param value: Attribute value.
+        :type value: set
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "walked_directories"))
+
+    @walked_directories.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def walked_directories(self):
+        """
+        Deleter for **self.__walked_directories** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "walked_directories"))
+
+    @property
+    def previous_search_results(self):
+        """
+        Property for **self.__previous_search_results** attribute.
+
+        :return: self.__previous_search_results.
         :rtype: list
         """
 
-        pattern = settings.regular_expressions and QRegExp(pattern) or pattern
+        return self.__previous_search_results
 
-        flags = QTextDocument.FindFlags()
-        if settings.case_sensitive:
-            flags = flags | QTextDocument.FindCaseSensitively
-        if settings.whole_word:
-            flags = flags | QTextDocument.FindWholeWords
+    @previous_search_results.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def previous_search_results(self, value):
+        """
+        Setter for **self.__previous_search_results** attribute.
 
-        occurrences = []
-        block = document.findBlock(0)
-        cursor = document.find(pattern, block.position(), flags)
-        while block.isValid() and cursor.position() != -1:
-            if self.__interrupt:
-                return
+        :param value: Attribute value.
+        :type value: list
+        """
+
+        if value is not None:
+            assert type(value) is list, "'{0}' attribute: '{1}' type is not 'list'!".format(
+                "previous_search_results", value)
+        self.__previous_search_results = value
+
+    @previous_search_results.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def previous_search_results(self):
+        """
+        Deleter for **self.__previous_search_results** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "previous_search_results"))
+
+    @property
+    def search_results(self):
+        """
+        Property for **self.__search_results** attribute.
+
+        :return: self.__search_results.
+        :rtype: list
+        """
+
+        return self.__search_results
+
+    @search_results.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def search_results(self, value):
+        """
+        Setter for **self.__search_results** attribute.
+
+        :param value: Attribute value.
+        :type value: list
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "search_results"))
+
+    @search_results.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def search_results(self):
+        """
+        Deleter for **self.__search_results** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "search_results"))
+
+    def run(self):
+        """
+        Reimplements the :meth:`QThread.run` method.
+        """
+
+        self.__search()
+
+    def quit(self):
+        """
+        Reimplements the :meth:`QThread.quit` method.
+        """
+
+        self.__interrupt = True
+
+        QThread.quit(self)
+
+    def __search(self):
+        """
+        Performs the search.
+        """
+
+        self.__search_results = []
+        self.__pending_search_results = []
+        self.__pending_search_results_time = 0
+        self.__search_start_time = time.time()
+        self.__budget_exceeded = False
+        self.__walked_directories = set()
+        self.__files_count = 0
+        self.__files_counted = False
+        self.__searched_files = 0
+        self.__searched_bytes = 0
+        self.__progress_time = 0
+
+        if self.__previous_search_results is not None:
+            self.__refine_search_results(self.__previous_search_results)
+        else:
+            self.__search_location()
+
+        if self.__interrupt:
+            return
+
+        self.__flush_search_results(force=True)
+
+        elapsed_time = max(time.time() - self.__search_start_time, 1e-6)
+        LOGGER.info("{0} | Searched '{1}' files, '{2}' bytes in '{3:.3f}' seconds: '{4:.2f}' MiB/s!".format(
+            self.__class__.__name__,
+            self.__searched_files,
+            self.__searched_bytes,
+            elapsed_time,
+            self.__searched_bytes / elapsed_time / 1024 / 1024))
+
+        self.searchFinished.emit(self.__search_results)
+
+    def __search_location(self):
+        """
+        Searches the location.
+        """
+
+        editorsFiles = self.__container.default_target in self.__location.targets and \
+                       sorted(self.__editors_snapshots or ()) or []
+
+        filters = Filters(self.__location.filters_in,
+                          self.__location.filters_out,
+                          list(itertools.chain(self.__location.files, editorsFiles)))
+        files_walkers = [self.__location.files]
+        for directory in self.__location.directories:
+            files_walkers.append(self.__get_files_walker(directory, filters))
+
+        self.__files_count = len(editorsFiles)
+        self.__report_progress(force=True)
+        files = self.__get_counted_files(itertools.chain(*files_walkers))
+
+        if self.__settings.regular_expressions:
+            self.__search_files_guarded(itertools.chain(editorsFiles, files), editorsFiles)
+        elif self.__processes > 1:
+            self.__search_files_parallel(files, editorsFiles)
+        else:
+            self.__search_editors_files(editorsFiles)
+            self.__search_files(files)
+
+    def __refine_search_results(self, search_results):
+        """
+        Refines given previous search results: only their files lines are searched.
+
+        :param search_results: Previous search results.
+        :type search_results: list
+        """
+
+        LOGGER.debug("> Refining '{0}' previous search results.".format(len(search_results)))
+
+        self.__files_count = len(search_results)
+        self.__files_counted = True
+        self.__report_progress(force=True)
+
+        expression = get_search_expression(foundations.strings.to_string(self.__pattern), self.__settings)
+        for search_result in search_results:
+            if self.__interrupt:
+                return
+
+            self.__flush_search_results()
+
+            self.__searched_files += 1
+            snapshot = (self.__editors_snapshots or {}).get(search_result.file)
+            if snapshot is not None:
+                self.__searched_bytes += len(snapshot.content)
+                self.__add_occurrences(search_result.file,
+                                       search_content(snapshot.content, expression),
+                                       snapshot.revision)
+            else:
+                self.__add_occurrences(search_result.file, refine_occurrences(
+                    [(occurence.line, occurence.column, occurence.length, occurence.position, occurence.text)
+                     for occurence in search_result.occurrences], expression))
+
+    def __add_search_result(self, search_result):
+        """
+        Adds given search result to the search results and the pending search results batch.
+
+        :param search_result: Search result.
+        :type search_result: SearchResult
+        """
+
+        self.__search_results.append(search_result)
+        self.__pending_search_results.append(search_result)
+        self.__flush_search_results()
+
+    def __flush_search_results(self, force=False):
+        """
+        Emits the pending search results batch once the results interval has elapsed since the previous one.
+
+        :param force: Emit the pending search results batch regardless of the results interval.
+        :type force: bool
+        """
+
+        self.__report_progress(force)
+
+        if not self.__pending_search_results:
+            return
+
+        if not force and time.time() - self.__pending_search_results_time < self.__results_interval:
+            return
+
+        self.resultsAvailable.emit(self.__pending_search_results)
+        self.__pending_search_results = []
+        self.__pending_search_results_time = time.time()
+
+    def __report_progress(self, force=False):
+        """
+        Emits the search progress once the results interval has elapsed since the previous report.
+
+        :param force: Emit the search progress regardless of the results interval.
+        :type force: bool
+        """
+
+        if not force and time.time() - self.__progress_time < self.__results_interval:
+            return
+
+        self.progressChanged.emit(self.__searched_files,
+                                  self.__files_count,
+                                  float(self.__searched_bytes),
+                                  self.__files_counted)
+        self.__progress_time = time.time()
+
+    def __get_counted_files(self, files):
+        """
+        Defines a generator counting given files while they are searched,
+        the files to search count is final once they are exhausted.
+
+        :param files: Files.
+        :type files: iterable
+        :return: File.
+        :rtype: unicode
+        """
+
+        for file in files:
+            if self.__interrupt:
+                return
+
+            self.__files_count += 1
+            yield file
+
+        self.__files_counted = True
+        self.__report_progress(force=True)
+
+    def __get_files_walker(self, directory, filters):
+        """
+        Returns the files to search into given directory, using the search indexes to narrow them when possible.
+
+        :param directory: Directory.
+        :type directory: unicode
+        :param filters: Compiled filters.
+        :type filters: Filters
+        :return: Files.
+        :rtype: generator
+        """
+
+        index = self.__container.get_search_index(directory)
+        if index is not None and set(index.filters_out).issubset(self.__location.filters_out):
+            candidates = self.__get_candidates(index)
+            if candidates is not None:
+                LOGGER.debug("> '{0}' directory search narrowed with '{1}' indexed candidate files.".format(
+                    directory, len(candidates)))
+                return self.__get_indexed_files_walker(directory, filters, index, set(candidates))
+
+        return files_walker(directory, filters, walked_directories=self.__walked_directories)
+
+    def __get_indexed_files_walker(self, directory, filters, index, candidates):
+        """
+        Defines a generator used to walk given directory files skipping the files given search index
+        is up to date with and that are not candidates: files not covered by the index or changed
+        since it was updated are always searched. The files signatures are retrieved while listing
+        the directories so that each file is only stated once.
+
+        :param directory: Directory.
+        :type directory: unicode
+        :param filters: Compiled filters.
+        :type filters: Filters
+        :param index: Search index.
+        :type index: TrigramIndex
+        :param candidates: Search index candidate files.
+        :type candidates: set
+        :return: File.
+        :rtype: unicode
+        """
+
+        for file, signature in files_walker(directory,
+                                            filters,
+                                            walked_directories=self.__walked_directories,
+                                            signatures=True):
+            if foundations.strings.to_forward_slashes(file) in candidates or \
+                    not index.is_up_to_date(file, signature):
+                yield file
+
+    def __get_candidates(self, index):
+        """
+        Returns given search index candidate files for the search pattern or patterns.
+
+        :param index: Search index.
+        :type index: TrigramIndex
+        :return: Candidate files, None if the index cannot narrow the search.
+        :rtype: list
+        """
+
+        if not self.__is_multiple_patterns():
+            return index.get_candidates(foundations.strings.to_string(self.__pattern), self.__settings)
+
+        candidates = set()
+        for pattern in self.__pattern:
+            pattern_candidates = index.get_candidates(pattern, self.__settings)
+            if pattern_candidates is None:
+                return None
+            candidates.update(pattern_candidates)
+        return sorted(candidates)
+
+    def __search_editors_files(self, files):
+        """
+        Searches in :class:`umbra.components.factory.script_editor.script_editor.ScriptEditor` class editors files
+        using their documents snapshots.
+
+        :param files: Editor files.
+        :type files: list
+        """
+
+        matcher = self.__get_matcher()
+        for file in files:
+            if self.__interrupt:
+                return
+
+            if foundations.io.is_readable(file):
+                if foundations.io.is_binary_file(file):
+                    continue
+
+            self.__flush_search_results()
+
+            self.__searched_files += 1
+            snapshot = (self.__editors_snapshots or {}).get(file)
+            if snapshot is None:
+                continue
+
+            LOGGER.info("{0} | Searching '{1}' file!".format(self.__class__.__name__, file))
+            self.__searched_bytes += len(snapshot.content)
+            self.__add_occurrences(file, self.__search_content(snapshot.content, matcher), snapshot.revision)
+
+    def __search_files(self, files):
+        """
+        Searches in given files.
+
+        :param files: Files.
+        :type files: list
+        """
+
+        matcher = self.__get_matcher()
+        bytes_expression = not self.__is_multiple_patterns() and \
+                           get_bytes_search_expression(foundations.strings.to_string(self.__pattern), self.__settings)
+        for file in files:
+            if self.__interrupt:
+                return
+
+            self.__flush_search_results()
+
+            self.__searched_files += 1
+            signature = get_file_signature(file)
+            if signature is None:
+                continue
+
+            LOGGER.info("{0} | Searching '{1}' file!".format(self.__class__.__name__, file))
+            self.__searched_bytes += signature[1]
+            content = self.__get_cached_content(file, signature)
+            if content is None:
+                if bytes_expression and signature[1] >= self.__mapping_threshold:
+                    self.__add_occurrences(file,
+                                           search_file_mapping(file, bytes_expression, self.__settings.whole_word))
+                    continue
+
+                content = self.__read_file(file, signature)
+                if content is None:
+                    continue
+            self.__add_occurrences(file, self.__search_content(content, matcher))
+
+    def __get_cached_content(self, file, signature):
+        """
+        Returns given file content from the files cache if it is up to date with given signature.
+
+        :param file: File.
+        :type file: unicode
+        :param signature: File signature.
+        :type signature: tuple
+        :return: File content, None if not cached.
+        :rtype: unicode
+        """
+
+        cache_data = self.__container.files_cache.get_content(file)
+        if cache_data and (cache_data.document or cache_data.signature == signature):
+            return cache_data.content
+
+    def __read_file(self, file, signature):
+        """
+        Reads given file content and adds it to the files cache.
+
+        :param file: File.
+        :type file: unicode
+        :param signature: File signature.
+        :type signature: tuple
+        :return: File content, None for a binary or unreadable file.
+        :rtype: unicode
+        """
+
+        if foundations.io.is_readable(file):
+            if foundations.io.is_binary_file(file):
+                return
+
+        reader = foundations.io.File(file)
+        content = reader.read()
+        if content is None:
+            LOGGER.warning("!> Error occured while reading '{0}' file proceeding to next one!".format(file))
+            return
+        self.__container.files_cache.add_content(
+            **{file: CacheData(content=content, document=None, signature=signature)})
+        return content
+
+    def __search_files_parallel(self, files, editors_files=None):
+        """
+        Searches in given files using a processes pool, the uncached files are submitted by chunks
+        while they are walked. Given editors files snapshots and the cached files are searched
+        while the pool searches the other files.
+
+        :param files: Files.
+        :type files: iterable
+        :param editors_files: Editors files.
+        :type editors_files: list
+        """
+
+        search_files = functools.partial(search_files_with_metrics,
+                                         pattern=self.__pattern if self.__is_multiple_patterns()
+                                         else foundations.strings.to_string(self.__pattern),
+                                         settings=dict(self.__settings),
+                                         mapping_threshold=self.__mapping_threshold)
+
+        cached_files, uncached_files = [], []
+        results = collections.deque()
+        pool = None
+        try:
+            for file in files:
+                if self.__interrupt:
+                    return
+
+                self.__flush_search_results()
+
+                if file in self.__container.files_cache:
+                    cached_files.append(file)
+                    continue
+
+                uncached_files.append(file)
+                if len(uncached_files) < self.__chunk_size:
+                    continue
+
+                if pool is None:
+                    LOGGER.debug("> Searching files by '{0}' files chunks using '{1}' processes.".format(
+                        self.__chunk_size, self.__processes))
+                    pool = multiprocessing.Pool(self.__processes, initialize_search_process)
+                results.append((uncached_files, pool.apply_async(search_files, (uncached_files,))))
+                uncached_files = []
+                self.__add_parallel_search_results(results)
+
+            if pool is None:
+                self.__search_editors_files(editors_files or ())
+                self.__search_files(cached_files)
+                self.__search_files(uncached_files)
+                return
+
+            uncached_files and results.append((uncached_files, pool.apply_async(search_files, (uncached_files,))))
+
+            self.__search_editors_files(editors_files or ())
+            self.__search_files(cached_files)
+
+            while results and not self.__interrupt:
+                self.__flush_search_results()
+                results[0][1].wait(self.__pool_timeout)
+                self.__add_parallel_search_results(results)
+        finally:
+            if pool is not None:
+                if self.__interrupt:
+                    pool.terminate()
+                else:
+                    pool.close()
+                pool.join()
+
+    def __add_parallel_search_results(self, results):
+        """
+        Adds given processes pool ready results to the search results, in submission order,
+        the files of a failed chunk are reported as skipped.
+
+        :param results: Processes pool results as (files, result) tuples.
+        :type results: deque
+        """
+
+        while results and results[0][1].ready():
+            files, result = results.popleft()
+            try:
+                search_results, metrics = result.get()
+            except Exception as error:
+                LOGGER.warning("!> {0} | Error occured while searching '{1}' file(s), skipping them: '{2}'!".format(
+                    self.__class__.__name__, len(files), error))
+                self.__searched_files += len(files)
+                for file in files:
+                    self.__add_search_result(SearchResult(file=file,
+                                                          pattern=self.__pattern,
+                                                          settings=self.__settings,
+                                                          occurrences=[],
+                                                          skipped="error"))
+                continue
+
+            self.__searched_files += metrics["files"]
+            self.__searched_bytes += metrics["bytes"]
+            for file, signature, content, occurrences in search_results:
+                content is not None and self.__container.files_cache.add_content(
+                    **{file: CacheData(content=content, document=None, signature=signature)})
+                self.__add_occurrences(file, occurrences)
+
+    def __search_files_guarded(self, files, editors_files=None):
+        """
+        Searches in given files for the regular expression with a time check between the matches:
+        files exceeding the inline time budget are searched again using a processes pool so that
+        the regular expression matching can be interrupted. A regular expression that can backtrack
+        catastrophically is only matched using the processes pool. The search stops once the search time budget
+        is exceeded.
+
+        :param files: Files.
+        :type files: list
+        :param editors_files: Editors files, their documents snapshots are searched.
+        :type editors_files: list
+        """
+
+        expression = get_search_expression(foundations.strings.to_string(self.__pattern), self.__settings)
+        editors_files = set(editors_files or ())
+        if is_backtracking_expression(expression):
+            LOGGER.debug("> '{0}' regular expression can backtrack, searching using processes pool.".format(
+                expression.pattern))
+            self.__search_files_pool_guarded(list(files), editors_files, expression)
+            return
+
+        overrun_files = []
+        for file in files:
+            if self.__interrupt or self.__is_search_time_budget_exceeded():
+                return
+
+            self.__flush_search_results()
+
+            revision = None
+            if file in editors_files:
+                snapshot = (self.__editors_snapshots or {}).get(file)
+                content, revision = (snapshot.content, snapshot.revision) if snapshot is not None else (None, None)
+            else:
+                content = None
+                signature = get_file_signature(file)
+                if signature is not None:
+                    content = self.__get_cached_content(file, signature)
+                    if content is None:
+                        content = self.__read_file(file, signature)
+
+            if content is None:
+                self.__searched_files += 1
+                continue
+
+            LOGGER.info("{0} | Searching '{1}' file!".format(self.__class__.__name__, file))
+            occurrences = search_content(content, expression, time.time() + self.__inline_time_budget)
+            if occurrences is None:
+                LOGGER.debug("> '{0}' file search exceeded '{1}' seconds inline time budget!".format(
+                    file, self.__inline_time_budget))
+                overrun_files.append(file)
+                continue
+
+            self.__searched_files += 1
+            self.__searched_bytes += len(content)
+            self.__add_occurrences(file, occurrences, revision)
+
+        overrun_files and self.__search_files_pool_guarded(overrun_files, editors_files, expression)
+
+    def __search_files_pool_guarded(self, files, editors_files, expression):
+        """
+        Searches in given files using a processes pool, the files are searched by batches: the tasks
+        exceeding the file time budget are terminated, a batch files are then searched one per task
+        and a single file exceeding the file time budget is skipped and reported as such.
+
+        :param files: Files.
+        :type files: list
+        :param editors_files: Editors files, their documents snapshots are searched.
+        :type editors_files: set
+        :param expression: Regular expression.
+        :type expression: RegexObject
+        """
+
+        LOGGER.debug("> Searching '{0}' files exceeding inline time budget using '{1}' processes.".format(
+            len(files), self.__processes))
+
+        disk_files = [file for file in files if file not in editors_files]
+        batch_size = max(1, min(self.__chunk_size, len(disk_files) // self.__processes))
+        queue = collections.deque()
+        for file in files:
+            if file not in editors_files:
+                continue
+
+            if file in (self.__editors_snapshots or {}):
+                queue.append([file])
+            else:
+                self.__searched_files += 1
+        queue.extend(disk_files[i:i + batch_size] for i in range(0, len(disk_files), batch_size))
+
+        tasks = []
+        pool = multiprocessing.Pool(self.__processes, initialize_search_process)
+        try:
+            while not self.__interrupt:
+                self.__flush_search_results()
+
+                if self.__is_search_time_budget_exceeded():
+                    return
+
+                while queue and len(tasks) < self.__processes:
+                    batch = queue.popleft()
+                    task = self.__get_guarded_task(batch, expression, batch[0] in editors_files)
+                    tasks.append((batch, task, pool.apply_async(*task), time.time()))
+
+                if not tasks:
+                    return
+
+                tasks[0][2].wait(self.__pool_timeout)
+                for batch, task, result, start_time in list(tasks):
+                    if result.ready():
+                        tasks.remove((batch, task, result, start_time))
+                        self.__add_guarded_task_result(batch, task, result)
+                    elif time.time() - start_time > self.__file_time_budget:
+                        tasks.remove((batch, task, result, start_time))
+                        if len(batch) > 1:
+                            queue.extendleft([file] for file in reversed(batch))
+                        else:
+                            LOGGER.warning(
+                                "!> {0} | '{1}' file search exceeded '{2}' seconds time budget, skipping it!".format(
+                                    self.__class__.__name__, batch[0], self.__file_time_budget))
+                            self.__searched_files += 1
+                            self.__add_search_result(SearchResult(file=batch[0],
+                                                                  pattern=self.__pattern,
+                                                                  settings=self.__settings,
+                                                                  occurrences=[],
+                                                                  skipped="too slow"))
+
+                        pool.terminate()
+                        pool.join()
+                        pool = multiprocessing.Pool(self.__processes, initialize_search_process)
+                        tasks = [(batch, task, pool.apply_async(*task), time.time())
+                                 for batch, task, result, start_time in tasks]
+                        break
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def __is_search_time_budget_exceeded(self):
+        """
+        Returns if the search time budget is exceeded, flagging the search as such.
+
+        :return: Is search time budget exceeded.
+        :rtype: bool
+        """
+
+        if time.time() - self.__search_start_time <= self.__search_time_budget:
+            return False
+
+        if not self.__budget_exceeded:
+            LOGGER.warning("!> {0} | Search exceeded '{1}' seconds time budget, stopping it!".format(
+                self.__class__.__name__, self.__search_time_budget))
+            self.__budget_exceeded = True
+        return True
+
+    def __get_guarded_task(self, files, expression, is_editor_file=False):
+        """
+        Returns the processes pool task searching given files.
+
+        :param files: Files, a single editor file.
+        :type files: list
+        :param expression: Regular expression.
+        :type expression: RegexObject
+        :param is_editor_file: Given file editor document snapshot is searched.
+        :type is_editor_file: bool
+        :return: Task as (function, arguments) tuple.
+        :rtype: tuple
+        """
+
+        if is_editor_file:
+            return search_content, (self.__editors_snapshots[files[0]].content, expression)
+
+        return search_files_with_metrics, (files,
+                                           foundations.strings.to_string(self.__pattern),
+                                           dict(self.__settings))
+
+    def __add_guarded_task_result(self, files, task, result):
+        """
+        Adds given processes pool task result to the search results.
+
+        :param files: Task files.
+        :type files: list
+        :param task: Task as (function, arguments) tuple.
+        :type task: tuple
+        :param result: Task result.
+        :type result: AsyncResult
+        """
+
+        function, arguments = task
+        try:
+            output = result.get()
+        except Exception as error:
+            LOGGER.warning("!> {0} | Error occured while searching '{1}' file(s): '{2}'!".format(
+                self.__class__.__name__, ", ".join(files), error))
+            self.__searched_files += len(files)
+            return
+
+        if function is search_content:
+            self.__searched_files += 1
+            self.__searched_bytes += len(arguments[0])
+            self.__add_occurrences(files[0], output, self.__editors_snapshots[files[0]].revision)
+            return
+
+        output, metrics = output
+        self.__searched_files += metrics["files"]
+        self.__searched_bytes += metrics["bytes"]
+        for file, signature, content, occurrences in output:
+            content is not None and self.__container.files_cache.add_content(
+                **{file: CacheData(content=content, document=None, signature=signature)})
+            self.__add_occurrences(file, occurrences)
+
+    def __is_multiple_patterns(self):
+        """
+        Returns if the search is performed for a literal patterns list.
+
+        :return: Is multiple patterns search.
+        :rtype: bool
+        """
+
+        return type(self.__pattern) is list
+
+    def __get_matcher(self):
+        """
+        Returns the matcher used to search the files content: a regular expression or,
+        for a literal patterns list, an Aho-Corasick automaton.
+
+        :return: Matcher.
+        :rtype: RegexObject or tuple
+        """
+
+        if self.__is_multiple_patterns():
+            return get_patterns_automaton(self.__pattern, self.__settings)
+        else:
+            return get_search_expression(foundations.strings.to_string(self.__pattern), self.__settings)
+
+    def __search_content(self, content, matcher):
+        """
+        Searches for given matcher occurrences in given plain text content.
+
+        :param content: Content.
+        :type content: unicode
+        :param matcher: Matcher.
+        :type matcher: RegexObject or tuple
+        :return: Matched occurrences as (line, column, length, position, text) tuples,
+            one list per pattern for a literal patterns list.
+        :rtype: list
+        """
+
+        if self.__is_multiple_patterns():
+            return search_content_patterns(content, matcher, len(self.__pattern), self.__settings)
+        else:
+            return search_content(content, matcher)
+
+    def __add_occurrences(self, file, occurrences, revision=None):
+        """
+        Adds given file matched occurrences to the search results, a literal patterns list search
+        adds one search result per matched pattern.
+
+        :param file: File.
+        :type file: unicode
+        :param occurrences: Matched occurrences as returned by :meth:`Search_worker.__search_content` method.
+        :type occurrences: list
+        :param revision: Searched editor document snapshot revision.
+        :type revision: int
+        """
+
+        if not occurrences:
+            return
+
+        if not self.__is_multiple_patterns():
+            self.__add_search_result(SearchResult(file=file,
+                                                  pattern=self.__pattern,
+                                                  settings=self.__settings,
+                                                  occurrences=self.__get_occurrences(occurrences),
+                                                  revision=revision))
+            return
+
+        for pattern, pattern_occurrences in zip(self.__pattern, occurrences):
+            pattern_occurrences and self.__add_search_result(SearchResult(file=file,
+                                                                          pattern=pattern,
+                                                                          settings=self.__settings,
+                                                                          occurrences=self.__get_occurrences(
+                                                                              pattern_occurrences),
+                                                                          revision=revision))
+
+    def __get_occurrences(self, occurrences):
+        """
+        Returns given matched occurrences tuples as :class:`Occurence` class instances.
+
+        :param occurrences: Matched occurrences as (line, column, length, position, text) tuples.
+        :type occurrences: list
+        :return: Occurrences.
+        :rtype: list
+        """
+
+        return [Occurence(line=line, column=column, length=length, position=position, text=text)
+                for line, column, length, position, text in occurrences]
+
+
+class Replace_worker(QThread):
+    """
+    Defines a `QThread <http://doc.qt.nokia.com/qthread.html>`_ subclass used
+    to replace a pattern occurrences in files.
+    """
+
+    # Custom signals definitions.
+    fileReplaced = pyqtSignal(unicode, int)
+    """
+    This signal is emited by the :class:`Replace_worker` class when a file has been processed.
+
+    :return: File, replaced occurrences count.
+    :rtype: tuple
+    """
+
+    replaceFinished = pyqtSignal(dict)
+    """
+    This signal is emited by the :class:`Replace_worker` class when the replace is finished.
+
+    :return: Replace results.
+    :rtype: dict
+    """
+
+    def __init__(self, parent, files=None, pattern=None, settings=None, replacement_pattern=None):
+        """
+        Initializes the class.
+
+        :param parent: Object parent.
+        :type parent: QObject
+        :param files: Files with occurrences (position, length) tuples to replace.
+        :type files: dict
+        :param pattern: Searched pattern.
+        :type pattern: unicode
+        :param settings: Search settings.
+        :type settings: dict
+        :param replacement_pattern: Replacement pattern.
+        :type replacement_pattern: unicode
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        QThread.__init__(self, parent)
+
+        # --- Setting class attributes. ---
+        self.__container = parent
+
+        self.__files = None
+        self.files = files
+        self.__pattern = None
+        self.pattern = pattern
+        self.__settings = None
+        self.settings = settings
+        self.__replacement_pattern = None
+        self.replacement_pattern = replacement_pattern
+
+        self.__replace_results = None
+
+        self.__interrupt = False
+
+    @property
+    def container(self):
+        """
+        Property for **self.__container** attribute.
+
+        :return: self.__container.
+        :rtype: QObject
+        """
+
+        return self.__container
+
+    @container.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def container(self, value):
+        """
+        Setter for **self.__container** attribute.
+
+        :param value: Attribute value.
+        :type value: QObject
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "container"))
+
+    @container.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def container(self):
+        """
+        Deleter for **self.__container** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "container"))
+
+    @property
+    def files(self):
+        """
+        Property for **self.__files** attribute.
+
+        :return: self.__files.
+        :rtype: dict
+        """
+
+        return self.__files
+
+    @files.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def files(self, value):
+        """
+        Setter for **self.__files** attribute.
+
+        :param value: Attribute value.
+        :type value: dict
+        """
+
+        if value is not None:
+            assert type(value) is dict, "'{0}' attribute: '{1}' type is not 'dict'!".format("files", value)
+        self.__files = value
+
+    @files.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def files(self):
+        """
+        Deleter for **self.__files** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "files"))
+
+    @property
+    def pattern(self):
+        """
+        Property for **self.__pattern** attribute.
+
+        :return: self.__pattern.
+        :rtype: unicode
+        """
+
+        return self.__pattern
+
+    @pattern.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def pattern(self, value):
+        """
+        Setter for **self.__pattern** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        if value is not None:
+            assert type(value) in (unicode, QString), \
+                "'{0}' attribute: '{1}' type is not 'unicode' or 'QString'!".format("pattern", value)
+        self.__pattern = value
+
+    @pattern.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def pattern(self):
+        """
+        Deleter for **self.__pattern** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "pattern"))
+
+    @property
+    def settings(self):
+        """
+        Property for **self.__settings** attribute.
+
+        :return: self.__settings.
+        :rtype: dict
+        """
+
+        return self.__settings
+
+    @settings.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def settings(self, value):
+        """
+        Setter for **self.__settings** attribute.
+
+        :param value: Attribute value.
+        :type value: dict
+        """
+
+        if value is not None:
+            assert type(value) is dict, "'{0}' attribute: '{1}' type is not 'dict'!".format("settings", value)
+        self.__settings = value
+
+    @settings.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def settings(self):
+        """
+        Deleter for **self.__settings** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "settings"))
+
+    @property
+    def replacement_pattern(self):
+        """
+        Property for **self.__replacement_pattern** attribute.
+
+        :return: self.__replacement_pattern.
+        :rtype: unicode
+        """
+
+        return self.__replacement_pattern
+
+    @replacement_pattern.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def replacement_pattern(self, value):
+        """
+        Setter for **self.__replacement_pattern** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        if value is not None:
+            assert type(value) in (unicode, QString), \
+                "'{0}' attribute: '{1}' type is not 'unicode' or 'QString'!".format("replacement_pattern", value)
+        self.__replacement_pattern = value
+
+    @replacement_pattern.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def replacement_pattern(self):
+        """
+        Deleter for **self.__replacement_pattern** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "replacement_pattern"))
+
+    @property
+    def replace_results(self):
+        """
+        Property for **self.__replace_results** attribute.
+
+        :return: self.__replace_results.
+        :rtype: dict
+        """
+
+        return self.__replace_results
+
+    @replace_results.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def replace_results(self, value):
+        """
+        Setter for **self.__replace_results** attribute.
+
+        :param value: Attribute value.
+        :type value: dict
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "replace_results"))
+
+    @replace_results.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def replace_results(self):
+        """
+        Deleter for **self.__replace_results** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "replace_results"))
+
+    def run(self):
+        """
+        Reimplements the :meth:`QThread.run` method.
+        """
+
+        self.__replace()
+
+    def quit(self):
+        """
+        Reimplements the :meth:`QThread.quit` method.
+        """
+
+        self.__interrupt = True
+
+        QThread.quit(self)
+
+    def __replace(self):
+        """
+        Performs the replace.
+        """
+
+        self.__replace_results = {}
+
+        expression = get_search_expression(foundations.strings.to_string(self.__pattern), self.__settings)
+        replacement_pattern = foundations.strings.to_string(self.__replacement_pattern)
+        for file, occurrences in sorted(self.__files.iteritems()):
+            if self.__interrupt:
+                return
+
+            count = self.__replace_file(file, occurrences, expression, replacement_pattern)
+            if count:
+                self.__replace_results[file] = count
+            self.fileReplaced.emit(file, count)
+
+        self.replaceFinished.emit(self.__replace_results)
+
+    def __replace_file(self, file, occurrences, expression, replacement_pattern):
+        """
+        Replaces given occurrences in given file and writes it.
+
+        :param file: File.
+        :type file: unicode
+        :param occurrences: Occurrences (position, length) tuples.
+        :type occurrences: list
+        :param expression: Searched pattern regular expression.
+        :type expression: RegexObject
+        :param replacement_pattern: Replacement pattern.
+        :type replacement_pattern: unicode
+        :return: Replaced occurrences count.
+        :rtype: int
+        """
+
+        signature = get_file_signature(file)
+        if signature is None:
+            LOGGER.warning("!> {0} | '{1}' file doesn't exists anymore!".format(self.__class__.__name__, file))
+            return 0
+
+        cache_data = self.__container.files_cache.get_content(file)
+        if cache_data and cache_data.signature == signature:
+            content = cache_data.content
+        else:
+            content = foundations.io.File(file).read()
+            if content is None:
+                LOGGER.warning("!> {0} | '{1}' file content cannot be read!".format(self.__class__.__name__, file))
+                return 0
+
+        occurrences = sorted(set(occurrences))
+        for position, length in occurrences:
+            match = expression.match(content, position)
+            if not match or match.end() != position + length:
+                LOGGER.warning("!> {0} | '{1}' file has changed since the search, skipping it!".format(
+                    self.__class__.__name__, file))
+                return 0
+
+        LOGGER.info("{0} | Replacing '{1}' occurence(s) in '{2}' file!".format(
+            self.__class__.__name__, len(occurrences), file))
+
+        # Content read with universal newlines is written back with the file original newline sequence.
+        newline = "\n" if "\r" in content else get_file_newline(file)
+        if not self.__write_file(file, self.__get_chunks(content, occurrences, replacement_pattern), newline):
+            return 0
+
+        return len(occurrences)
+
+    def __get_chunks(self, content, occurrences, replacement_pattern):
+        """
+        Yields given content chunks with given occurrences replaced by given replacement pattern.
+
+        :param content: Content.
+        :type content: unicode
+        :param occurrences: Sorted occurrences (position, length) tuples.
+        :type occurrences: list
+        :param replacement_pattern: Replacement pattern.
+        :type replacement_pattern: unicode
+        :return: Content chunks.
+        :rtype: generator
+        """
+
+        offset = 0
+        for position, length in occurrences:
+            yield content[offset:position]
+            yield replacement_pattern
+            offset = position + length
+        yield content[offset:]
+
+    def __write_file(self, file, chunks, newline="\n"):
+        """
+        Writes given chunks to given file atomically using a temporary file replacing it.
+
+        :param file: File.
+        :type file: unicode
+        :param chunks: Content chunks.
+        :type chunks: iterable
+        :param newline: Newline sequence the chunks **\\n** newlines are written with.
+        :type newline: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        handle, temporary_file = tempfile.mkstemp(prefix=".{0}.".format(os.path.basename(file)),
+                                                  suffix=".tmp",
+                                                  dir=os.path.dirname(file))
+        try:
+            with os.fdopen(handle, "wb") as file_handle:
+                for chunk in chunks:
+                    if newline != "\n":
+                        chunk = chunk.replace("\n", newline)
+                    file_handle.write(chunk.encode(Constants.default_codec, Constants.codec_error))
+                file_handle.flush()
+                os.fsync(file_handle.fileno())
+            shutil.copymode(file, temporary_file)
+            return replace_file(temporary_file, file)
+        except EnvironmentError as error:
+            LOGGER.warning("!> {0} | '{1}' file cannot be written: '{2}'!".format(self.__class__.__name__, file, error))
+            foundations.common.path_exists(temporary_file) and os.remove(temporary_file)
+            return False
+
+
+class Indexing_worker(QThread):
+    """
+    Defines a `QThread <http://doc.qt.nokia.com/qthread.html>`_ subclass used
+    to build and update the search indexes in the background.
+    """
+
+    # Custom signals definitions.
+    index_updated = pyqtSignal(unicode)
+    """
+    This signal is emited by the :class:`Indexing_worker` class when an index has been updated.
+
+    :return: Index directory.
+    :rtype: unicode
+    """
+
+    def __init__(self, parent):
+        """
+        Initializes the class.
+
+        :param parent: Object parent.
+        :type parent: QObject
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        QThread.__init__(self, parent)
+
+        # --- Setting class attributes. ---
+        self.__container = parent
+
+        self.__requests = collections.deque()
+        self.__running = False
+
+        self.__interrupt = False
+        self.__lock = QMutex()
+
+    @property
+    def container(self):
+        """
+        Property for **self.__container** attribute.
+
+        :return: self.__container.
+        :rtype: QObject
+        """
+
+        return self.__container
+
+    @container.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def container(self, value):
+        """
+        Setter for **self.__container** attribute.
+
+        :param value: Attribute value.
+        :type value: QObject
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "container"))
+
+    @container.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def container(self):
+        """
+        Deleter for **self.__container** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "container"))
+
+    @property
+    def requests(self):
+        """
+        Property for **self.__requests** attribute.
+
+        :return: self.__requests.
+        :rtype: deque
+        """
+
+        return self.__requests
+
+    @requests.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def requests(self, value):
+        """
+        Setter for **self.__requests** attribute.
+
+        :param value: Attribute value.
+        :type value: deque
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "requests"))
+
+    @requests.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def requests(self):
+        """
+        Deleter for **self.__requests** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "requests"))
+
+    def run(self):
+        """
+        Reimplements the :meth:`QThread.run` method.
+        """
+
+        self.__interrupt = False
+        while True:
+            self.__lock.lock()
+            if self.__interrupt or not self.__requests:
+                self.__running = False
+                self.__lock.unlock()
+                return
+            index, path = self.__requests.popleft()
+            self.__lock.unlock()
+
+            self.__process_request(index, path)
+
+    def quit(self):
+        """
+        Reimplements the :meth:`QThread.quit` method.
+        """
+
+        self.__interrupt = True
+
+        QThread.quit(self)
+
+    def __process_request(self, index, path):
+        """
+        Processes given index update request.
+
+        :param index: Index to update.
+        :type index: TrigramIndex
+        :param path: Path to update, the whole index is updated if None.
+        :type path: unicode
+        """
+
+        interrupt = lambda: self.__interrupt
+        if path is None:
+            LOGGER.info("{0} | Updating '{1}' directory search index!".format(self.__class__.__name__, index.directory))
+            index.built or index.load()
+            success = index.update(interrupt)
+        else:
+            success = index.update_path(path, interrupt)
+
+        if success:
+            index.save()
+            self.index_updated.emit(index.directory)
+
+    def add_request(self, index, path=None):
+        """
+        Adds an update request for given index and starts the worker if needed.
+
+        :param index: Index to update.
+        :type index: TrigramIndex
+        :param path: Path to update, the whole index is updated if None.
+        :type path: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        self.__lock.lock()
+        self.__requests.append((index, path))
+        start = not self.__running
+        self.__running = True
+        self.__lock.unlock()
 
-            block_cursor = QTextCursor(cursor)
-            block_cursor.movePosition(QTextCursor.StartOfLine, QTextCursor.MoveAnchor)
-            block_cursor.movePosition(QTextCursor.EndOfLine, QTextCursor.KeepAnchor)
-            length = cursor.selectionEnd() - cursor.selectionStart()
-            occurrences.append(Occurence(line=cursor.blockNumber(),
-                                         column=cursor.columnNumber() - length,
-                                         length=length,
-                                         position=cursor.position() - length,
-                                         text=block_cursor.selectedText()))
-            cursor = document.find(pattern, cursor.position(), flags)
-            block = block.next()
-        return occurrences
+        if start:
+            self.wait()
+            self.start(QThread.LowestPriority)
+        return True
@@ -1724,6 +1724,34 @@ class Umbra(foundations.ui.common.QWidget_factory(ui_file=RuntimeGlobals.ui_file
         self.process_events()
         return True
 
+    def set_processing_progress(self, value, steps=None, warning=True):
+        """
+        Sets the processing operation progress indicator value.
+
+        :param value: Progress value.
+        :type value: int
+        :param steps: Operation steps, the progress indicator range is kept if None.
+        :type steps: int
+        :param warning: Emit warning message.
+        :type warning: int
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if not self.__is_processing:
+            warning and LOGGER.warning(
+                "!> {0} | Engine is not processing, 'set_processing_progress' request has been ignored!".format(
+                    self.__class__.__name__))
+            return False
+
+        LOGGER.debug("> Setting processing operation progress!")
+
+        if steps is not None:
+            self.Application_Progress_Status_processing.Processing_progressBar.setRange(0, steps)
+        self.Application_Progress_Status_processing.Processing_progressBar.setValue(value)
+        self.process_events()
+        return True
+
     def stop_processing(self, warning=True):
         """
         Registers the end of a processing operation.
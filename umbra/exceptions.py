@@ -46,6 +46,7 @@ __all__ = ["LOGGER",
            "AbstractFileSystemEventsManagerError",
            "PathRegistrationError",
            "PathExistsError",
+           "PathPriorityError",
            "AbstractLanguageError",
            "LanguageGrammarError"]
 
@@ -204,6 +205,14 @@ class PathExistsError(AbstractFileSystemEventsManagerError):
     pass
 
 
+class PathPriorityError(AbstractFileSystemEventsManagerError):
+    """
+    Defines non existing path priority exception.
+    """
+
+    pass
+
+
 class AbstractLanguageError(foundations.exceptions.AbstractError):
     """
     Defines the abstract base class for language related exceptions.
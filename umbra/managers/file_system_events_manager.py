@@ -11,21 +11,35 @@
     Defines the :class:`FileSystemEventsManager` class.
 
 **Others:**
-
+    On Linux the registered paths are watched using *inotify*, the paths that cannot be watched
+    are polled on a timer at a rate depending on their priority: "high", "normal" or "low".
 """
 
 from __future__ import unicode_literals
 
+import errno
 import os
+import stat
+import sys
+import time
 from PyQt4.QtCore import Qt
+from PyQt4.QtCore import QSocketNotifier
 from PyQt4.QtCore import QThread
 from PyQt4.QtCore import QTimer
 from PyQt4.QtCore import pyqtSignal
 
+import foundations.common
 import foundations.exceptions
 import foundations.verbose
 import umbra.exceptions
+import umbra.managers.inotify
 from umbra.globals.constants import Constants
+from umbra.managers.inotify import Inotify
+
+if sys.version_info[:2] <= (2, 6):
+    from ordereddict import OrderedDict
+else:
+    from collections import OrderedDict
 
 __author__ = "Thomas Mansencal"
 __copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
@@ -34,10 +48,30 @@ __maintainer__ = "Thomas Mansencal"
 __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
-__all__ = ["LOGGER", "FileSystemEventsManager"]
+__all__ = ["LOGGER", "INOTIFY_WATCH_MASK", "INOTIFY_ENTRIES_MASK", "FileSystemEventsManager"]
 
 LOGGER = foundations.verbose.install_logger()
 
+INOTIFY_ENTRIES_MASK = umbra.managers.inotify.IN_CREATE | \
+                       umbra.managers.inotify.IN_DELETE | \
+                       umbra.managers.inotify.IN_MOVED_FROM | \
+                       umbra.managers.inotify.IN_MOVED_TO
+"""
+:param INOTIFY_ENTRIES_MASK: *inotify* events mask of a directory entries changes.
+:type INOTIFY_ENTRIES_MASK: int
+"""
+
+INOTIFY_WATCH_MASK = INOTIFY_ENTRIES_MASK | \
+                     umbra.managers.inotify.IN_MODIFY | \
+                     umbra.managers.inotify.IN_ATTRIB | \
+                     umbra.managers.inotify.IN_CLOSE_WRITE | \
+                     umbra.managers.inotify.IN_DELETE_SELF | \
+                     umbra.managers.inotify.IN_MOVE_SELF
+"""
+:param INOTIFY_WATCH_MASK: *inotify* events mask of the watched directories.
+:type INOTIFY_WATCH_MASK: int
+"""
+
 
 class FileSystemEventsManager(QThread):
     """
@@ -48,6 +82,7 @@ class FileSystemEventsManager(QThread):
     file_changed = pyqtSignal(unicode)
     """
     This signal is emited by the :class:`FileSystemEventsManager` class when a file is changed.
+    It is not emitted when :attr:`FileSystemEventsManager.emit_paths_signals` is unset.
 
     :return: Current changed file.
     :rtype: unicode
@@ -56,6 +91,7 @@ class FileSystemEventsManager(QThread):
     file_invalidated = pyqtSignal(unicode)
     """
     This signal is emited by the :class:`FileSystemEventsManager` class when a file is invalidated.
+    It is not emitted when :attr:`FileSystemEventsManager.emit_paths_signals` is unset.
 
     :return: Current invalidated file.
     :rtype: unicode
@@ -64,6 +100,7 @@ class FileSystemEventsManager(QThread):
     directory_changed = pyqtSignal(unicode)
     """
     This signal is emited by the :class:`FileSystemEventsManager` class when a directory is changed.
+    It is not emitted when :attr:`FileSystemEventsManager.emit_paths_signals` is unset.
 
     :return: Current changed directory.
     :rtype: unicode
@@ -72,14 +109,54 @@ class FileSystemEventsManager(QThread):
     directory_invalidated = pyqtSignal(unicode)
     """
     This signal is emited by the :class:`FileSystemEventsManager` class when a directory is invalidated.
+    It is not emitted when :attr:`FileSystemEventsManager.emit_paths_signals` is unset.
 
     :return: Current invalidated directory.
     :rtype: unicode
     """
 
-    def __init__(self, parent=None):
+    entries_added = pyqtSignal(unicode, list)
+    """
+    This signal is emited by the :class:`FileSystemEventsManager` class when entries are added to a directory.
+
+    :return: Current changed directory, added entries paths.
+    :rtype: tuple
+    """
+
+    entries_removed = pyqtSignal(unicode, list)
+    """
+    This signal is emited by the :class:`FileSystemEventsManager` class when entries are removed from a directory.
+
+    :return: Current changed directory, removed entries paths.
+    :rtype: tuple
+    """
+
+    entries_modified = pyqtSignal(unicode, list)
+    """
+    This signal is emited by the :class:`FileSystemEventsManager` class when a directory entries are modified:
+    their kind changed, a file replaced by a directory or the opposite. Entries content changes are not reported.
+
+    :return: Current changed directory, modified entries paths.
+    :rtype: tuple
+    """
+
+    paths_changed = pyqtSignal(list)
+    """
+    This signal is emited by the :class:`FileSystemEventsManager` class with the paths changed or invalidated
+    during a burst of file system events, once the quiet period has elapsed.
+
+    :return: Changed paths as (path, event) tuples, event being the name of the matching path signal.
+    :rtype: list
+    """
+
+    def __init__(self, parent=None, use_backend=True):
         """
         Initializes the class.
+
+        :param parent: Object parent.
+        :type parent: QObject
+        :param use_backend: Use the *inotify* backend when available instead of polling the registered paths.
+        :type use_backend: bool
         """
 
         LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
@@ -90,10 +167,47 @@ class FileSystemEventsManager(QThread):
         self.__container = parent
 
         self.__paths = {}
+        self.__snapshots = {}
+        self.__pending_snapshots = set()
 
         self.__timer = None
         self.__timer_cycle_multiplier = 5
 
+        self.__minimum_poll_interval = Constants.default_timer_cycle / 1000.
+        self.__maximum_poll_interval = self.__minimum_poll_interval * self.__timer_cycle_multiplier * 4
+        self.__polls = {}
+        self.__poll_metrics = {"paths": 0, "time": 0., "priorities": {}}
+
+        self.__priorities = OrderedDict((("high", (self.__minimum_poll_interval,
+                                                   self.__minimum_poll_interval * 2)),
+                                         ("normal", (self.__minimum_poll_interval,
+                                                     self.__maximum_poll_interval)),
+                                         ("low", (self.__minimum_poll_interval * self.__timer_cycle_multiplier,
+                                                  self.__maximum_poll_interval * 4))))
+        self.__default_priority = "normal"
+        self.__paths_priorities = {}
+
+        self.__quiet_period = 0.25
+        self.__maximum_delay = 2.
+        self.__pending_paths = OrderedDict()
+        self.__pending_entries = OrderedDict()
+        self.__pending_time = None
+        self.__last_event_time = None
+        self.__emit_paths_signals = True
+
+        self.__backend = None
+        if use_backend and umbra.managers.inotify.is_inotify_available():
+            try:
+                self.__backend = Inotify()
+            except OSError as error:
+                LOGGER.warning("!> {0} | 'inotify' backend cannot be initialized, paths will be polled: '{1}'!".format(
+                    self.__class__.__name__, error))
+        self.__notifier = None
+        self.__watches = {}
+        self.__descriptors = {}
+        self.__watched_paths = {}
+        self.__watched_names = {}
+
     @property
     def container(self):
         """
@@ -230,6 +344,353 @@ class FileSystemEventsManager(QThread):
         raise foundations.exceptions.ProgrammingError(
             "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "timer_cycle_multiplier"))
 
+    @property
+    def minimum_poll_interval(self):
+        """
+        Property for **self.__minimum_poll_interval** attribute.
+
+        :return: self.__minimum_poll_interval.
+        :rtype: float
+        """
+
+        return self.__minimum_poll_interval
+
+    @minimum_poll_interval.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def minimum_poll_interval(self, value):
+        """
+        Setter for **self.__minimum_poll_interval** attribute.
+
+        :param value: Attribute value.
+        :type value: float
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "minimum_poll_interval"))
+
+    @minimum_poll_interval.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def minimum_poll_interval(self):
+        """
+        Deleter for **self.__minimum_poll_interval** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "minimum_poll_interval"))
+
+    @property
+    def maximum_poll_interval(self):
+        """
+        Property for **self.__maximum_poll_interval** attribute.
+
+        :return: self.__maximum_poll_interval.
+        :rtype: float
+        """
+
+        return self.__maximum_poll_interval
+
+    @maximum_poll_interval.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def maximum_poll_interval(self, value):
+        """
+        Setter for **self.__maximum_poll_interval** attribute.
+
+        :param value: Attribute value.
+        :type value: float
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "maximum_poll_interval"))
+
+    @maximum_poll_interval.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def maximum_poll_interval(self):
+        """
+        Deleter for **self.__maximum_poll_interval** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "maximum_poll_interval"))
+
+    @property
+    def poll_metrics(self):
+        """
+        Property for **self.__poll_metrics** attribute.
+
+        :return: self.__poll_metrics.
+        :rtype: dict
+        """
+
+        return self.__poll_metrics
+
+    @poll_metrics.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def poll_metrics(self, value):
+        """
+        Setter for **self.__poll_metrics** attribute.
+
+        :param value: Attribute value.
+        :type value: dict
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "poll_metrics"))
+
+    @poll_metrics.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def poll_metrics(self):
+        """
+        Deleter for **self.__poll_metrics** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "poll_metrics"))
+
+    @property
+    def priorities(self):
+        """
+        Property for **self.__priorities** attribute.
+
+        :return: self.__priorities.
+        :rtype: dict
+        """
+
+        return self.__priorities
+
+    @priorities.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def priorities(self, value):
+        """
+        Setter for **self.__priorities** attribute.
+
+        :param value: Attribute value.
+        :type value: dict
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "priorities"))
+
+    @priorities.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def priorities(self):
+        """
+        Deleter for **self.__priorities** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "priorities"))
+
+    @property
+    def default_priority(self):
+        """
+        Property for **self.__default_priority** attribute.
+
+        :return: self.__default_priority.
+        :rtype: unicode
+        """
+
+        return self.__default_priority
+
+    @default_priority.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def default_priority(self, value):
+        """
+        Setter for **self.__default_priority** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "default_priority"))
+
+    @default_priority.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def default_priority(self):
+        """
+        Deleter for **self.__default_priority** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "default_priority"))
+
+    @property
+    def quiet_period(self):
+        """
+        Property for **self.__quiet_period** attribute.
+
+        :return: self.__quiet_period.
+        :rtype: float
+        """
+
+        return self.__quiet_period
+
+    @quiet_period.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def quiet_period(self, value):
+        """
+        Setter for **self.__quiet_period** attribute.
+
+        :param value: Attribute value.
+        :type value: float
+        """
+
+        if value is not None:
+            assert type(value) is float, "'{0}' attribute: '{1}' type is not 'float'!".format("quiet_period", value)
+            assert value >= 0, "'{0}' attribute: '{1}' need to be positive!".format("quiet_period", value)
+        self.__quiet_period = value
+
+    @quiet_period.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def quiet_period(self):
+        """
+        Deleter for **self.__quiet_period** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "quiet_period"))
+
+    @property
+    def maximum_delay(self):
+        """
+        Property for **self.__maximum_delay** attribute.
+
+        :return: self.__maximum_delay.
+        :rtype: float
+        """
+
+        return self.__maximum_delay
+
+    @maximum_delay.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def maximum_delay(self, value):
+        """
+        Setter for **self.__maximum_delay** attribute.
+
+        :param value: Attribute value.
+        :type value: float
+        """
+
+        if value is not None:
+            assert type(value) is float, "'{0}' attribute: '{1}' type is not 'float'!".format("maximum_delay", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format(
+                "maximum_delay", value)
+        self.__maximum_delay = value
+
+    @maximum_delay.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def maximum_delay(self):
+        """
+        Deleter for **self.__maximum_delay** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "maximum_delay"))
+
+    @property
+    def emit_paths_signals(self):
+        """
+        Property for **self.__emit_paths_signals** attribute.
+
+        :return: self.__emit_paths_signals.
+        :rtype: bool
+        """
+
+        return self.__emit_paths_signals
+
+    @emit_paths_signals.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def emit_paths_signals(self, value):
+        """
+        Setter for **self.__emit_paths_signals** attribute.
+
+        :param value: Attribute value.
+        :type value: bool
+        """
+
+        if value is not None:
+            assert type(value) is bool, "'{0}' attribute: '{1}' type is not 'bool'!".format(
+                "emit_paths_signals", value)
+        self.__emit_paths_signals = value
+
+    @emit_paths_signals.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def emit_paths_signals(self):
+        """
+        Deleter for **self.__emit_paths_signals** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "emit_paths_signals"))
+
+    @property
+    def backend(self):
+        """
+        Property for **self.__backend** attribute.
+
+        :return: self.__backend.
+        :rtype: Inotify
+        """
+
+        return self.__backend
+
+    @backend.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def backend(self, value):
+        """
+        Setter for **self.__backend** attribute.
+
+        :param value: Attribute value.
+        :type value: Inotify
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "backend"))
+
+    @backend.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def backend(self):
+        """
+        Deleter for **self.__backend** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "backend"))
+
+    @property
+    def watched_paths(self):
+        """
+        Property for **self.__watched_paths** attribute.
+
+        :return: self.__watched_paths.
+        :rtype: dict
+        """
+
+        return self.__watched_paths
+
+    @watched_paths.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def watched_paths(self, value):
+        """
+        Setter for **self.__watched_paths** attribute.
+
+        :param value: Attribute value.
+        :type value: dict
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "watched_paths"))
+
+    @watched_paths.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def watched_paths(self):
+        """
+        Deleter for **self.__watched_paths** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "watched_paths"))
+
     def __getitem__(self, path):
         """
         Reimplements the :meth:`object.__getitem__` method.
@@ -310,49 +771,443 @@ class FileSystemEventsManager(QThread):
 
         self.__timer = QTimer()
         self.__timer.moveToThread(self)
-        self.__timer.start(Constants.default_timer_cycle * self.__timer_cycle_multiplier)
+        self.__timer.start(Constants.default_timer_cycle)
 
         self.__timer.timeout.connect(self.__watch_file_system, Qt.DirectConnection)
 
+        if self.__backend is not None:
+            self.__notifier = QSocketNotifier(self.__backend.file_descriptor, QSocketNotifier.Read)
+            self.__notifier.activated.connect(self.__process_backend_events, Qt.DirectConnection)
+
         self.exec_()
 
+        self.__timer.stop()
+        self.__close_backend()
+
+    def __close_backend(self):
+        """
+        Closes the backend and its notifier, the registered paths are not watched anymore.
+        """
+
+        if self.__notifier is not None:
+            self.__notifier.setEnabled(False)
+            self.__notifier.activated.disconnect(self.__process_backend_events)
+            self.__notifier = None
+
+        if self.__backend is None:
+            return
+
+        LOGGER.debug("> {0} | Closing 'inotify' backend.".format(self.__class__.__name__))
+        self.__backend.close()
+        self.__backend = None
+        self.__watches.clear()
+        self.__descriptors.clear()
+        self.__watched_paths.clear()
+        self.__watched_names.clear()
+
     def __watch_file_system(self):
         """
-        Watches the file system for paths that have been changed or invalidated on disk.
+        Watches the file system for paths that have been changed or invalidated on disk,
+        the paths watched by the backend are not polled, the queued events are flushed.
+
+        Each path has its own poll interval bounded by its priority poll intervals: it is reset to the minimum
+        poll interval when the path changes and doubled up to the maximum poll interval each time the path is
+        found unchanged.
+        """
+
+        self.__build_snapshots()
+
+        start_time = time.time()
+        polled_paths = 0
+        polled_priorities = dict.fromkeys(self.__priorities, 0)
+        for path in self.__paths.keys():
+            if path in self.__watched_paths:
+                continue
+
+            priority = self.__paths_priorities.get(path, self.__default_priority)
+            minimum_poll_interval, maximum_poll_interval = self.__priorities[priority]
+            poll = self.__polls.get(path)
+            if poll is None:
+                interval = min(max(minimum_poll_interval, self.__minimum_poll_interval * self.__timer_cycle_multiplier),
+                               maximum_poll_interval)
+                poll = self.__polls[path] = [start_time + interval, interval]
+
+            next_poll_time, interval = poll
+            if start_time < next_poll_time:
+                continue
+
+            polled_paths += 1
+            polled_priorities[priority] += 1
+            if self.__check_path(path):
+                interval = minimum_poll_interval
+            else:
+                interval = min(max(interval * 2, minimum_poll_interval), maximum_poll_interval)
+            poll[:] = [start_time + interval, interval]
+
+        self.__poll_metrics = {"paths": polled_paths,
+                               "time": time.time() - start_time,
+                               "priorities": polled_priorities}
+
+        self.__flush_events()
+
+    def __check_path(self, path, changed=False, names=None):
         """
+        Checks if given path has been changed or invalidated on disk and emits the related signals.
 
-        for path, data in self.__paths.items():
-            stored_modified_time, is_file = data
+        :param path: Path.
+        :type path: unicode
+        :param changed: Path is known to have been changed regardless of its signature.
+        :type changed: bool
+        :param names: Changed directory entries names, all the entries are compared if not given.
+        :type names: list
+        :return: Has path been changed or invalidated.
+        :rtype: bool
+        """
+
+        try:
+            stored_signature, is_file = self.__paths[path]
+        except KeyError:
+            LOGGER.debug("> {0} | '{1}' path has been unregistered while iterating!".format(
+                self.__class__.__name__, path))
+            return False
+
+        try:
+            path_stat = os.stat(path)
+        except OSError as error:
+            if error.errno not in (errno.ENOENT, errno.ENOTDIR):
+                LOGGER.debug("> {0} | '{1}' path cannot be checked: '{2}'.".format(
+                    self.__class__.__name__, path, error))
+                return False
+
+            LOGGER.warning(
+                "!> {0} | '{1}' path has been invalidated and will be unregistered!".format(
+                    self.__class__.__name__, path))
+            if self.__paths.pop(path, None) is None:
+                return False
+
+            self.__polls.pop(path, None)
+            self.__paths_priorities.pop(path, None)
+            self.__snapshots.pop(path, None)
+            self.__pending_snapshots.discard(path)
+            self.__remove_backend_watch(path)
+            self.__queue_path_event(path, "file_invalidated" if is_file else "directory_invalidated")
+            return True
+
+        signature = (path_stat.st_mtime, path_stat.st_size, path_stat.st_ino)
+        if not changed and stored_signature == signature:
+            return False
+
+        self.__paths[path] = (signature, stat.S_ISREG(path_stat.st_mode))
+        LOGGER.debug("> {0} | '{1}' path has been changed!".format(self.__class__.__name__, path))
+        if is_file:
+            self.__queue_path_event(path, "file_changed")
+        else:
+            self.__update_snapshot(path, names)
+            self.__queue_path_event(path, "directory_changed")
+        return True
+
+    def __update_snapshot(self, directory, names=None):
+        """
+        Updates given directory entries snapshot and emits the entries added, removed and modified signals.
+
+        :param directory: Directory.
+        :type directory: unicode
+        :param names: Entries names to compare, all the entries are compared if not given.
+        :type names: list
+        :return: Have entries been changed.
+        :rtype: bool
+        """
+
+        if directory in self.__pending_snapshots:
+            self.__build_snapshots()
+
+        snapshot = self.__snapshots.get(directory)
+        if snapshot is None:
+            return False
+
+        if names is None:
             try:
-                if not foundations.common.path_exists(path):
-                    LOGGER.warning(
-                        "!> {0} | '{1}' path has been invalidated and will be unregistered!".format(
-                            self.__class__.__name__, path))
-                    del (self.__paths[path])
-                    if is_file:
-                        self.file_invalidated.emit(path)
-                    else:
-                        self.directory_invalidated.emit(path)
+                entries = self.get_directory_snapshot(directory)
+            except OSError as error:
+                LOGGER.debug("> {0} | '{1}' directory cannot be listed: '{2}'.".format(
+                    self.__class__.__name__, directory, error))
+                return False
+            names = set(snapshot).union(entries)
+        else:
+            entries = {}
+            for name in names:
+                signature = self.get_entry_signature(os.path.join(directory, name))
+                if signature is not None:
+                    entries[name] = signature
+
+        added_entries, removed_entries, modified_entries = [], [], []
+        for name in sorted(names):
+            stored_signature, signature = snapshot.get(name), entries.get(name)
+            if stored_signature == signature:
+                continue
+
+            path = os.path.join(directory, name)
+            if stored_signature is None:
+                added_entries.append(path)
+                snapshot[name] = signature
+            elif signature is None:
+                removed_entries.append(path)
+                del (snapshot[name])
+            else:
+                modified_entries.append(path)
+                snapshot[name] = signature
+
+        self.__queue_entries_events(directory, added_entries, removed_entries, modified_entries)
+        return bool(added_entries or removed_entries or modified_entries)
+
+    def __build_snapshots(self):
+        """
+        Builds the registered directories entries snapshots that have not been built yet.
+        """
+
+        while self.__pending_snapshots:
+            directory = self.__pending_snapshots.pop()
+            try:
+                snapshot = self.get_directory_snapshot(directory)
+            except OSError as error:
+                LOGGER.debug("> {0} | '{1}' directory cannot be listed: '{2}'.".format(
+                    self.__class__.__name__, directory, error))
+                snapshot = {}
+
+            if directory in self.__paths:
+                self.__snapshots[directory] = snapshot
+
+    def __queue_path_event(self, path, event):
+        """
+        Queues given path event until the events are flushed, the last event of a path replaces the previous one.
+
+        :param path: Path.
+        :type path: unicode
+        :param event: Event, the name of the path signal to emit.
+        :type event: unicode
+        """
+
+        self.__pending_paths.pop(path, None)
+        self.__pending_paths[path] = event
+        self.__touch_pending_events()
+
+    def __queue_entries_events(self, directory, added_entries, removed_entries, modified_entries):
+        """
+        Queues given directory entries events until the events are flushed, merging them with the queued ones:
+        an entry added then removed is dropped, an entry removed then added is modified.
+
+        :param directory: Directory.
+        :type directory: unicode
+        :param added_entries: Added entries paths.
+        :type added_entries: list
+        :param removed_entries: Removed entries paths.
+        :type removed_entries: list
+        :param modified_entries: Modified entries paths.
+        :type modified_entries: list
+        """
+
+        if not (added_entries or removed_entries or modified_entries):
+            return
+
+        entries = self.__pending_entries.setdefault(directory, OrderedDict())
+        for event, paths in (("added", added_entries), ("removed", removed_entries), ("modified", modified_entries)):
+            for path in paths:
+                pending_event = entries.get(path)
+                if pending_event == "added" and event == "removed":
+                    del (entries[path])
+                elif pending_event == "added" and event == "modified":
                     continue
-            except KeyError:
-                LOGGER.debug("> {0} | '{1}' path has been unregistered while iterating!".format(
-                    self.__class__.__name__, path))
+                elif pending_event == "removed" and event == "added":
+                    entries[path] = "modified"
+                else:
+                    entries[path] = event
+        self.__touch_pending_events()
+
+    def __touch_pending_events(self):
+        """
+        Registers the time of a queued event.
+        """
+
+        self.__last_event_time = time.time()
+        if self.__pending_time is None:
+            self.__pending_time = self.__last_event_time
+
+    def __flush_events(self, force=False):
+        """
+        Emits the queued events once no event has been queued for the quiet period,
+        or once the oldest queued event is older than the maximum delay.
+
+        :param force: Emit the queued events regardless of the quiet period.
+        :type force: bool
+        """
+
+        if self.__pending_time is None:
+            return
+
+        current_time = time.time()
+        if not force and \
+                current_time - self.__last_event_time < self.__quiet_period and \
+                current_time - self.__pending_time < self.__maximum_delay:
+            return
+
+        pending_paths, self.__pending_paths = self.__pending_paths, OrderedDict()
+        pending_entries, self.__pending_entries = self.__pending_entries, OrderedDict()
+        self.__pending_time = self.__last_event_time = None
+
+        for directory, entries in pending_entries.iteritems():
+            for event, signal in (("added", self.entries_added),
+                                  ("removed", self.entries_removed),
+                                  ("modified", self.entries_modified)):
+                paths = [path for path, pending_event in entries.iteritems() if pending_event == event]
+                paths and signal.emit(directory, paths)
+
+        if self.__emit_paths_signals:
+            for path, event in pending_paths.iteritems():
+                getattr(self, event).emit(path)
+
+        if pending_paths:
+            LOGGER.debug("> {0} | Emitting '{1}' changed paths batch.".format(
+                self.__class__.__name__, len(pending_paths)))
+            self.paths_changed.emit(pending_paths.items())
+
+    def __process_backend_events(self):
+        """
+        Processes the backend pending events: the registered paths they relate to are checked.
+        """
+
+        self.__build_snapshots()
+
+        try:
+            events = self.__backend.read_events()
+        except OSError as error:
+            LOGGER.warning("!> {0} | Error occured while reading 'inotify' events: '{1}'!".format(
+                self.__class__.__name__, error))
+            return
+
+        for descriptor, mask, cookie, name in events:
+            if mask & umbra.managers.inotify.IN_Q_OVERFLOW:
+                LOGGER.warning("!> {0} | 'inotify' events queue overflowed, checking all watched paths!".format(
+                    self.__class__.__name__))
+                for path in self.__watched_paths.keys():
+                    self.__check_path(path)
                 continue
 
+            watch_path = self.__descriptors.get(descriptor)
+            if watch_path is None:
+                continue
+
+            if mask & (umbra.managers.inotify.IN_DELETE_SELF |
+                       umbra.managers.inotify.IN_MOVE_SELF |
+                       umbra.managers.inotify.IN_IGNORED):
+                paths = [path for path, (watch, name) in self.__watched_paths.items() if watch == watch_path]
+                if mask & umbra.managers.inotify.IN_IGNORED:
+                    self.__drop_backend_watch(watch_path)
+                for path in paths:
+                    self.__check_path(path)
+                    if path in self.__paths and path not in self.__watched_paths:
+                        self.__add_backend_watch(path)
+                continue
+
+            for path in list(self.__watched_names.get((watch_path, name), ())):
+                self.__check_path(path, bool(mask & (umbra.managers.inotify.IN_CLOSE_WRITE |
+                                                     umbra.managers.inotify.IN_MOVED_TO)))
+
+            if mask & INOTIFY_ENTRIES_MASK:
+                for path in list(self.__watched_names.get((watch_path, None), ())):
+                    self.__check_path(path, True, [name])
+
+        self.__flush_events()
+
+    def __add_backend_watch(self, path):
+        """
+        Watches given registered path using the backend: directories are watched directly,
+        files are watched through their parent directory so that they can be replaced,
+        symbolic links are left to polling.
+
+        :param path: Path.
+        :type path: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if self.__backend is None or os.path.islink(path):
+            return False
+
+        if os.path.isfile(path):
+            watch_path, name = os.path.realpath(os.path.dirname(os.path.abspath(path))), os.path.basename(path)
+        else:
+            watch_path, name = os.path.realpath(path), None
+
+        if watch_path in self.__watches:
+            self.__watches[watch_path][1] += 1
+        else:
             try:
-                modified_time = self.get_path_modified_time(path)
-            except OSError:
-                LOGGER.debug("> {0} | '{1}' path has been invalidated while iterating!".format(
-                    self.__class__.__name__, path))
+                descriptor = self.__backend.add_watch(watch_path, INOTIFY_WATCH_MASK)
+            except OSError as error:
+                LOGGER.warning("!> {0} | '{1}' path cannot be watched and will be polled: '{2}'!".format(
+                    self.__class__.__name__, path, error))
+                return False
+
+            self.__watches[watch_path] = [descriptor, 1]
+            self.__descriptors[descriptor] = watch_path
+
+        self.__watched_paths[path] = (watch_path, name)
+        self.__watched_names.setdefault((watch_path, name), set()).add(path)
+        return True
+
+    def __remove_backend_watch(self, path):
+        """
+        Stops watching given registered path using the backend.
+
+        :param path: Path.
+        :type path: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        key = self.__watched_paths.pop(path, None)
+        if key is None:
+            return False
+
+        paths = self.__watched_names.get(key, set())
+        paths.discard(path)
+        if not paths:
+            self.__watched_names.pop(key, None)
+
+        watch_path, name = key
+        watch = self.__watches.get(watch_path)
+        if watch is None:
+            return True
+
+        watch[1] -= 1
+        if watch[1] <= 0:
+            self.__drop_backend_watch(watch_path)
+            try:
+                self.__backend.remove_watch(watch[0])
+            except OSError as error:
+                LOGGER.debug("> {0} | '{1}' watch has already been removed: '{2}'.".format(
+                    self.__class__.__name__, watch_path, error))
+        return True
+
+    def __drop_backend_watch(self, watch_path):
+        """
+        Drops given backend watch: the registered paths it was watching are not watched anymore.
+
+        :param watch_path: Watched path.
+        :type watch_path: unicode
+        """
+
+        watch = self.__watches.pop(watch_path, None)
+        if watch is None:
+            return
+
+        self.__descriptors.pop(watch[0], None)
+        for path, key in self.__watched_paths.items():
+            if key[0] != watch_path:
                 continue
 
-            if stored_modified_time != modified_time:
-                self.__paths[path] = (modified_time, os.path.isfile(path))
-                LOGGER.debug("> {0} | '{1}' path has been changed!".format(self.__class__.__name__, path))
-                if is_file:
-                    self.file_changed.emit(path)
-                else:
-                    self.directory_changed.emit(path)
+            del (self.__watched_paths[path])
+            self.__watched_names.pop(key, None)
 
     def list_paths(self):
         """
@@ -377,8 +1232,9 @@ class FileSystemEventsManager(QThread):
         return path in self
 
     @foundations.exceptions.handle_exceptions(foundations.exceptions.PathExistsError,
-                                              umbra.exceptions.PathRegistrationError)
-    def register_path(self, path, modified_time=None):
+                                              umbra.exceptions.PathRegistrationError,
+                                              umbra.exceptions.PathPriorityError)
+    def register_path(self, path, modified_time=None, priority=None):
         """
         Registers given path.
 
@@ -386,6 +1242,8 @@ class FileSystemEventsManager(QThread):
         :type path: unicode
         :param modified_time: Custom modified time.
         :type modified_time: int or float
+        :param priority: Path priority, the default priority is used if not given.
+        :type priority: unicode
         :return: Method success.
         :rtype: bool
         """
@@ -398,8 +1256,20 @@ class FileSystemEventsManager(QThread):
             raise umbra.exceptions.PathRegistrationError("{0} | '{1}' path is already registered!".format(
                 self.__class__.__name__, path))
 
-        self.__paths[path] = (self.get_path_modified_time(
-            path) if modified_time is None else modified_time, os.path.isfile(path))
+        priority = priority or self.__default_priority
+        if not priority in self.__priorities:
+            raise umbra.exceptions.PathPriorityError("{0} | '{1}' priority isn't defined!".format(
+                self.__class__.__name__, priority))
+
+        signature = self.get_path_signature(path)
+        if modified_time is not None:
+            signature = (modified_time,) + signature[1:]
+        self.__paths[path] = (signature, os.path.isfile(path))
+        self.__paths_priorities[path] = priority
+        if not self.__paths[path][1]:
+            # The directory entries snapshot is built by the manager thread.
+            self.__pending_snapshots.add(path)
+        self.__add_backend_watch(path)
         return True
 
     @foundations.exceptions.handle_exceptions(umbra.exceptions.PathExistsError)
@@ -418,6 +1288,58 @@ class FileSystemEventsManager(QThread):
                 self.__class__.__name__, path))
 
         del (self.__paths[path])
+        self.__polls.pop(path, None)
+        self.__paths_priorities.pop(path, None)
+        self.__snapshots.pop(path, None)
+        self.__pending_snapshots.discard(path)
+        self.__remove_backend_watch(path)
+        return True
+
+    @foundations.exceptions.handle_exceptions(umbra.exceptions.PathExistsError)
+    def get_path_priority(self, path):
+        """
+        Returns given path priority.
+
+        :param path: Path name.
+        :type path: unicode
+        :return: Path priority.
+        :rtype: unicode
+        """
+
+        if not path in self:
+            raise umbra.exceptions.PathExistsError("{0} | '{1}' path isn't registered!".format(
+                self.__class__.__name__, path))
+
+        return self.__paths_priorities.get(path, self.__default_priority)
+
+    @foundations.exceptions.handle_exceptions(umbra.exceptions.PathExistsError,
+                                              umbra.exceptions.PathPriorityError)
+    def set_path_priority(self, path, priority):
+        """
+        Sets given path priority, the path is rescheduled using the priority poll intervals.
+
+        :param path: Path name.
+        :type path: unicode
+        :param priority: Path priority.
+        :type priority: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if not path in self:
+            raise umbra.exceptions.PathExistsError("{0} | '{1}' path isn't registered!".format(
+                self.__class__.__name__, path))
+
+        if not priority in self.__priorities:
+            raise umbra.exceptions.PathPriorityError("{0} | '{1}' priority isn't defined!".format(
+                self.__class__.__name__, priority))
+
+        if self.__paths_priorities.get(path) == priority:
+            return True
+
+        LOGGER.debug("> {0} | Setting '{1}' path priority to '{2}'.".format(self.__class__.__name__, path, priority))
+        self.__paths_priorities[path] = priority
+        self.__polls.pop(path, None)
         return True
 
     @staticmethod
@@ -428,7 +1350,55 @@ class FileSystemEventsManager(QThread):
         :param path: Path.
         :type path: unicode
         :return: Modification time.
-        :rtype: int
+        :rtype: float
+        """
+
+        return os.path.getmtime(path)
+
+    @staticmethod
+    def get_path_signature(path):
+        """
+        Returns given path signature using a single *stat* call.
+
+        :param path: Path.
+        :type path: unicode
+        :return: Modification time, size and inode.
+        :rtype: tuple
+        """
+
+        path_stat = os.stat(path)
+        return path_stat.st_mtime, path_stat.st_size, path_stat.st_ino
+
+    @staticmethod
+    def get_entry_signature(path):
+        """
+        Returns given directory entry signature: its kind, content changes don't change it.
+
+        :param path: Entry path.
+        :type path: unicode
+        :return: Is directory, None if the entry doesn't exists.
+        :rtype: bool
+        """
+
+        try:
+            path_stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.S_ISDIR(path_stat.st_mode)
+
+    def get_directory_snapshot(self, directory):
+        """
+        Returns given directory entries snapshot.
+
+        :param directory: Directory.
+        :type directory: unicode
+        :return: Entries names signatures.
+        :rtype: dict
         """
 
-        return float(foundations.common.get_first_item(str(os.path.getmtime(path)).split(".")))
+        snapshot = {}
+        for name in os.listdir(directory):
+            signature = self.get_entry_signature(os.path.join(directory, name))
+            if signature is not None:
+                snapshot[name] = signature
+        return snapshot
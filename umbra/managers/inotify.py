@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**inotify.py**
+
+**Platform:**
+    Linux.
+
+**Description:**
+    Defines the :class:`Inotify` class used by the :class:`umbra.managers.file_system_events_manager.FileSystemEventsManager`
+    class to be notified of file system events instead of polling the registered paths.
+
+**Others:**
+    The Linux *inotify* API is accessed through :mod:`ctypes`, it is reported as unavailable on other platforms.
+"""
+
+from __future__ import unicode_literals
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import platform
+import struct
+import sys
+
+import foundations.exceptions
+import foundations.verbose
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER",
+           "IN_MODIFY",
+           "IN_ATTRIB",
+           "IN_CLOSE_WRITE",
+           "IN_MOVED_FROM",
+           "IN_MOVED_TO",
+           "IN_CREATE",
+           "IN_DELETE",
+           "IN_DELETE_SELF",
+           "IN_MOVE_SELF",
+           "IN_Q_OVERFLOW",
+           "IN_IGNORED",
+           "IN_NONBLOCK",
+           "IN_CLOEXEC",
+           "EVENT_HEADER",
+           "get_library",
+           "is_inotify_available",
+           "Inotify"]
+
+LOGGER = foundations.verbose.install_logger()
+
+# Events flags, see *inotify(7)*.
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+
+# *inotify_init1* flags.
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+EVENT_HEADER = struct.Struct(str("iIII"))
+"""
+:param EVENT_HEADER: *inotify_event* structure header: watch descriptor, mask, cookie and name length.
+:type EVENT_HEADER: Struct
+"""
+
+_LIBRARY = []
+
+
+def get_library():
+    """
+    Returns the C library exposing the *inotify* API.
+
+    :return: C library.
+    :rtype: CDLL
+    """
+
+    if _LIBRARY:
+        return _LIBRARY[0]
+
+    library = None
+    if platform.system() == "Linux":
+        try:
+            library = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            library.inotify_init1.argtypes = [ctypes.c_int]
+            library.inotify_init1.restype = ctypes.c_int
+            library.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            library.inotify_add_watch.restype = ctypes.c_int
+            library.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+            library.inotify_rm_watch.restype = ctypes.c_int
+        except (OSError, AttributeError) as error:
+            LOGGER.debug("> 'inotify' API is not available: '{0}'.".format(error))
+            library = None
+    _LIBRARY.append(library)
+    return library
+
+
+def is_inotify_available():
+    """
+    Returns if the *inotify* API is available.
+
+    :return: Is *inotify* available.
+    :rtype: bool
+    """
+
+    return get_library() is not None
+
+
+class Inotify(object):
+    """
+    Defines an *inotify* instance: watches are added for paths and the events are read from its file descriptor
+    once it is readable.
+    """
+
+    def __init__(self):
+        """
+        Initializes the class.
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        # --- Setting class attributes. ---
+        self.__library = get_library()
+        if self.__library is None:
+            raise OSError(errno.ENOSYS, "'inotify' API is not available!")
+
+        self.__file_descriptor = self.__library.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.__file_descriptor == -1:
+            self.__raise_error()
+
+        self.__encoding = sys.getfilesystemencoding() or "utf-8"
+        self.__buffer_size = 64 * 1024
+
+    @property
+    def file_descriptor(self):
+        """
+        Property for **self.__file_descriptor** attribute.
+
+        :return: self.__file_descriptor.
+        :rtype: int
+        """
+
+        return self.__file_descriptor
+
+    @file_descriptor.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def file_descriptor(self, value):
+        """
+        Setter for **self.__file_descriptor** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "file_descriptor"))
+
+    @file_descriptor.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def file_descriptor(self):
+        """
+        Deleter for **self.__file_descriptor** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "file_descriptor"))
+
+    def __raise_error(self, path=None):
+        """
+        Raises an :class:`OSError` exception from the C library *errno*.
+
+        :param path: Path the error relates to.
+        :type path: unicode
+        """
+
+        code = ctypes.get_errno()
+        if path is None:
+            raise OSError(code, os.strerror(code))
+        raise OSError(code, os.strerror(code), path)
+
+    def add_watch(self, path, mask):
+        """
+        Adds a watch for given path with given events mask.
+
+        :param path: Path.
+        :type path: unicode
+        :param mask: Events mask.
+        :type mask: int
+        :return: Watch descriptor.
+        :rtype: int
+        """
+
+        descriptor = self.__library.inotify_add_watch(self.__file_descriptor,
+                                                      path.encode(self.__encoding) if type(path) is unicode else path,
+                                                      mask)
+        if descriptor == -1:
+            self.__raise_error(path)
+        return descriptor
+
+    def remove_watch(self, descriptor):
+        """
+        Removes given watch descriptor.
+
+        :param descriptor: Watch descriptor.
+        :type descriptor: int
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if self.__library.inotify_rm_watch(self.__file_descriptor, descriptor) == -1:
+            self.__raise_error()
+        return True
+
+    def read_events(self):
+        """
+        Reads the pending events.
+
+        :return: Events as (watch descriptor, mask, cookie, name) tuples.
+        :rtype: list
+        """
+
+        events = []
+        while True:
+            try:
+                data = os.read(self.__file_descriptor, self.__buffer_size)
+            except OSError as error:
+                if error.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break
+                if error.errno == errno.EINTR:
+                    continue
+                raise
+
+            if not data:
+                break
+
+            offset = 0
+            while offset + EVENT_HEADER.size <= len(data):
+                descriptor, mask, cookie, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0").decode(self.__encoding, "replace")
+                offset += length
+                events.append((descriptor, mask, cookie, name))
+        return events
+
+    def close(self):
+        """
+        Closes the *inotify* instance.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if self.__file_descriptor == -1:
+            return False
+
+        os.close(self.__file_descriptor)
+        self.__file_descriptor = -1
+        return True
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_caches.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`umbra.components.factory.script_editor.caches` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import sys
+import tempfile
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+import foundations.data_structures
+import foundations.strings
+from umbra.components.factory.script_editor.caches import FilesCache
+from umbra.components.factory.script_editor.caches import SearchResultsCache
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["TestFilesCache", "TestSearchResultsCache"]
+
+
+class TestFilesCache(unittest.TestCase):
+    """
+    Defines :class:`umbra.components.factory.script_editor.caches.FilesCache` class units tests methods.
+    """
+
+    def test_add_content(self):
+        """
+        Tests :meth:`umbra.components.factory.script_editor.caches.FilesCache.add_content` method.
+        """
+
+        content = "x" * 1024
+        files_cache = FilesCache(maximum_size=FilesCache.get_size(content) * 2)
+        files_cache.add_content(a=content, b=content)
+        self.assertEqual(files_cache.get_content("a"), content)
+        files_cache.add_content(c=content)
+        self.assertIsNone(files_cache.get_content("b"))
+        self.assertEqual(files_cache.get_content("a"), content)
+        self.assertEqual(files_cache.get_metrics()["Evictions"], 1)
+
+
+class TestSearchResultsCache(unittest.TestCase):
+    """
+    Defines :class:`umbra.components.factory.script_editor.caches.SearchResultsCache` class units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initializes the tests directory.
+        """
+
+        self.__directory = foundations.strings.to_string(tempfile.mkdtemp())
+        self.__file = os.path.join(self.__directory, "file.txt")
+        with open(self.__file, "w") as file:
+            file.write("content\n")
+
+        self.__location = foundations.data_structures.Structure(directories=[self.__directory],
+                                                                files=[],
+                                                                filters_in=[],
+                                                                filters_out=[],
+                                                                targets=[])
+        self.__search_results = [foundations.data_structures.Structure(file=self.__file)]
+
+    def tearDown(self):
+        """
+        Removes the tests directory.
+        """
+
+        shutil.rmtree(self.__directory)
+
+    def test_get_search_results(self):
+        """
+        Tests :meth:`umbra.components.factory.script_editor.caches.SearchResultsCache.get_search_results` method.
+        """
+
+        search_results_cache = SearchResultsCache()
+        search_results_cache.add_search_results("key", self.__location, self.__search_results)
+        self.assertIsNone(search_results_cache.get_search_results("other_key"))
+        self.assertSetEqual(search_results_cache.get_search_results("key").changed_files, set())
+
+        with open(self.__file, "a") as file:
+            file.write("changed content\n")
+        self.assertSetEqual(search_results_cache.get_search_results("key").changed_files,
+                            set((foundations.strings.to_forward_slashes(self.__file),)))
+
+    def test_directory_changed(self):
+        """
+        Tests :meth:`umbra.components.factory.script_editor.caches.SearchResultsCache.directory_changed` method.
+        """
+
+        search_results_cache = SearchResultsCache()
+        search_results_cache.add_search_results("key", self.__location, self.__search_results)
+        search_results_cache.directory_changed(os.path.join(self.__directory, "sub"))
+        self.assertIsNone(search_results_cache.get_search_results("key"))
+
+
+    def test_path_watcher(self):
+        """
+        Tests :attr:`umbra.components.factory.script_editor.caches.SearchResultsCache.path_watcher` attribute.
+        """
+
+        sub_directory = os.path.join(self.__directory, "sub")
+        watched_paths = set((self.__directory,))
+        search_results_cache = SearchResultsCache(path_watcher=watched_paths.__contains__)
+        self.assertFalse(search_results_cache.add_search_results("key",
+                                                                 self.__location,
+                                                                 self.__search_results,
+                                                                 [self.__directory, sub_directory]))
+        self.assertIsNone(search_results_cache.get_search_results("key"))
+
+        watched_paths.add(sub_directory)
+        self.assertTrue(search_results_cache.add_search_results("key",
+                                                                self.__location,
+                                                                self.__search_results,
+                                                                [self.__directory, sub_directory]))
+        self.assertIsNotNone(search_results_cache.get_search_results("key"))
+
+        watched_paths.remove(sub_directory)
+        self.assertIsNone(search_results_cache.get_search_results("key"))
+        self.assertNotIn("key", search_results_cache.entries)
+
+if __name__ == "__main__":
+    unittest.main()
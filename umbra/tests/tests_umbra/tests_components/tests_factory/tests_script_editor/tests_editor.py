@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_editor.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`umbra.components.factory.script_editor.editor` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import sys
+import tempfile
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+from PyQt4.QtCore import QEventLoop
+from PyQt4.QtCore import QTimer
+from PyQt4.QtGui import QApplication
+
+import foundations.strings
+from umbra.components.factory.script_editor.editor import Editor
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["APPLICATION", "TestEditor"]
+
+APPLICATION = QApplication.instance() or QApplication(sys.argv)
+
+
+class TestEditor(unittest.TestCase):
+    """
+    Defines :class:`umbra.components.factory.script_editor.editor.Editor` class units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initializes the tests directory and editor.
+        """
+
+        self.__directory = foundations.strings.to_string(tempfile.mkdtemp())
+        self.__file = os.path.join(self.__directory, "file.py")
+        with open(self.__file, "w") as file:
+            file.write("content\n")
+
+        self.__editor = Editor(file=self.__file)
+
+    def tearDown(self):
+        """
+        Removes the tests directory.
+        """
+
+        shutil.rmtree(self.__directory)
+
+    def __wait_for_content_updated(self):
+        """
+        Runs an event loop until the editor content has been updated.
+
+        :return: Content applied.
+        :rtype: bool
+        """
+
+        applied = []
+        loop = QEventLoop()
+        self.__editor.content_updated.connect(applied.append)
+        self.__editor.content_updated.connect(loop.quit)
+        QTimer.singleShot(5000, loop.quit)
+        loop.exec_()
+        return bool(applied and applied[0])
+
+    def test_reload_file(self):
+        """
+        Tests :meth:`umbra.components.factory.script_editor.editor.Editor.reload_file` method.
+        """
+
+        self.__editor.set_content(["edited content\n"])
+        self.assertTrue(self.__editor.is_modified())
+
+        self.assertTrue(self.__editor.reload_file(is_modified=False))
+        self.assertEqual(foundations.strings.to_string(self.__editor.toPlainText()), "edited content\n")
+
+        self.assertTrue(self.__editor.reload_file(is_modified=False, force=True))
+        self.assertTrue(self.__wait_for_content_updated())
+        self.assertEqual(foundations.strings.to_string(self.__editor.toPlainText()), "content\n")
+        self.assertFalse(self.__editor.is_modified())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_indexes.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`umbra.components.factory.script_editor.indexes` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import sys
+import tempfile
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+import foundations.strings
+from umbra.components.factory.script_editor.indexes import TrigramIndex
+from umbra.components.factory.script_editor.indexes import get_trigrams
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["FILES", "TestGetTrigrams", "TestTrigramIndex"]
+
+FILES = {"alpha.py": "import os\nprint os.getcwd()\n",
+         "beta.py": "def foo_bar():\n    return 'Hello World!'\n",
+         "package/gamma.py": "FOO_BAR = 'hello umbra'\n",
+         ".hidden/delta.py": "hello hidden\n"}
+
+
+class TestGetTrigrams(unittest.TestCase):
+    """
+    Defines :func:`umbra.components.factory.script_editor.indexes.get_trigrams` definition units tests methods.
+    """
+
+    def test_get_trigrams(self):
+        """
+        Tests :func:`umbra.components.factory.script_editor.indexes.get_trigrams` definition.
+        """
+
+        self.assertEqual(get_trigrams("Umbra"), set(("umb", "mbr", "bra")))
+        self.assertEqual(get_trigrams("ab"), set())
+
+
+class TestTrigramIndex(unittest.TestCase):
+    """
+    Defines :class:`umbra.components.factory.script_editor.indexes.TrigramIndex` class units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initializes the tests fixtures.
+        """
+
+        self.__directory = foundations.strings.to_string(tempfile.mkdtemp())
+        for path, content in FILES.iteritems():
+            self.__write_file(path, content)
+
+        self.__file = os.path.join(foundations.strings.to_string(tempfile.gettempdir()), "{0}.idx".format(os.path.basename(self.__directory)))
+
+    def tearDown(self):
+        """
+        Removes the tests fixtures.
+        """
+
+        shutil.rmtree(self.__directory)
+        for file in (self.__file, "{0}.journal".format(self.__file)):
+            os.path.exists(file) and os.remove(file)
+
+    def __get_path(self, path):
+        """
+        Returns given fixture path as indexed.
+
+        :param path: Fixture relative path.
+        :type path: unicode
+        :return: Path.
+        :rtype: unicode
+        """
+
+        return foundations.strings.to_forward_slashes(os.path.join(self.__directory, path))
+
+    def __write_file(self, path, content):
+        """
+        Writes given fixture file content.
+
+        :param path: Fixture relative path.
+        :type path: unicode
+        :param content: Content.
+        :type content: unicode
+        """
+
+        path = os.path.join(self.__directory, path)
+        not os.path.exists(os.path.dirname(path)) and os.makedirs(os.path.dirname(path))
+        with open(path, "w") as file:
+            file.write(content)
+        # Ensures the stat signature changes even on coarse modification time resolutions.
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 2))
+
+    def __get_index(self):
+        """
+        Returns a fixtures directory index ignoring hidden files.
+
+        :return: Index.
+        :rtype: TrigramIndex
+        """
+
+        return TrigramIndex(self.__directory, self.__file, ("\\\.|/\.",))
+
+    def test_update(self):
+        """
+        Tests :meth:`umbra.components.factory.script_editor.indexes.TrigramIndex.update` method.
+        """
+
+        index = self.__get_index()
+        self.assertFalse(index.built)
+        self.assertTrue(index.update())
+        self.assertTrue(index.built)
+        self.assertEqual(index.list_files(), sorted(self.__get_path(path) for path in FILES if not "hidden" in path))
+        self.assertTrue(index.update(interrupt=lambda: False))
+        self.assertFalse(self.__get_index().update(interrupt=lambda: True))
+
+    def test_get_candidates(self):
+        """
+        Tests :meth:`umbra.components.factory.script_editor.indexes.TrigramIndex.get_candidates` method.
+        """
+
+        index = self.__get_index()
+        self.assertIsNone(index.get_candidates("hello", {}))
+
+        index.update()
+        self.assertEqual(index.get_candidates("HELLO", {}),
+                         [self.__get_path("beta.py"), self.__get_path("package/gamma.py")])
+        self.assertEqual(index.get_candidates("foo_bar", {}),
+                         [self.__get_path("beta.py"), self.__get_path("package/gamma.py")])
+        self.assertEqual(index.get_candidates("getcwd", {}), [self.__get_path("alpha.py")])
+        self.assertEqual(index.get_candidates("missing", {}), [])
+        self.assertIsNone(index.get_candidates("he", {}))
+        self.assertIsNone(index.get_candidates("hel+o", {"regular_expressions": True}))
+
+        # Every file actually containing the pattern must be a candidate.
+        for pattern in ("os", "import", "world", "umbra", "bar"):
+            candidates = index.get_candidates(pattern, {}) or []
+            for file in index.list_files():
+                with open(file) as handle:
+                    if len(pattern) >= 3 and pattern in handle.read().lower():
+                        self.assertIn(file, candidates)
+
+    def test_update_path(self):
+        """
+        Tests :meth:`umbra.components.factory.script_editor.indexes.TrigramIndex.update_path` method.
+        """
+
+        index = self.__get_index()
+        index.update()
+
+        self.__write_file("alpha.py", "hello alpha\n")
+        self.assertFalse(index.is_up_to_date(self.__get_path("alpha.py")))
+        self.assertTrue(index.update_path(os.path.join(self.__directory, "alpha.py")))
+        self.assertTrue(index.is_up_to_date(self.__get_path("alpha.py")))
+        self.assertIn(self.__get_path("alpha.py"), index.get_candidates("hello", {}))
+        self.assertEqual(index.get_candidates("getcwd", {}), [])
+
+        os.remove(os.path.join(self.__directory, "package", "gamma.py"))
+        self.__write_file("package/epsilon.py", "hello epsilon\n")
+        self.assertTrue(index.update_path(os.path.join(self.__directory, "package")))
+        self.assertNotIn(self.__get_path("package/gamma.py"), index.list_files())
+        self.assertIn(self.__get_path("package/epsilon.py"), index.get_candidates("epsilon", {}))
+
+        self.assertFalse(index.update_path(tempfile.gettempdir()))
+
+    def test_is_up_to_date(self):
+        """
+        Tests :meth:`umbra.components.factory.script_editor.indexes.TrigramIndex.is_up_to_date` method.
+        """
+
+        index = self.__get_index()
+        index.update()
+        self.assertTrue(index.is_up_to_date(os.path.join(self.__directory, "beta.py")))
+        self.assertFalse(index.is_up_to_date(os.path.join(self.__directory, ".hidden", "delta.py")))
+
+        self.__write_file("zeta.py", "hello zeta\n")
+        self.assertFalse(index.is_up_to_date(os.path.join(self.__directory, "zeta.py")))
+        self.assertFalse(index.is_up_to_date(os.path.join(self.__directory, "missing.py")))
+
+    def test_persistence(self):
+        """
+        Tests :meth:`umbra.components.factory.script_editor.indexes.TrigramIndex.save` and
+        :meth:`umbra.components.factory.script_editor.indexes.TrigramIndex.load` methods.
+        """
+
+        index = self.__get_index()
+        self.assertFalse(index.load())
+        index.update()
+        self.assertTrue(index.save())
+        self.assertTrue(os.path.exists(self.__file))
+
+        self.__write_file("beta.py", "def foo():\n    pass\n")
+
+        loaded_index = self.__get_index()
+        self.assertTrue(loaded_index.load())
+        self.assertEqual(loaded_index.list_files(), index.list_files())
+        # A loaded index is not trusted until reconciled with the disk.
+        self.assertFalse(loaded_index.built)
+        self.assertIsNone(loaded_index.get_candidates("hello", {}))
+        self.assertFalse(loaded_index.is_up_to_date(self.__get_path("beta.py")))
+
+        loaded_index.update()
+        self.assertTrue(loaded_index.built)
+        self.assertEqual(loaded_index.get_candidates("hello", {}), [self.__get_path("package/gamma.py")])
+
+        self.assertFalse(TrigramIndex(self.__directory, self.__file).load())
+
+        self.assertTrue(loaded_index.remove())
+        self.assertFalse(os.path.exists(self.__file))
+
+    def test_incremental_persistence(self):
+        """
+        Tests :meth:`umbra.components.factory.script_editor.indexes.TrigramIndex.save` method journal.
+        """
+
+        journal_file = "{0}.journal".format(self.__file)
+
+        index = self.__get_index()
+        index.update()
+        self.assertTrue(index.save())
+        self.assertFalse(os.path.exists(journal_file))
+        with open(self.__file, "rb") as file:
+            data = file.read()
+
+        self.__write_file("alpha.py", "hello alpha\n")
+        os.remove(os.path.join(self.__directory, "beta.py"))
+        index.update()
+        self.assertTrue(index.save())
+        self.assertTrue(os.path.exists(journal_file))
+        with open(self.__file, "rb") as file:
+            self.assertEqual(file.read(), data)
+
+        loaded_index = self.__get_index()
+        self.assertTrue(loaded_index.load())
+        self.assertEqual(loaded_index.list_files(), index.list_files())
+        self.assertNotIn(self.__get_path("beta.py"), loaded_index.list_files())
+        loaded_index.update()
+        self.assertEqual(loaded_index.get_candidates("hello", {}),
+                         [self.__get_path("alpha.py"), self.__get_path("package/gamma.py")])
+
+        with open(journal_file, "ab") as file:
+            file.write(b"truncated")
+        truncated_index = self.__get_index()
+        self.assertTrue(truncated_index.load())
+        self.assertEqual(truncated_index.list_files(), index.list_files())
+
+        self.assertTrue(loaded_index.remove())
+        self.assertFalse(os.path.exists(journal_file))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_matchers.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`umbra.components.factory.script_editor.matchers` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import os
+import re
+import sys
+import tempfile
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+from umbra.components.factory.script_editor.matchers import get_bytes_search_expression
+from umbra.components.factory.script_editor.matchers import get_patterns_automaton
+from umbra.components.factory.script_editor.matchers import get_search_expression
+from umbra.components.factory.script_editor.matchers import get_utf16_positions
+from umbra.components.factory.script_editor.matchers import is_backtracking_expression
+from umbra.components.factory.script_editor.matchers import is_refining_pattern
+from umbra.components.factory.script_editor.matchers import search_content
+from umbra.components.factory.script_editor.matchers import search_content_patterns
+from umbra.components.factory.script_editor.matchers import search_file_mapping
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["CONTENT", "TestMatchers"]
+
+CONTENT = "café cafés\nun café—noir, €café_ et caféine\nCAFÉ cafe\n"
+
+
+class TestMatchers(unittest.TestCase):
+    """
+    Defines :mod:`umbra.components.factory.script_editor.matchers` module units tests methods.
+    """
+
+    def __search_mapping(self, content, pattern, settings):
+        """
+        Searches given content written into a temporary file using a memory mapping.
+
+        :param content: Content.
+        :type content: unicode
+        :param pattern: Pattern.
+        :type pattern: unicode
+        :param settings: Search settings.
+        :type settings: dict
+        :return: Matched occurrences.
+        :rtype: list
+        """
+
+        file_descriptor, file = tempfile.mkstemp()
+        try:
+            os.write(file_descriptor, content.encode("utf-8"))
+            os.close(file_descriptor)
+            return search_file_mapping(file,
+                                       get_bytes_search_expression(pattern, settings),
+                                       settings.get("whole_word"))
+        finally:
+            os.remove(file)
+
+    def test_search_content(self):
+        """
+        Tests :func:`umbra.components.factory.script_editor.matchers.search_content` definition.
+        """
+
+        occurrences = search_content(CONTENT, get_search_expression("café", {"whole_word": True}))
+        self.assertListEqual([(line, column) for line, column, length, position, text in occurrences],
+                             [(0, 0), (1, 3), (2, 0)])
+        self.assertEqual(occurrences[1][4], "un café—noir, €café_ et caféine")
+        self.assertEqual(occurrences[1][3], CONTENT.index("café—"))
+
+        occurrences = search_content(CONTENT, get_search_expression("caf.", {"regular_expressions": True,
+                                                                             "case_sensitive": True}))
+        self.assertEqual(len(occurrences), 6)
+
+        self.assertIsNone(search_content(CONTENT, get_search_expression("caf", {}), 0.))
+
+    def test_get_utf16_positions(self):
+        """
+        Tests :func:`umbra.components.factory.script_editor.matchers.get_utf16_positions` definition.
+        """
+
+        content = "a\U0001f600b\U0001f600c\nd"
+        positions = [match.start() for match in re.finditer("[abcd]", content)]
+        self.assertListEqual(get_utf16_positions(content, positions), [0, 3, 6, 8])
+        self.assertListEqual(get_utf16_positions(CONTENT, [0, 5, 10]), [0, 5, 10])
+
+    def test_is_backtracking_expression(self):
+        """
+        Tests :func:`umbra.components.factory.script_editor.matchers.is_backtracking_expression` definition.
+        """
+
+        for pattern in ("café", "caf.*s", "[ab]*c", "(?:ab)*c", "(ab|cd)e", r"def\s+(\w+)\("):
+            self.assertFalse(is_backtracking_expression(re.compile(pattern)))
+
+        for pattern in ("(a+)+b", "(a*)*", "(ab|cd)*e", r"(\w+)\s\1", "(?=(a+)+)x", "x(?:a+|b)+"):
+            self.assertTrue(is_backtracking_expression(re.compile(pattern)))
+
+    def test_search_content_patterns(self):
+        """
+        Tests :func:`umbra.components.factory.script_editor.matchers.search_content_patterns` definition.
+        """
+
+        for settings in ({}, {"case_sensitive": True}, {"whole_word": True}):
+            patterns = ["café", "noir", "et"]
+            occurrences = search_content_patterns(CONTENT,
+                                                  get_patterns_automaton(patterns, settings),
+                                                  len(patterns),
+                                                  settings)
+            for pattern, pattern_occurrences in zip(patterns, occurrences):
+                self.assertListEqual(pattern_occurrences,
+                                     search_content(CONTENT, get_search_expression(pattern, settings)))
+
+    def test_search_file_mapping(self):
+        """
+        Tests :func:`umbra.components.factory.script_editor.matchers.search_file_mapping` definition.
+        """
+
+        self.assertIsNone(get_bytes_search_expression("caf.", {"regular_expressions": True}))
+        self.assertIsNone(get_bytes_search_expression("CAFÉ", {}))
+
+        for pattern in ("café", "caf", "noir", "cafe"):
+            for settings in ({"case_sensitive": True},
+                             {"case_sensitive": True, "whole_word": True},
+                             {"whole_word": True},
+                             {}):
+                if get_bytes_search_expression(pattern, settings) is None:
+                    continue
+
+                self.assertListEqual(self.__search_mapping(CONTENT, pattern, settings),
+                                     search_content(CONTENT, get_search_expression(pattern, settings)))
+
+    def test_is_refining_pattern(self):
+        """
+        Tests :func:`umbra.components.factory.script_editor.matchers.is_refining_pattern` definition.
+        """
+
+        self.assertTrue(is_refining_pattern("cafés", "café", {}))
+        self.assertFalse(is_refining_pattern("caf", "café", {}))
+        self.assertFalse(is_refining_pattern("café.", "café", {"regular_expressions": True}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_walkers.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`umbra.components.factory.script_editor.walkers` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import sys
+import tempfile
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+import foundations.strings
+from umbra.components.factory.script_editor.matchers import get_file_signature
+from umbra.components.factory.script_editor.walkers import Filters
+from umbra.components.factory.script_editor.walkers import files_walker
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["TestFilesWalker"]
+
+
+class TestFilesWalker(unittest.TestCase):
+    """
+    Defines :func:`umbra.components.factory.script_editor.walkers.files_walker` definition units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initializes the tests directory.
+        """
+
+        self.__directory = foundations.strings.to_string(tempfile.mkdtemp())
+        for path in (("a.py",), ("b.txt",), ("sub", "c.py"), (".git", "d.py")):
+            if len(path) > 1 and not os.path.exists(os.path.join(self.__directory, path[0])):
+                os.makedirs(os.path.join(self.__directory, path[0]))
+            with open(os.path.join(self.__directory, *path), "w") as file:
+                file.write("content\n")
+
+    def tearDown(self):
+        """
+        Removes the tests directory.
+        """
+
+        shutil.rmtree(self.__directory)
+
+    def __walk(self, *args, **kwargs):
+        """
+        Returns the tests directory walked files relative paths.
+
+        :return: Files.
+        :rtype: list
+        """
+
+        return sorted(os.path.relpath(file, self.__directory)
+                      for file in files_walker(self.__directory, *args, **kwargs))
+
+    def test_files_walker(self):
+        """
+        Tests :func:`umbra.components.factory.script_editor.walkers.files_walker` definition.
+        """
+
+        self.assertListEqual(self.__walk(),
+                             [os.path.join(".git", "d.py"), "a.py", "b.txt", os.path.join("sub", "c.py")])
+        self.assertListEqual(self.__walk(Filters(filters_in=("\.py$",), filters_out=("/\.git/",))),
+                             ["a.py", os.path.join("sub", "c.py")])
+        self.assertListEqual(self.__walk(Filters(excluded_files=(os.path.join(self.__directory, "a.py"),))),
+                             [os.path.join(".git", "d.py"), "b.txt", os.path.join("sub", "c.py")])
+        for file in files_walker(self.__directory):
+            self.assertTrue(os.path.isfile(file))
+
+        walked_directories = set()
+        for file, signature in files_walker(self.__directory, walked_directories=walked_directories, signatures=True):
+            self.assertEqual(signature, get_file_signature(file))
+        self.assertSetEqual(walked_directories, set((self.__directory,
+                                                     os.path.join(self.__directory, ".git"),
+                                                     os.path.join(self.__directory, "sub"))))
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "Symbolic links are not supported!")
+    def test_files_walker_links(self):
+        """
+        Tests :func:`umbra.components.factory.script_editor.walkers.files_walker` definition symbolic links handling.
+        """
+
+        os.symlink(os.path.join(self.__directory, "sub"), os.path.join(self.__directory, "link"))
+        os.symlink(self.__directory, os.path.join(self.__directory, "sub", "cycle"))
+
+        filters = Filters(filters_out=("/\.git/",))
+        self.assertListEqual(self.__walk(filters), ["a.py", "b.txt", os.path.join("sub", "c.py")])
+        self.assertListEqual(sorted(os.path.basename(file) for file in self.__walk(filters, follow_links=True)),
+                             ["a.py", "b.txt", "c.py"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_file_system_events_manager.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`umbra.managers.file_system_events_manager` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import sys
+import tempfile
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+import foundations.strings
+import umbra.managers.inotify
+from umbra.managers.file_system_events_manager import FileSystemEventsManager
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["TestFileSystemEventsManager"]
+
+
+@unittest.skipUnless(umbra.managers.inotify.is_inotify_available(), "'inotify' API is not available!")
+class TestFileSystemEventsManager(unittest.TestCase):
+    """
+    Defines :class:`umbra.managers.file_system_events_manager.FileSystemEventsManager` class
+    *inotify* backend units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initializes the tests directory and manager.
+        """
+
+        self.__directory = foundations.strings.to_string(tempfile.mkdtemp())
+        self.__file = os.path.join(self.__directory, "file.txt")
+        self.__write(self.__file, "content\n")
+
+        self.__manager = FileSystemEventsManager()
+        self.__changed_paths = []
+        self.__manager.paths_changed.connect(self.__changed_paths.extend)
+
+    def tearDown(self):
+        """
+        Closes the manager backend and removes the tests directory.
+        """
+
+        self.__manager.backend is not None and self.__manager.backend.close()
+        shutil.rmtree(self.__directory)
+
+    def __write(self, file, content):
+        """
+        Writes given content to given file.
+
+        :param file: File.
+        :type file: unicode
+        :param content: Content.
+        :type content: unicode
+        """
+
+        with open(file, "w") as file_handle:
+            file_handle.write(content)
+
+    def __process_events(self):
+        """
+        Processes the manager backend pending events and flushes the queued events.
+
+        :return: Changed paths as (path, event) tuples.
+        :rtype: list
+        """
+
+        self.__manager._FileSystemEventsManager__process_backend_events()
+        self.__manager._FileSystemEventsManager__flush_events(force=True)
+        changed_paths, self.__changed_paths[:] = list(self.__changed_paths), []
+        return changed_paths
+
+    def test_watch_reference_counting(self):
+        """
+        Tests :class:`umbra.managers.file_system_events_manager.FileSystemEventsManager` class backend
+        watches reference counting.
+        """
+
+        other_file = os.path.join(self.__directory, "other_file.txt")
+        self.__write(other_file, "content\n")
+
+        self.assertTrue(self.__manager.register_path(self.__file))
+        self.assertTrue(self.__manager.register_path(other_file))
+        self.assertEqual(self.__manager.watched_paths[self.__file][0],
+                         self.__manager.watched_paths[other_file][0])
+        watches = self.__manager._FileSystemEventsManager__watches
+        self.assertEqual(len(watches), 1)
+        self.assertEqual(watches.values()[0][1], 2)
+
+        self.assertTrue(self.__manager.unregister_path(self.__file))
+        self.assertEqual(watches.values()[0][1], 1)
+        self.assertNotIn(self.__file, self.__manager.watched_paths)
+
+        self.__write(other_file, "changed content\n")
+        self.assertListEqual(self.__process_events(), [(other_file, "file_changed")])
+
+        self.assertTrue(self.__manager.unregister_path(other_file))
+        self.assertDictEqual(watches, {})
+        self.assertDictEqual(self.__manager.watched_paths, {})
+
+    def test_events_mapping(self):
+        """
+        Tests :class:`umbra.managers.file_system_events_manager.FileSystemEventsManager` class backend
+        events mapping.
+        """
+
+        self.assertTrue(self.__manager.register_path(self.__file))
+        self.assertTrue(self.__manager.register_path(self.__directory))
+        self.assertListEqual(self.__process_events(), [])
+
+        self.__write(self.__file, "changed content\n")
+        self.assertListEqual(self.__process_events(), [(self.__file, "file_changed")])
+
+        self.__write(os.path.join(self.__directory, "new_file.txt"), "content\n")
+        self.assertListEqual(self.__process_events(), [(self.__directory, "directory_changed")])
+
+        os.remove(self.__file)
+        self.assertListEqual(sorted(self.__process_events()), [(self.__directory, "directory_changed"),
+                                                               (self.__file, "file_invalidated")])
+        self.assertFalse(self.__manager.is_path_registered(self.__file))
+
+    def test_paths_signals(self):
+        """
+        Tests :class:`umbra.managers.file_system_events_manager.FileSystemEventsManager` class per path
+        signals opt-out.
+        """
+
+        changed_files = []
+        self.__manager.file_changed.connect(changed_files.append)
+        self.assertTrue(self.__manager.register_path(self.__file))
+
+        self.__write(self.__file, "changed content\n")
+        self.assertListEqual(self.__process_events(), [(self.__file, "file_changed")])
+        self.assertListEqual(changed_files, [self.__file])
+
+        self.__manager.emit_paths_signals = False
+        self.__write(self.__file, "content\n")
+        self.assertListEqual(self.__process_events(), [(self.__file, "file_changed")])
+        self.assertListEqual(changed_files, [self.__file])
+
+    def test_entries_events(self):
+        """
+        Tests :class:`umbra.managers.file_system_events_manager.FileSystemEventsManager` class directories
+        entries events.
+        """
+
+        entries_events = []
+        for event in ("added", "removed", "modified"):
+            getattr(self.__manager, "entries_{0}".format(event)).connect(
+                lambda directory, paths, event=event: entries_events.append((event, paths)))
+
+        self.assertTrue(self.__manager.register_path(self.__directory))
+        self.__process_events()
+
+        file = os.path.join(self.__directory, "new_file.txt")
+        self.__write(file, "content\n")
+        self.__process_events()
+        self.assertListEqual(entries_events, [("added", [file])])
+
+        self.__write(self.__file, "changed content\n")
+        self.__process_events()
+        self.assertListEqual(entries_events, [("added", [file])])
+
+        os.remove(file)
+        os.mkdir(file)
+        self.__process_events()
+        self.assertListEqual(entries_events[1:], [("modified", [file])])
+
+    def test_ignored_events(self):
+        """
+        Tests :class:`umbra.managers.file_system_events_manager.FileSystemEventsManager` class backend
+        *IN_IGNORED* events handling.
+        """
+
+        directory = os.path.join(self.__directory, "directory")
+        os.mkdir(directory)
+        self.assertTrue(self.__manager.register_path(directory))
+        self.assertIn(directory, self.__manager.watched_paths)
+
+        os.rmdir(directory)
+        self.assertListEqual(self.__process_events(), [(directory, "directory_invalidated")])
+        self.assertFalse(self.__manager.is_path_registered(directory))
+        self.assertDictEqual(self.__manager.watched_paths, {})
+        self.assertDictEqual(self.__manager._FileSystemEventsManager__watches, {})
+
+    def test_overflow_events(self):
+        """
+        Tests :class:`umbra.managers.file_system_events_manager.FileSystemEventsManager` class backend
+        *IN_Q_OVERFLOW* events handling.
+        """
+
+        self.assertTrue(self.__manager.register_path(self.__file))
+        self.__write(self.__file, "changed content\n")
+        self.__manager.backend.read_events = lambda: [(-1, umbra.managers.inotify.IN_Q_OVERFLOW, 0, "")]
+        self.assertListEqual(self.__process_events(), [(self.__file, "file_changed")])
+        self.assertListEqual(self.__process_events(), [])
+
+    def test_close_backend(self):
+        """
+        Tests :class:`umbra.managers.file_system_events_manager.FileSystemEventsManager` class backend closing.
+        """
+
+        backend = self.__manager.backend
+        self.assertTrue(self.__manager.register_path(self.__file))
+        self.__manager._FileSystemEventsManager__close_backend()
+        self.assertIsNone(self.__manager.backend)
+        self.assertEqual(backend.file_descriptor, -1)
+        self.assertDictEqual(self.__manager.watched_paths, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
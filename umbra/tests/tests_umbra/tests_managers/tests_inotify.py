@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_inotify.py**
+
+**Platform:**
+    Linux.
+
+**Description:**
+    Defines units tests for :mod:`umbra.managers.inotify` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import sys
+import tempfile
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+import foundations.strings
+import umbra.managers.inotify
+from umbra.managers.inotify import Inotify
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["TestInotify"]
+
+
+@unittest.skipUnless(umbra.managers.inotify.is_inotify_available(), "'inotify' API is not available!")
+class TestInotify(unittest.TestCase):
+    """
+    Defines :class:`umbra.managers.inotify.Inotify` class units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initializes the tests directory and *inotify* instance.
+        """
+
+        self.__directory = foundations.strings.to_string(tempfile.mkdtemp())
+        self.__inotify = Inotify()
+
+    def tearDown(self):
+        """
+        Closes the *inotify* instance and removes the tests directory.
+        """
+
+        self.__inotify.close()
+        shutil.rmtree(self.__directory)
+
+    def __get_events(self, descriptor):
+        """
+        Returns the pending events of given watch descriptor as (mask, name) tuples.
+
+        :param descriptor: Watch descriptor.
+        :type descriptor: int
+        :return: Events.
+        :rtype: list
+        """
+
+        return [(mask, name) for event_descriptor, mask, cookie, name in self.__inotify.read_events()
+                if event_descriptor == descriptor]
+
+    def test_read_events(self):
+        """
+        Tests :meth:`umbra.managers.inotify.Inotify.read_events` method.
+        """
+
+        self.assertListEqual(self.__inotify.read_events(), [])
+
+        descriptor = self.__inotify.add_watch(self.__directory, umbra.managers.inotify.IN_CREATE |
+                                              umbra.managers.inotify.IN_MODIFY |
+                                              umbra.managers.inotify.IN_DELETE)
+        file = os.path.join(self.__directory, "file.txt")
+        with open(file, "w") as file_handle:
+            file_handle.write("content\n")
+        os.remove(file)
+
+        events = self.__get_events(descriptor)
+        self.assertListEqual([mask & umbra.managers.inotify.IN_CREATE for mask, name in events[:1]],
+                             [umbra.managers.inotify.IN_CREATE])
+        self.assertTrue(any(mask & umbra.managers.inotify.IN_MODIFY for mask, name in events))
+        self.assertTrue(events[-1][0] & umbra.managers.inotify.IN_DELETE)
+        self.assertSetEqual(set(name for mask, name in events), set(("file.txt",)))
+
+    def test_remove_watch(self):
+        """
+        Tests :meth:`umbra.managers.inotify.Inotify.remove_watch` method.
+        """
+
+        descriptor = self.__inotify.add_watch(self.__directory, umbra.managers.inotify.IN_CREATE)
+        self.assertTrue(self.__inotify.remove_watch(descriptor))
+        self.assertListEqual(self.__get_events(descriptor), [(umbra.managers.inotify.IN_IGNORED, "")])
+        self.assertRaises(OSError, self.__inotify.remove_watch, descriptor)
+        self.assertRaises(OSError, self.__inotify.add_watch, os.path.join(self.__directory, "missing"),
+                          umbra.managers.inotify.IN_CREATE)
+
+    def test_close(self):
+        """
+        Tests :meth:`umbra.managers.inotify.Inotify.close` method.
+        """
+
+        self.assertNotEqual(self.__inotify.file_descriptor, -1)
+        self.assertTrue(self.__inotify.close())
+        self.assertEqual(self.__inotify.file_descriptor, -1)
+        self.assertFalse(self.__inotify.close())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,11 +18,13 @@
 
 from __future__ import unicode_literals
 
+import difflib
 import functools
 import re
 from PyQt4.QtCore import QChar
 from PyQt4.QtCore import QRegExp
 from PyQt4.QtCore import QString
+from PyQt4.QtCore import QThread
 from PyQt4.QtCore import Qt
 from PyQt4.QtCore import pyqtSignal
 from PyQt4.QtGui import QPlainTextEdit
@@ -44,7 +46,13 @@ __maintainer__ = "Thomas Mansencal"
 __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
-__all__ = ["LOGGER", "edit_block", "anchor_text_cursor", "center_text_cursor", "Basic_QPlainTextEdit"]
+__all__ = ["LOGGER",
+           "edit_block",
+           "anchor_text_cursor",
+           "center_text_cursor",
+           "get_diff_hunks",
+           "Diff_worker",
+           "Basic_QPlainTextEdit"]
 
 LOGGER = foundations.verbose.install_logger()
 
@@ -162,6 +170,349 @@ def center_text_cursor(object):
     return center_text_cursor_wrapper
 
 
+def get_diff_hunks(old_lines, new_lines, maximum_lines=None):
+    """
+    Returns the hunks turning given old lines into given new lines.
+    The common leading and trailing lines are stripped before the remaining lines are diffed.
+
+    :param old_lines: Old lines.
+    :type old_lines: list
+    :param new_lines: New lines.
+    :type new_lines: list
+    :param maximum_lines: Maximum remaining lines count to diff.
+    :type maximum_lines: int
+    :return: Hunks as (old start, old end, new start, new end) tuples, None if the remaining lines exceed the maximum.
+    :rtype: list
+    """
+
+    start, end = 0, min(len(old_lines), len(new_lines))
+    while start < end and old_lines[start] == new_lines[start]:
+        start += 1
+
+    suffix = 0
+    while suffix < end - start and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+        suffix += 1
+    old_end, new_end = len(old_lines) - suffix, len(new_lines) - suffix
+
+    if maximum_lines is not None and old_end - start + new_end - start > maximum_lines:
+        return
+
+    matcher = difflib.SequenceMatcher(None, old_lines[start:old_end], new_lines[start:new_end])
+    return [(start + i1, start + i2, start + j1, start + j2)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"]
+
+
+class Diff_worker(QThread):
+    """
+    Defines a `QThread <http://doc.qt.nokia.com/qthread.html>`_ subclass used
+    to compute the hunks turning a document snapshot into a new content.
+    """
+
+    def __init__(self, parent, snapshot=None, content=None, revision=None, maximum_lines=None):
+        """
+        Initializes the class.
+
+        :param parent: Object parent.
+        :type parent: QObject
+        :param snapshot: Document text snapshot.
+        :type snapshot: unicode
+        :param content: New content.
+        :type content: list
+        :param revision: Document revision the snapshot was taken at.
+        :type revision: int
+        :param maximum_lines: Maximum lines count to diff once the common lines are stripped.
+        :type maximum_lines: int
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        QThread.__init__(self, parent)
+
+        # --- Setting class attributes. ---
+        self.__container = parent
+
+        self.__snapshot = None
+        self.snapshot = snapshot
+        self.__content = None
+        self.content = content
+        self.__revision = None
+        self.revision = revision
+        self.__maximum_lines = None
+        self.maximum_lines = maximum_lines
+
+        self.__lines = None
+        self.__hunks = None
+
+    @property
+    def container(self):
+        """
+        Property for **self.__container** attribute.
+
+        :return: self.__container.
+        :rtype: QObject
+        """
+
+        return self.__container
+
+    @container.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def container(self, value):
+        """
+        Setter for **self.__container** attribute.
+
+        :param value: Attribute value.
+        :type value: QObject
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "container"))
+
+    @container.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def container(self):
+        """
+        Deleter for **self.__container** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "container"))
+
+    @property
+    def snapshot(self):
+        """
+        Property for **self.__snapshot** attribute.
+
+        :return: self.__snapshot.
+        :rtype: unicode
+        """
+
+        return self.__snapshot
+
+    @snapshot.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def snapshot(self, value):
+        """
+        Setter for **self.__snapshot** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        if value is not None:
+            assert type(value) is unicode, "'{0}' attribute: '{1}' type is not 'unicode'!".format(
+                "snapshot", value)
+        self.__snapshot = value
+
+    @snapshot.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def snapshot(self):
+        """
+        Deleter for **self.__snapshot** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "snapshot"))
+
+    @property
+    def content(self):
+        """
+        Property for **self.__content** attribute.
+
+        :return: self.__content.
+        :rtype: list
+        """
+
+        return self.__content
+
+    @content.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def content(self, value):
+        """
+        Setter for **self.__content** attribute.
+
+        :param value: Attribute value.
+        :type value: list
+        """
+
+        if value is not None:
+            assert type(value) is list, "'{0}' attribute: '{1}' type is not 'list'!".format(
+                "content", value)
+        self.__content = value
+
+    @content.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def content(self):
+        """
+        Deleter for **self.__content** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "content"))
+
+    @property
+    def revision(self):
+        """
+        Property for **self.__revision** attribute.
+
+        :return: self.__revision.
+        :rtype: int
+        """
+
+        return self.__revision
+
+    @revision.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def revision(self, value):
+        """
+        Setter for **self.__revision** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        if value is not None:
+            assert type(value) is int, "'{0}' attribute: '{1}' type is not 'int'!".format(
+                "revision", value)
+        self.__revision = value
+
+    @revision.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def revision(self):
+        """
+        Deleter for **self.__revision** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "revision"))
+
+    @property
+    def maximum_lines(self):
+        """
+        Property for **self.__maximum_lines** attribute.
+
+        :return: self.__maximum_lines.
+        :rtype: int
+        """
+
+        return self.__maximum_lines
+
+    @maximum_lines.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def maximum_lines(self, value):
+        """
+        Setter for **self.__maximum_lines** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        if value is not None:
+            assert type(value) is int, "'{0}' attribute: '{1}' type is not 'int'!".format(
+                "maximum_lines", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format(
+                "maximum_lines", value)
+        self.__maximum_lines = value
+
+    @maximum_lines.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def maximum_lines(self):
+        """
+        Deleter for **self.__maximum_lines** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "maximum_lines"))
+
+    @property
+    def lines(self):
+        """
+        Property for **self.__lines** attribute.
+
+        :return: self.__lines.
+        :rtype: list
+        """
+
+        return self.__lines
+
+    @lines.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def lines(self, value):
+        """
+        Setter for **self.__lines** attribute.
+
+        :param value: Attribute value.
+        :type value: list
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "lines"))
+
+    @lines.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def lines(self):
+        """
+        Deleter for **self.__lines** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "lines"))
+
+    @property
+    def hunks(self):
+        """
+        Property for **self.__hunks** attribute.
+
+        :return: self.__hunks.
+        :rtype: list
+        """
+
+        return self.__hunks
+
+    @hunks.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def hunks(self, value):
+        """
+        Setter for **self.__hunks** attribute.
+
+        :param value: Attribute value.
+        :type value: list
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "hunks"))
+
+    @hunks.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def hunks(self):
+        """
+        Deleter for **self.__hunks** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "hunks"))
+
+    def __get_lines(self, text):
+        """
+        Returns given text lines, line endings are normalized and kept.
+
+        :param text: Text.
+        :type text: unicode
+        :return: Lines.
+        :rtype: list
+        """
+
+        lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        return ["{0}\n".format(line) for line in lines[:-1]] + lines[-1:]
+
+    def run(self):
+        """
+        Reimplements the :meth:`QThread.run` method.
+        """
+
+        self.__lines = self.__get_lines("".join(self.__content))
+        self.__hunks = get_diff_hunks(self.__get_lines(self.__snapshot), self.__lines, self.__maximum_lines)
+
+
 class Basic_QPlainTextEdit(QPlainTextEdit):
     """
     Defines a `QPlainTextEdit <http://doc.qt.nokia.com/qplaintextedit.html>`_ subclass providing
@@ -178,6 +529,15 @@ class Basic_QPlainTextEdit(QPlainTextEdit):
     :rtype: list
     """
 
+    content_updated = pyqtSignal(bool)
+    """
+    This signal is emited by the :class:`Basic_QPlainTextEdit` class
+    when a content given to :meth:`Basic_QPlainTextEdit.update_content` has been processed.
+
+    :return: Content applied, False if it was dropped because the document changed meanwhile.
+    :rtype: bool
+    """
+
     def __init__(self, parent=None, *args, **kwargs):
         """
         Initializes the class.
@@ -201,6 +561,9 @@ class Basic_QPlainTextEdit(QPlainTextEdit):
 
         self.__text_cursor_anchor = None
 
+        self.__maximum_diff_lines = 20000
+        self.__diff_worker = None
+
     @property
     def search_pattern(self):
         """
@@ -314,6 +677,44 @@ class Basic_QPlainTextEdit(QPlainTextEdit):
         raise foundations.exceptions.ProgrammingError(
             "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "maximum_font_point_size"))
 
+    @property
+    def maximum_diff_lines(self):
+        """
+        Property for **self.__maximum_diff_lines** attribute.
+
+        :return: self.__maximum_diff_lines.
+        :rtype: int
+        """
+
+        return self.__maximum_diff_lines
+
+    @maximum_diff_lines.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def maximum_diff_lines(self, value):
+        """
+        Setter for **self.__maximum_diff_lines** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        if value is not None:
+            assert type(value) is int, "'{0}' attribute: '{1}' type is not 'int'!".format(
+                "maximum_diff_lines", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format(
+                "maximum_diff_lines", value)
+        self.__maximum_diff_lines = value
+
+    @maximum_diff_lines.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def maximum_diff_lines(self):
+        """
+        Deleter for **self.__maximum_diff_lines** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "maximum_diff_lines"))
+
     @foundations.trace.untracable
     def wheelEvent(self, event):
         """
@@ -582,6 +983,83 @@ class Basic_QPlainTextEdit(QPlainTextEdit):
             self.insertPlainText(line)
         return True
 
+    def __diff_worker__finished(self):
+        """
+        Defines the slot triggered by the diff worker when it has finished.
+        """
+
+        worker, self.__diff_worker = self.__diff_worker, None
+        if worker.revision != self.document().revision():
+            LOGGER.debug("> Document changed while its update hunks were computed, dropping them!")
+            self.content_updated.emit(False)
+            return
+
+        if worker.hunks is None:
+            LOGGER.debug("> Document update exceeds '{0}' lines, setting its content!".format(
+                self.__maximum_diff_lines))
+            self.set_content(worker.content)
+        else:
+            self.__apply_hunks(worker.lines, worker.hunks)
+        self.content_updated.emit(True)
+
+    @edit_block
+    def __apply_hunks(self, lines, hunks):
+        """
+        Applies given hunks to the document.
+
+        :param lines: New content lines.
+        :type lines: list
+        :param hunks: Hunks as (old start, old end, new start, new end) tuples.
+        :type hunks: list
+        :return: Method success.
+        :rtype: bool
+        """
+
+        document = self.document()
+        blocks_count = document.blockCount()
+        end_position = document.characterCount() - 1
+
+        def get_position(index):
+            return document.findBlockByNumber(index).position() if index < blocks_count else end_position
+
+        self.store_text_cursor_anchor()
+
+        cursor = QTextCursor(document)
+        # Hunks are applied from the end so that the preceding blocks positions stay valid.
+        for i1, i2, j1, j2 in reversed(hunks):
+            cursor.setPosition(get_position(i1), QTextCursor.MoveAnchor)
+            cursor.setPosition(get_position(i2), QTextCursor.KeepAnchor)
+            cursor.insertText("".join(lines[j1:j2]))
+
+        self.restore_text_cursor_anchor()
+        LOGGER.debug("> Document updated with '{0}' hunk(s).".format(len(hunks)))
+        return True
+
+    def update_content(self, content):
+        """
+        Updates document with given content by only replacing the lines that differ while providing undo capability.
+        The hunks are computed in a worker thread and applied once it has finished, the
+        :attr:`Basic_QPlainTextEdit.content_updated` signal is emitted then.
+
+        :param content: Content to set.
+        :type content: list
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if self.__diff_worker is not None:
+            self.__diff_worker.finished.disconnect(self.__diff_worker__finished)
+
+        self.__diff_worker = Diff_worker(self,
+                                         foundations.strings.to_string(self.toPlainText()),
+                                         list(content),
+                                         self.document().revision(),
+                                         self.__maximum_diff_lines)
+        self.__diff_worker.finished.connect(self.__diff_worker__finished)
+        self.__diff_worker.finished.connect(self.__diff_worker.deleteLater)
+        self.__diff_worker.start()
+        return True
+
     def delete(self):
         """
         Deletes the document text under cursor.